@@ -23,6 +23,11 @@ class Settings(BaseSettings):
     
     # KASI API
     kasi_api_key: str = ""
+    kasi_timeout_seconds: float = 3.0
+    kasi_connect_timeout_seconds: float = 2.0
+    kasi_max_connections: int = 20
+    kasi_max_keepalive_connections: int = 10
+    kasi_cache_path: str = ""  # 영구 캐시 (비어 있으면 backend/data/kasi_cache.sqlite3, 배포 유지하려면 볼륨 경로)
     
     # Server
     host: str = "0.0.0.0"
@@ -70,6 +75,18 @@ class Settings(BaseSettings):
     
     # RuleCard 설정
     report_rulecard_top_limit: int = 100
+    # 룰카드 점수 계산: "index" (역색인, 기본) | "matrix" (CSR 행렬, NumPy)
+    rulecard_scoring_backend: str = "index"
+    # 섹션 분배 MMR 감점 (이미 고른 카드와 태그/topic 이 겹칠 때, 점수 단위, 0 = 점수순)
+    rulecard_mmr_penalty: float = 2.0
+    # 룰카드 JSONL 변경 감시 주기(초) → 바뀌면 백그라운드 리로드 후 교체 (0 = 끔)
+    rulecards_watch_interval: float = 0.0
+    # 룰카드 저장소: "memory" (JSONL 전체 메모리) | "sqlite" (본문은 SQLite 에서 top-k 만 조회)
+    rulecards_backend: str = "memory"
+    rulecards_sqlite_path: str = "data/sajuos_master.db"  # tools/build_sajuos_sqlite.py 결과
+    # 룰카드 선택 결과 캐시 (기둥 + target_year + preset + 스토어 버전 키)
+    rulecard_selection_cache_size: int = 20000
+    rulecard_selection_cache_path: str = ""  # SQLite 영구 저장 (비어 있으면 메모리만)
     
     # 전체 타임아웃
     report_total_timeout: int = 600
@@ -86,8 +103,16 @@ class Settings(BaseSettings):
     
     # Cache
     cache_ttl_seconds: int = 86400
+    cache_fallback_ttl_seconds: int = 600  # KASI 실패 → 로컬 계산 결과 (KASI 복구 후 빨리 교체)
     cache_max_size: int = 10000
     
+    # 대량 계산 (/calculate/batch)
+    batch_max_rows: int = 100000
+    
+    # CPU 계산 실행기 (ephem / batch 를 이벤트 루프 밖에서)
+    compute_executor: str = "thread"  # thread | process | inline
+    compute_max_workers: int = 4
+    
     # CORS
     allowed_origins: str = "http://localhost:3000,https://sajuos.com,https://www.sajuos.com"
     
@@ -98,6 +123,9 @@ class Settings(BaseSettings):
     # Debug
     debug_show_refs: bool = False
     
+    # 관리자 엔드포인트 토큰 (X-Admin-Token 헤더, 비어 있으면 관리자 엔드포인트 비활성)
+    admin_token: str = ""
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
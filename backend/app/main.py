@@ -69,20 +69,56 @@ async def startup():
     # RuleCards (실패해도 OK)
     app.state.rulestore = None
     try:
-        from app.services.rulecards_store import RuleCardStore
-        for p in ["/app/data/sajuos_master_db.jsonl", "data/sajuos_master_db.jsonl"]:
+        from app.config import get_settings
+        from app.services.rulestore_manager import rulestore_manager
+        settings = get_settings()
+        candidates = ["/app/data/sajuos_master_db.jsonl", "data/sajuos_master_db.jsonl"]
+        if settings.rulecards_backend == "sqlite":
+            # 본문은 SQLite 에서 top-k 만 조회 (워커 메모리 절감), DB 없으면 JSONL
+            candidates.insert(0, settings.rulecards_sqlite_path)
+        for p in candidates:
             if os.path.exists(p):
-                store = RuleCardStore(p)
-                store.load()
-                app.state.rulestore = store
-                logger.info(f"✅ RuleCards: {len(store.cards)}장")
+                store = rulestore_manager.load(p)
+                # 핫 리로드 시 app.state.rulestore 도 새 버전으로 교체
+                rulestore_manager.subscribe(lambda s: setattr(app.state, "rulestore", s))
+                rulestore_manager.start_watch(settings.rulecards_watch_interval)
+                logger.info(f"✅ RuleCards: {len(store.cards)}장 ({store.loaded_from})")
                 break
     except Exception as e:
         logger.warning(f"⚠️ RuleCards 로드 실패 (계속 진행): {e}")
     
+    # KASI HTTP 클라이언트 (keep-alive pool)
+    try:
+        from app.services.kasi_http import kasi_http
+        await kasi_http.startup()
+    except Exception as e:
+        logger.warning(f"⚠️ KASI 클라이언트 시작 실패 (계속 진행): {e}")
+    
     logger.info("✅ Startup 완료")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    try:
+        from app.services.rulestore_manager import rulestore_manager
+        await rulestore_manager.stop_watch()
+        rulestore_manager.close()
+    except Exception as e:
+        logger.warning(f"⚠️ RuleStore 종료 실패: {e}")
+    
+    try:
+        from app.services.kasi_http import kasi_http
+        await kasi_http.aclose()
+    except Exception as e:
+        logger.warning(f"⚠️ KASI 클라이언트 종료 실패: {e}")
+    
+    try:
+        from app.services.compute_pool import compute_pool
+        compute_pool.shutdown()
+    except Exception as e:
+        logger.warning(f"⚠️ Compute pool 종료 실패: {e}")
+
+
 @app.get("/ready")
 async def ready():
     checks = {
@@ -90,7 +126,12 @@ async def ready():
         "openai": bool(os.getenv("OPENAI_API_KEY")),
         "supabase": bool(os.getenv("SUPABASE_URL")),
     }
-    return {"status": "ready" if all(checks.values()) else "partial", "checks": checks}
+    from app.services.rulestore_manager import store_version
+    return {
+        "status": "ready" if all(checks.values()) else "partial",
+        "checks": checks,
+        "rulecards_version": store_version(app.state.rulestore),
+    }
 
 
 @app.exception_handler(Exception)
@@ -2,7 +2,7 @@
 Pydantic 스키마 정의
 API 요청/응답 모델 - 재설계 버전
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List, Literal, Dict, Any
 from datetime import date
 from enum import Enum
@@ -50,7 +50,7 @@ class CalculateRequest(BaseModel):
 
 
 class Pillar(BaseModel):
-    """사주 기둥 (년/월/일/시주)"""
+    """사주 기둥 (년/월/일/시주) - 60개를 미리 만들어 공유하므로 불변"""
     gan: str = Field(..., description="천간 (갑을병정무기경신임계)")
     ji: str = Field(..., description="지지 (자축인묘진사오미신유술해)")
     ganji: str = Field(..., description="간지 조합 (예: 갑자)")
@@ -62,6 +62,9 @@ class Pillar(BaseModel):
     # 인덱스 (내부 계산용)
     gan_index: Optional[int] = Field(None, description="천간 인덱스 (0-9)")
     ji_index: Optional[int] = Field(None, description="지지 인덱스 (0-11)")
+    
+    class Config:
+        frozen = True
 
 
 class SajuWonGuk(BaseModel):
@@ -72,11 +75,24 @@ class SajuWonGuk(BaseModel):
     hour_pillar: Optional[Pillar] = Field(None, description="시주 (시간 미입력시 None)")
 
 
+class DaeunPillar(BaseModel):
+    """대운 기둥 (10년 단위)"""
+    order: int = Field(..., description="순서 (1~10)")
+    ganji: str = Field(..., description="간지 (예: 갑자)")
+    gan: str = Field(..., description="천간")
+    ji: str = Field(..., description="지지")
+    start_age: int = Field(..., description="시작 나이")
+    end_age: int = Field(..., description="끝 나이")
+    start_year: int = Field(..., description="시작 연도 (출생연도 + 시작 나이)")
+
+
 class DaeunInfo(BaseModel):
     """대운 정보"""
     start_age: int = Field(..., description="대운 시작 나이")
     direction: Literal["forward", "backward"] = Field(..., description="대운 방향 (순행/역행)")
     current_daeun: Optional[str] = Field(None, description="현재 대운")
+    start_age_months: Optional[int] = Field(None, description="대운수 (개월 단위, 3일=1년)")
+    pillars: List[DaeunPillar] = Field(default_factory=list, description="대운 기둥 10개")
 
 
 class QualityInfo(BaseModel):
@@ -115,6 +131,34 @@ class CalculateResponse(BaseModel):
     calculation_method: str = Field("solar_term_based", description="계산 방식 (레거시)")
 
 
+class BatchCalculateRequest(BaseModel):
+    """대량 사주 계산 요청 (컬럼형 배열, 같은 길이)"""
+    birth_year: List[int] = Field(..., description="출생 년도 배열 (양력)")
+    birth_month: List[int] = Field(..., description="출생 월 배열")
+    birth_day: List[int] = Field(..., description="출생 일 배열")
+    birth_hour: Optional[List[Optional[int]]] = Field(None, description="출생 시 배열 (null = 시간 모름)")
+    birth_minute: Optional[List[int]] = Field(None, description="출생 분 배열")
+    
+    @model_validator(mode="after")
+    def check_lengths(self):
+        n = len(self.birth_year)
+        columns = [self.birth_month, self.birth_day, self.birth_hour, self.birth_minute]
+        if any(c is not None and len(c) != n for c in columns):
+            raise ValueError("모든 배열의 길이가 같아야 합니다")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "birth_year": [1978, 1990],
+                "birth_month": [5, 12],
+                "birth_day": [16, 1],
+                "birth_hour": [10, None],
+                "birth_minute": [30, 0]
+            }
+        }
+
+
 class HourOption(BaseModel):
     """시간대 선택 옵션"""
     index: int = Field(..., description="지지 인덱스 (0-11)")
@@ -10,15 +10,20 @@ Source of Truth 우선순위:
 - 태양시 보정 ON/OFF 토글 지원
 """
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, Literal
+import asyncio
+import json
 import logging
 
 from app.models.schemas import (
     CalculateRequest,
     CalculateResponse,
+    BatchCalculateRequest,
     ErrorResponse,
     HourOption
 )
+from app.config import get_settings
 from app.services.engine_v2 import CalculationError, EPHEM_AVAILABLE, SajuManager
 from app.services.saju_engine import saju_engine
 from app.services.cache import cache_service
@@ -88,8 +93,7 @@ async def calculate_saju(
     gender = request.gender.value if request.gender else None
     timezone = request.timezone
     
-    # 사주 계산 (KASI 우선 → ephem Fallback)
-    try:
+    async def compute() -> dict:
         # 비동기 계산 (KASI API → ephem fallback)
         result = await saju_engine.calculate_async(
             year=year,
@@ -123,7 +127,9 @@ async def calculate_saju(
                     f"출생시간에 따라 월주가 달라질 수 있습니다."
                 )
         
-        response_data = {
+        logger.info(f"Saju calculated: {year}-{month}-{day} | Source: {result.quality.calculation_method}")
+        
+        return {
             "success": True,
             "birth_info": birth_info,
             "saju": result.saju.model_dump(),
@@ -137,8 +143,20 @@ async def calculate_saju(
             "boundary_warning": boundary_warning,
             "calculation_method": result.quality.calculation_method
         }
-        
-        logger.info(f"Saju calculated: {year}-{month}-{day} | Source: {result.quality.calculation_method}")
+    
+    # 사주 계산 (캐시 → KASI 우선 → ephem Fallback)
+    try:
+        response_data = await cache_service.get_or_compute_saju(
+            compute,
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            use_solar_time=use_solar_time,
+            gender=gender,
+            timezone=timezone
+        )
         
         return CalculateResponse(**response_data)
         
@@ -164,6 +182,157 @@ async def calculate_saju(
         )
 
 
+@router.post(
+    "/calculate/batch",
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="대량 사주 계산 (만세력 테이블 + NumPy)",
+    description="""
+생년월일 배열을 한 번에 계산합니다 (파트너 업로드용).
+
+- 입력: 같은 길이의 `birth_year/birth_month/birth_day/birth_hour/birth_minute` 배열
+- `format=columnar`: 컬럼형 JSON (기본)
+- `format=ndjson`: 한 줄에 한 건씩 스트리밍
+- KASI 조회 없이 만세력 테이블로 계산 (`calculation_method=calendar_table`)
+    """
+)
+async def calculate_saju_batch(
+    request: BatchCalculateRequest,
+    use_solar_time: bool = Query(True, description="태양시 보정 ON/OFF"),
+    format: Literal["columnar", "ndjson"] = Query("columnar", description="응답 형식")
+):
+    """대량 사주 계산 API"""
+    if saju_engine is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error_code": "ENGINE_NOT_READY",
+                "message": "사주 엔진이 초기화되지 않았습니다."
+            }
+        )
+    
+    max_rows = get_settings().batch_max_rows
+    if len(request.birth_year) > max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "error_code": "BATCH_TOO_LARGE",
+                "message": f"한 번에 최대 {max_rows}건까지 계산할 수 있습니다.",
+                "detail": f"요청 {len(request.birth_year)}건"
+            }
+        )
+    
+    try:
+        columns = await saju_engine.calculate_batch_async(
+            years=request.birth_year,
+            months=request.birth_month,
+            days=request.birth_day,
+            hours=request.birth_hour,
+            minutes=request.birth_minute,
+            use_solar_time=use_solar_time
+        )
+    except CalculationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error_code": "CALCULATION_ERROR",
+                "message": "대량 사주 계산에 실패했습니다.",
+                "detail": str(e)
+            }
+        )
+    
+    logger.info(f"Batch calculated: {columns['count']} rows")
+    
+    if format == "columnar":
+        return {"success": True, **columns}
+    
+    row_keys = [k for k in columns if k not in ("count", "meta")]
+    
+    def iter_ndjson():
+        for i in range(columns["count"]):
+            row = {k: columns[k][i] for k in row_keys}
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(iter_ndjson(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/calculate/hour-variants",
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="시간 모름 - 12시진 후보 일괄 계산",
+    description="""
+출생 시간을 모를 때 12시진 후보를 한 번에 계산합니다.
+
+- 년/월/일주는 1회 계산, 시주 12개는 일간에서 도출
+- 후보마다 시주 반영 FeatureTags 차이(`feature_tags_delta.added/removed`)
+- 당일 절입이 있으면 `month_varies=true` 와 시진별 년/월주 포함
+- `birth_hour`/`birth_minute` 는 무시
+    """
+)
+async def calculate_hour_variants(
+    request: CalculateRequest,
+    use_solar_time: bool = Query(True, description="태양시 보정 ON/OFF"),
+    target_year: int = Query(2026, ge=1900, le=2100, description="FeatureTags 오버레이 연도")
+):
+    """12시진 후보 계산 API"""
+    if saju_engine is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error_code": "ENGINE_NOT_READY",
+                "message": "사주 엔진이 초기화되지 않았습니다."
+            }
+        )
+    
+    year = request.birth_year
+    month = request.birth_month
+    day = request.birth_day
+    
+    try:
+        result = await saju_engine.calculate_hour_variants(
+            year=year,
+            month=month,
+            day=day,
+            gender=request.gender.value if request.gender else None,
+            timezone=request.timezone,
+            use_solar_time=use_solar_time,
+            target_year=target_year
+        )
+    except (CalculationError, ValueError) as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error_code": "CALCULATION_ERROR",
+                "message": "시진 후보 계산에 실패했습니다.",
+                "detail": str(e)
+            }
+        )
+    
+    base = result["base"]
+    logger.info(f"Hour variants calculated: {year}-{month}-{day} | Source: {base.quality.calculation_method}")
+    
+    return {
+        "success": True,
+        "birth_info": f"{year}년 {month}월 {day}일 (시간 모름)",
+        "saju": base.saju.model_dump(),
+        "day_master": base.day_master,
+        "day_master_element": base.day_master_element,
+        "day_master_description": base.day_master_description,
+        "daeun": base.daeun.model_dump() if base.daeun else None,
+        "quality": base.quality.model_dump(),
+        "base_feature_tags": result["base_feature_tags"],
+        "month_varies": result["month_varies"],
+        "variants": result["variants"],
+    }
+
+
 @router.get(
     "/calculate/hour-options",
     response_model=List[HourOption],
@@ -173,18 +342,8 @@ async def calculate_saju(
 async def get_hour_options():
     """시간대 선택 옵션 목록"""
     if saju_engine is None:
-        from app.services.engine_v2 import HOUR_OPTIONS
-        return [
-            {
-                "index": h["index"],
-                "ji": h["ji"],
-                "ji_hanja": h["ji_hanja"],
-                "range_start": h["start"],
-                "range_end": h["end"],
-                "label": f"{h['ji_hanja']}시 ({h['ji']}시) - {h['start']}~{h['end']}"
-            }
-            for h in HOUR_OPTIONS
-        ]
+        from app.services.engine_v2 import HOUR_OPTION_ITEMS
+        return list(HOUR_OPTION_ITEMS)
     return saju_engine.get_hour_options()
 
 
@@ -224,18 +383,18 @@ async def compare_solar_time(
     if saju_engine is None:
         raise HTTPException(status_code=503, detail="Engine not ready")
     
-    # 태양시 보정 ON
-    result_on = await saju_engine.calculate_async(
-        year=year, month=month, day=day,
-        hour=hour, minute=minute,
-        use_solar_time=True
-    )
-    
-    # 태양시 보정 OFF
-    result_off = await saju_engine.calculate_async(
-        year=year, month=month, day=day,
-        hour=hour, minute=minute,
-        use_solar_time=False
+    # 태양시 보정 ON / OFF 동시 계산 (KASI 조회는 singleflight 로 1회)
+    result_on, result_off = await asyncio.gather(
+        saju_engine.calculate_async(
+            year=year, month=month, day=day,
+            hour=hour, minute=minute,
+            use_solar_time=True
+        ),
+        saju_engine.calculate_async(
+            year=year, month=month, day=day,
+            hour=hour, minute=minute,
+            use_solar_time=False
+        )
     )
     
     return {
@@ -268,10 +427,28 @@ async def compare_solar_time(
     }
 
 
+@router.get(
+    "/calculate/compute-stats",
+    summary="계산 실행기 통계"
+)
+async def get_compute_stats():
+    """CPU 계산 풀 대기열/지연 지표"""
+    from app.services.compute_pool import compute_pool
+    return compute_pool.get_stats()
+
+
 @router.get(
     "/calculate/cache-stats",
     summary="캐시 통계"
 )
 async def get_cache_stats():
-    """캐시 통계 조회"""
-    return cache_service.get_stats()
+    """캐시 통계 조회 (계산 결과 캐시 + KASI 클라이언트/디스크 캐시 + 대운)"""
+    from app.services.kasi_http import kasi_http
+    from app.services.kasi_disk_cache import kasi_disk_cache
+    from app.services.daeun import get_daeun_cache_info
+    return {
+        **cache_service.get_stats(),
+        "kasi_http": kasi_http.get_stats(),
+        "kasi_disk_cache": kasi_disk_cache.get_stats(),
+        "daeun": get_daeun_cache_info()
+    }
@@ -7,13 +7,15 @@
 4) 🔥 SSE 스트리밍: 실시간 진행 상태 + 재시도 표시
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-from fastapi import APIRouter, HTTPException, Request, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request, Query, BackgroundTasks, Header
 from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional, List
 import logging
 import asyncio
 import json
+import hmac
 
+from app.config import get_settings
 from app.models.schemas import (
     InterpretRequest,
     InterpretResponse,
@@ -26,10 +28,13 @@ from app.services.engine_v2 import SajuManager
 from app.services.job_store import job_store, JobStatus
 
 # RuleCard pipeline
-from app.services.feature_tags_no_time import build_feature_tags_no_time_from_pillars
+from app.services.feature_tag_table import feature_tags_no_time
 from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
 from app.services.focus_boost import boost_preset_focus
 from app.services.rulecard_selector import select_cards_for_preset
+from app.services.rulecard_triggers import chart_trigger_features
+from app.services.rulestore_manager import rulestore_manager, store_version
+from app.services.selection_cache import preset_digest, selection_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -87,20 +92,28 @@ def _get_rulecards_and_feature_tags(
         logger.warning("[RuleCards] 사주 기둥 데이터 부족")
         return [], [], 0
     
-    # FeatureTags 생성
-    ft = build_feature_tags_no_time_from_pillars(year_p, month_p, day_p, overlay_year=target_year)
-    feature_tags = ft.get("tags", [])
-    
-    logger.info(f"[RuleCards] FeatureTags 생성: {len(feature_tags)}개")
-    
-    # Preset 부스트 및 카드 선택
-    boosted = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, feature_tags)
-    selection = select_cards_for_preset(store, boosted, feature_tags)
-    
-    # 모든 카드 수집
-    all_cards = []
-    for sec in selection.get("sections", []):
-        all_cards.extend(sec.get("cards", []))
+    def compute() -> tuple:
+        # FeatureTags 생성
+        feature_tags = feature_tags_no_time(year_p, month_p, day_p, overlay_year=target_year)
+        logger.info(f"[RuleCards] FeatureTags 생성: {len(feature_tags)}개")
+        
+        # Preset 부스트 및 카드 선택 (trigger 하드 조건 매칭 카드 우선)
+        boosted = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, feature_tags)
+        selection = select_cards_for_preset(
+            store, boosted, feature_tags, as_cards=True,
+            trigger_features=chart_trigger_features(month_p, day_p),
+        )
+        cards = [c for sec in selection.get("sections", []) for c in sec.get("cards", [])]
+        return cards, feature_tags
+    
+    # 같은 기둥/연도/preset 내용/스토어 버전이면 캐시된 선택 재사용
+    cards, feature_tags = selection_cache.get_or_compute(
+        "preset",
+        (year_p, month_p, day_p, target_year, preset_digest(BUSINESS_OWNER_PRESET_V2)),
+        store,
+        compute,
+    )
+    all_cards = store.card_dicts(cards)
     
     pool_count = len(all_cards)
     logger.info(f"[RuleCards] ✅ Pool={pool_count}장, FeatureTags={len(feature_tags)}개")
@@ -411,9 +424,39 @@ async def get_rulecards_status(raw: Request):
             "loaded": True,
             "total_cards": len(store.cards),
             "topics": list(store.by_topic.keys())[:20],
-            "topics_count": len(store.by_topic)
+            "topics_count": len(store.by_topic),
+            "version": store_version(store),
+            "loaded_from": getattr(store, "loaded_from", None),
+            "loaded_at": rulestore_manager.loaded_at,
+            "swap_count": rulestore_manager.swap_count,
+            "selection_cache": selection_cache.get_stats(),
         }
-    return {"loaded": False, "total_cards": 0, "topics": [], "topics_count": 0}
+    return {"loaded": False, "total_cards": 0, "topics": [], "topics_count": 0, "version": None}
+
+
+@router.post("/interpret/rulecards-reload", summary="RuleCards Hot Reload (admin)")
+async def reload_rulecards(
+    force: bool = Query(False, description="내용이 같아도 교체"),
+    x_admin_token: Optional[str] = Header(None),
+):
+    """
+    룰카드 핫 리로드 (관리자)
+
+    - 새 스토어를 백그라운드 스레드에서 빌드 후 교체, 진행 중인 요청/잡은 기존 버전 유지
+    - X-Admin-Token 헤더 = settings.admin_token (비어 있으면 비활성)
+    """
+    admin_token = get_settings().admin_token
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="admin endpoint disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=401, detail="invalid admin token")
+    if rulestore_manager.path is None:
+        raise HTTPException(status_code=503, detail="RuleCards not loaded")
+
+    try:
+        return await rulestore_manager.reload(force=force)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"reload failed: {str(e)[:100]}")
 
 
 @router.get("/interpret/premium-sections", summary="Premium Report Sections Info")
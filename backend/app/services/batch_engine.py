@@ -0,0 +1,179 @@
+"""
+대량 사주 계산 (NumPy 벡터 연산)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 파트너 업로드(수만 건) 용: 행 단위 코루틴 대신 배열 연산 1회
+- 만세력 테이블(calendar_table) mmap 을 numpy 로 그대로 인덱싱
+- SajuManager.calculate 의 테이블 경로와 같은 규칙
+  (일중 황경 보간 → 절입 보정, 태양시 -30분, ±1.5° 경계 판정)
+- KASI 조회 없음 (calculation_method = "calendar_table")
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import logging
+from typing import Optional, Dict, Any, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from app.services.calendar_table import get_calendar_table
+from app.services.engine_v2 import CalculationError, GAN, JI, GAN_TO_ELEMENT
+
+logger = logging.getLogger(__name__)
+
+
+# 60갑자 이름 (idx % 10 = 천간, idx % 12 = 지지)
+GANJI_60 = [GAN[i % 10] + JI[i % 12] for i in range(60)]
+
+# 경계 판정 기준 황경 (15° 간격) / 입춘 황경
+BOUNDARY_DEGREES = list(range(0, 360, 15))
+IPCHUN_DEGREE = 315
+BOUNDARY_TOLERANCE = 1.5
+
+
+def calculate_batch_arrays(
+    years: Sequence[int],
+    months: Sequence[int],
+    days: Sequence[int],
+    hours: Optional[Sequence[Optional[int]]] = None,
+    minutes: Optional[Sequence[int]] = None,
+    use_solar_time: bool = True
+) -> Dict[str, Any]:
+    """
+    배열 입력 → 60갑자 인덱스 배열
+
+    Args:
+        years, months, days: 양력 생년월일 (같은 길이)
+        hours: 출생 시 (None/-1 = 시간 모름 → 시주 생략, 12시 기준 계산)
+        minutes: 출생 분 (None 이면 0)
+
+    Returns:
+        numpy 배열 dict: year_idx, month_idx, day_idx, hour_idx(-1=없음),
+        solar_longitude, is_boundary, is_ipchun
+    """
+    if not NUMPY_AVAILABLE:
+        raise CalculationError("numpy 라이브러리 미설치")
+
+    table = get_calendar_table()
+    if table is None:
+        raise CalculationError("만세력 테이블 없음 (tools/build_calendar_table.py 실행 필요)")
+
+    y = np.asarray(years, dtype=np.int64)
+    m = np.asarray(months, dtype=np.int64)
+    d = np.asarray(days, dtype=np.int64)
+    n = len(y)
+
+    if hours is None:
+        h = np.full(n, -1, dtype=np.int64)
+    else:
+        h = np.array([-1 if v is None else v for v in hours], dtype=np.int64)
+    mi = np.zeros(n, dtype=np.int64) if minutes is None else np.asarray(minutes, dtype=np.int64)
+
+    if not (len(m) == len(d) == len(h) == len(mi) == n):
+        raise CalculationError("입력 배열 길이가 서로 다릅니다")
+
+    # 1. 입력 검증 (범위 + 실제 존재하는 날짜)
+    invalid = (
+        (y < table.first_year) | (y > table.last_year)
+        | (m < 1) | (m > 12) | (d < 1) | (d > 31)
+        | (h < -1) | (h > 23) | (mi < 0) | (mi > 59)
+    )
+    if invalid.any():
+        raise CalculationError(f"입력 범위 오류: {int(np.argmax(invalid))}번째 행")
+
+    month_start = ((y - 1970) * 12 + (m - 1)).astype("datetime64[M]")
+    dates = month_start.astype("datetime64[D]") + (d - 1).astype("timedelta64[D]")
+    bad_date = dates.astype("datetime64[M]") != month_start
+    if bad_date.any():
+        raise CalculationError(f"존재하지 않는 날짜: {int(np.argmax(bad_date))}번째 행")
+
+    # 2. 테이블 인덱싱 (당일 00:00 / 다음날 00:00 레코드)
+    records = table.as_numpy()
+    table_start = np.datetime64(f"{table.first_year:04d}-01-01", "D")
+    i = (dates - table_start).astype(np.int64)
+    rec0 = records[i]
+    rec1 = records[i + 1]
+
+    # 3. 일중 황경 보간 (시간 모름 → 12시 기준)
+    has_hour = h >= 0
+    calc_minutes = np.where(has_hour, h, 12) * 60 + mi
+    lon0 = rec0["lon"].astype(np.float64)
+    lon1 = rec1["lon"].astype(np.float64)
+    solar_longitude = (lon0 + ((lon1 - lon0) % 360) * (calc_minutes / 1440)) % 360
+
+    # 4. 절입 보정: 보간 황경의 월지가 00:00 레코드와 다르면 다음날 년/월주 사용
+    year_idx = rec0["year"].astype(np.int64)
+    month_idx = rec0["month"].astype(np.int64)
+    day_idx = rec0["day"].astype(np.int64)
+
+    month_ji = ((((solar_longitude + 45) % 360) / 30).astype(np.int64) + 2) % 12
+    switched = month_ji != month_idx % 12
+    year_idx = np.where(switched, rec1["year"], year_idx)
+    month_idx = np.where(switched, rec1["month"], month_idx)
+
+    # 5. 시주 (태양시 -30분 보정, 일간 기준 시간 천간)
+    adjusted = h * 60 + mi
+    if use_solar_time:
+        adjusted = (adjusted - 30) % 1440
+    hour_ji = (((adjusted // 60) + 1) // 2) % 12
+    hour_gan = ((day_idx % 10) % 5 * 2 + hour_ji) % 10
+    hour_idx = np.where(has_hour, (6 * hour_gan - 5 * hour_ji) % 60, -1)
+
+    # 6. 경계 판정 (반올림 황경 기준, SajuManager 와 동일)
+    rounded = np.round(solar_longitude, 2)
+    diff = np.abs((rounded[:, None] - np.asarray(BOUNDARY_DEGREES) + 180) % 360 - 180)
+    is_boundary = (diff <= BOUNDARY_TOLERANCE).any(axis=1)
+    is_ipchun = np.abs((rounded - IPCHUN_DEGREE + 180) % 360 - 180) <= BOUNDARY_TOLERANCE
+
+    return {
+        "year_idx": year_idx,
+        "month_idx": month_idx,
+        "day_idx": day_idx,
+        "hour_idx": hour_idx,
+        "solar_longitude": rounded,
+        "is_boundary": is_boundary,
+        "is_ipchun": is_ipchun,
+    }
+
+
+def to_columns(arrays: Dict[str, Any], use_solar_time: bool = True) -> Dict[str, Any]:
+    """인덱스 배열 → 컬럼형 JSON (간지 문자열 리스트)"""
+    ganji = np.asarray(GANJI_60 + [None], dtype=object)
+    day_gan = [GAN[i % 10] for i in range(10)]
+
+    reason = np.where(
+        arrays["is_ipchun"], "near_ipchun",
+        np.where(arrays["is_boundary"], "near_term_change", "")
+    )
+
+    return {
+        "count": int(len(arrays["day_idx"])),
+        "year_pillar": ganji[arrays["year_idx"]].tolist(),
+        "month_pillar": ganji[arrays["month_idx"]].tolist(),
+        "day_pillar": ganji[arrays["day_idx"]].tolist(),
+        "hour_pillar": ganji[arrays["hour_idx"]].tolist(),  # -1 → None
+        "day_master": [day_gan[i] for i in (arrays["day_idx"] % 10).tolist()],
+        "day_master_element": [GAN_TO_ELEMENT[day_gan[i]] for i in (arrays["day_idx"] % 10).tolist()],
+        "solar_longitude_deg": arrays["solar_longitude"].tolist(),
+        "is_boundary": arrays["is_boundary"].tolist(),
+        "boundary_reason": [r or None for r in reason.tolist()],
+        "meta": {
+            "solar_time_applied": use_solar_time,
+            "calculation_method": "calendar_table",
+            "timezone": "Asia/Seoul",
+        },
+    }
+
+
+def calculate_batch_columns(
+    years: Sequence[int],
+    months: Sequence[int],
+    days: Sequence[int],
+    hours: Optional[Sequence[Optional[int]]] = None,
+    minutes: Optional[Sequence[int]] = None,
+    use_solar_time: bool = True
+) -> Dict[str, Any]:
+    """calculate_batch_arrays + to_columns (compute_pool 에 넘기는 단위, pickle 가능)"""
+    arrays = calculate_batch_arrays(years, months, days, hours, minutes, use_solar_time=use_solar_time)
+    return to_columns(arrays, use_solar_time=use_solar_time)
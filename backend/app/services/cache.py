@@ -2,15 +2,31 @@
 캐시 서비스
 - 동일 입력에 대한 계산 결과 캐싱
 - 메모리 기반 (Redis 연동은 추후)
+- singleflight: 같은 키 동시 miss 는 계산 1회를 공유
+- 키에 오늘(KST) 연도 포함: daeun.current_daeun 이 올해 기준이라 해가 바뀌면 새로 계산
 """
-from typing import Optional, Any
+from typing import Optional, Any, Awaitable, Callable, Dict
 from cachetools import TTLCache, LRUCache
+import asyncio
 import hashlib
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 from app.config import get_settings
 
+KST = dt_timezone(timedelta(hours=9))
+
+
+def _kst_year() -> int:
+    """오늘 연도 (KST) - 대운 current_daeun 기준 연도"""
+    return datetime.now(KST).year
+
+
+def _is_kasi_result(data: dict) -> bool:
+    """KASI 응답 기반 결과인지 (아니면 만세력 테이블/ephem fallback)"""
+    return str(data.get("calculation_method", "")).startswith("kasi")
+
 
 class CacheService:
     """
@@ -18,6 +34,7 @@ class CacheService:
     
     캐시 전략:
     1. /calculate 결과: TTL 24시간 (날짜별 간지는 고정값)
+       KASI 실패로 로컬 계산한 결과는 짧은 TTL (cache_fallback_ttl_seconds)
     2. KASI API 응답: TTL 7일 (잘 바뀌지 않음)
     3. /interpret 결과: 캐시 안 함 (LLM 응답은 매번 다름)
     """
@@ -31,15 +48,28 @@ class CacheService:
             ttl=settings.cache_ttl_seconds
         )
         
+        # fallback(만세력 테이블/ephem) 결과 캐시 - KASI 복구 후 빨리 교체되도록
+        self.saju_fallback_cache = TTLCache(
+            maxsize=settings.cache_max_size,
+            ttl=settings.cache_fallback_ttl_seconds
+        )
+        
         # KASI API 응답 캐시
         self.kasi_cache = TTLCache(
             maxsize=10000,
             ttl=86400 * 7  # 7일
         )
         
+        # 진행 중인 계산 (singleflight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
         # 통계
         self._hits = 0
         self._misses = 0
+        self._coalesced = 0
+        self._hit_ms_total = 0.0
+        self._miss_ms_total = 0.0
+        self._miss_ms_max = 0.0
     
     def _make_key(self, *args) -> str:
         """캐시 키 생성"""
@@ -48,10 +78,37 @@ class CacheService:
     
     # ========== 사주 계산 캐시 ==========
     
-    def get_saju(self, year: int, month: int, day: int, hour: Optional[int] = None) -> Optional[dict]:
-        """사주 계산 결과 캐시 조회"""
-        key = self._make_key("saju", year, month, day, hour)
+    def _saju_key(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int],
+        minute: int,
+        use_solar_time: bool,
+        gender: Optional[str],
+        timezone: str
+    ) -> str:
+        """결과에 영향을 주는 입력 전부 + 오늘(KST) 연도 (current_daeun) 를 키에 포함"""
+        return self._make_key(
+            "saju", year, month, day, hour, minute, use_solar_time, gender, timezone, _kst_year()
+        )
+    
+    def _lookup_saju(self, key: str) -> Optional[dict]:
         result = self.saju_cache.get(key)
+        if result is None:
+            result = self.saju_fallback_cache.get(key)
+        return result
+    
+    def _store_saju(self, key: str, data: dict):
+        if _is_kasi_result(data):
+            self.saju_cache[key] = data
+        else:
+            self.saju_fallback_cache[key] = data
+    
+    def get_saju(self, *key_args) -> Optional[dict]:
+        """사주 계산 결과 캐시 조회 (인자: _saju_key 와 동일)"""
+        result = self._lookup_saju(self._saju_key(*key_args))
         
         if result:
             self._hits += 1
@@ -60,10 +117,59 @@ class CacheService:
         
         return result
     
-    def set_saju(self, year: int, month: int, day: int, hour: Optional[int], data: dict):
-        """사주 계산 결과 캐시 저장"""
-        key = self._make_key("saju", year, month, day, hour)
-        self.saju_cache[key] = data
+    def set_saju(self, *key_args, data: dict):
+        """사주 계산 결과 캐시 저장 (인자: _saju_key 와 동일)"""
+        self._store_saju(self._saju_key(*key_args), data)
+    
+    async def get_or_compute_saju(
+        self,
+        compute: Callable[[], Awaitable[dict]],
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int],
+        minute: int,
+        use_solar_time: bool,
+        gender: Optional[str],
+        timezone: str
+    ) -> dict:
+        """
+        캐시 조회 → miss 면 compute() 실행 후 저장
+        
+        같은 키로 동시에 들어온 miss 는 첫 요청의 계산 결과를 함께 기다림
+        실패(예외)는 캐시하지 않고 대기 중인 요청 모두에 전달
+        """
+        started = time.perf_counter()
+        key = self._saju_key(year, month, day, hour, minute, use_solar_time, gender, timezone)
+        
+        result = self._lookup_saju(key)
+        if result is not None:
+            self._hits += 1
+            self._hit_ms_total += (time.perf_counter() - started) * 1000
+            return result
+        
+        task = self._inflight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_saju_done(k, t))
+        else:
+            self._coalesced += 1
+        
+        try:
+            return await asyncio.shield(task)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._miss_ms_total += elapsed_ms
+            self._miss_ms_max = max(self._miss_ms_max, elapsed_ms)
+    
+    def _on_saju_done(self, key: str, task: asyncio.Future):
+        self._inflight.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is None:
+            self._store_saju(key, task.result())
     
     # ========== KASI API 캐시 ==========
     
@@ -81,23 +187,37 @@ class CacheService:
     
     def get_stats(self) -> dict:
         """캐시 통계 조회"""
-        total = self._hits + self._misses
+        total = self._hits + self._misses + self._coalesced
         hit_rate = (self._hits / total * 100) if total > 0 else 0
+        waited = self._misses + self._coalesced
         
         return {
             "hits": self._hits,
             "misses": self._misses,
+            "coalesced": self._coalesced,
             "hit_rate": f"{hit_rate:.1f}%",
+            "inflight": len(self._inflight),
+            "latency_ms": {
+                "hit_avg": round(self._hit_ms_total / self._hits, 3) if self._hits else 0,
+                "miss_avg": round(self._miss_ms_total / waited, 3) if waited else 0,
+                "miss_max": round(self._miss_ms_max, 3),
+            },
             "saju_cache_size": len(self.saju_cache),
+            "saju_fallback_cache_size": len(self.saju_fallback_cache),
             "kasi_cache_size": len(self.kasi_cache)
         }
     
     def clear(self):
         """캐시 초기화"""
         self.saju_cache.clear()
+        self.saju_fallback_cache.clear()
         self.kasi_cache.clear()
         self._hits = 0
         self._misses = 0
+        self._coalesced = 0
+        self._hit_ms_total = 0.0
+        self._miss_ms_total = 0.0
+        self._miss_ms_max = 0.0
 
 
 # 싱글톤 인스턴스
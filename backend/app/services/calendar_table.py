@@ -0,0 +1,176 @@
+"""
+만세력 테이블 (1900~2100) - 60갑자 사전 계산
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- tools/build_calendar_table.py 로 오프라인 생성 (ephem 계산은 빌드 때 1회)
+- 일자별 레코드: 00:00 KST 태양 황경 + 년/월/일주 60갑자 인덱스
+- mmap 로드 → 조회는 배열 인덱스 O(1), 요청 경로에서 천문 계산 없음
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import mmap
+import struct
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 파일 포맷 ============
+# 헤더: magic(8) + 시작연도(u16) + 끝연도(u16) + 일수(u32)
+# 레코드: 황경(f32) + 년주 idx(u8) + 월주 idx(u8) + 일주 idx(u8) + pad
+# 보간용으로 마지막 날 다음날(끝연도+1년 1월 1일) 레코드 1개 추가
+
+TABLE_MAGIC = b"SAJUCAL1"
+HEADER = struct.Struct("<8sHHI")
+RECORD = struct.Struct("<fBBBx")
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parents[2] / "data" / "calendar_1900_2100.bin"
+
+# Anchor: 2000년 1월 1일 = 무오일 (60갑자 중 54번째)
+ANCHOR_DATE = date(2000, 1, 1)
+ANCHOR_IDX = 54
+
+
+# ============ 60갑자 공식 (빌드 도구와 공유) ============
+
+def sexagenary_index(gan_idx: int, ji_idx: int) -> int:
+    """천간/지지 인덱스 → 60갑자 인덱스 (idx % 10 = 천간, idx % 12 = 지지)"""
+    return (6 * gan_idx - 5 * ji_idx) % 60
+
+
+def month_ji_from_longitude(solar_longitude: float) -> int:
+    """태양 황경 → 월지 인덱스 (입춘 315° = 인월)"""
+    normalized = (solar_longitude + 45) % 360
+    return (int(normalized / 30) + 2) % 12
+
+
+def pillars_from_longitude(
+    year: int,
+    month: int,
+    day: int,
+    solar_longitude: float
+) -> Tuple[int, int, int]:
+    """
+    양력 날짜 + 태양 황경 → (년주, 월주, 일주) 60갑자 인덱스
+    engine_v2._ephem_calculate_ganji 와 같은 규칙 (입춘 보정 + 연두법)
+    """
+    month_ji_idx = month_ji_from_longitude(solar_longitude)
+
+    cal_year = year
+    if month <= 2 and month_ji_idx <= 1:
+        cal_year = year - 1
+
+    year_gan_idx = (cal_year - 4) % 10
+    year_ji_idx = (cal_year - 4) % 12
+
+    start_gan_idx = (year_gan_idx % 5) * 2 + 2
+    month_gan_idx = (start_gan_idx + (month_ji_idx - 2) % 12) % 10
+
+    day_idx = (ANCHOR_IDX + (date(year, month, day) - ANCHOR_DATE).days) % 60
+
+    return (
+        sexagenary_index(year_gan_idx, year_ji_idx),
+        sexagenary_index(month_gan_idx, month_ji_idx),
+        day_idx,
+    )
+
+
+# ============ 런타임 조회 ============
+
+class CalendarTable:
+    """
+    mmap 기반 만세력 테이블
+
+    - record(): 해당 날짜 00:00 KST 레코드
+    - lookup(): 시각까지 반영한 년/월/일주 + 황경 (다음날 레코드와 선형 보간)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, first_year, last_year, days = HEADER.unpack_from(self._mm, 0)
+        if magic != TABLE_MAGIC:
+            raise ValueError(f"만세력 테이블 포맷 불일치: {self.path}")
+        if len(self._mm) != HEADER.size + (days + 1) * RECORD.size:
+            raise ValueError(f"만세력 테이블 크기 불일치: {self.path}")
+
+        self.first_year = first_year
+        self.last_year = last_year
+        self.days = days
+        self._start_ordinal = date(first_year, 1, 1).toordinal()
+
+    def covers(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+    def as_numpy(self):
+        """레코드 전체를 numpy structured array 로 (mmap 공유, 복사 없음)"""
+        import numpy as np
+
+        dtype = np.dtype([("lon", "<f4"), ("year", "u1"), ("month", "u1"), ("day", "u1"), ("pad", "u1")])
+        return np.frombuffer(self._mm, dtype=dtype, count=self.days + 1, offset=HEADER.size)
+
+    def _record_at(self, i: int) -> Tuple[float, int, int, int]:
+        return RECORD.unpack_from(self._mm, HEADER.size + i * RECORD.size)
+
+    def record(self, year: int, month: int, day: int) -> Tuple[float, int, int, int]:
+        """(00:00 KST 황경, 년주 idx, 월주 idx, 일주 idx)"""
+        return self._record_at(date(year, month, day).toordinal() - self._start_ordinal)
+
+    def lookup(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 12,
+        minute: int = 0
+    ) -> Dict[str, Any]:
+        """
+        시각 반영 조회
+
+        하루 안에 절입이 있으면 보간 황경의 월지가 00:00 레코드와 달라지므로
+        이 경우 다음날 00:00 레코드(절입 후)의 년/월주를 사용
+        """
+        i = date(year, month, day).toordinal() - self._start_ordinal
+        lon0, year_idx, month_idx, day_idx = self._record_at(i)
+        lon1, next_year_idx, next_month_idx, _ = self._record_at(i + 1)
+
+        frac = (hour * 60 + minute) / 1440
+        solar_longitude = (lon0 + ((lon1 - lon0) % 360) * frac) % 360
+
+        if month_ji_from_longitude(solar_longitude) != month_idx % 12:
+            year_idx, month_idx = next_year_idx, next_month_idx
+
+        return {
+            "year_idx": year_idx,
+            "month_idx": month_idx,
+            "day_idx": day_idx,
+            "solar_longitude": solar_longitude,
+        }
+
+
+_calendar_table: Optional[CalendarTable] = None
+_calendar_table_checked = False
+
+
+def get_calendar_table() -> Optional[CalendarTable]:
+    """만세력 테이블 싱글톤 (파일 없으면 None → ephem fallback)"""
+    global _calendar_table, _calendar_table_checked
+    if not _calendar_table_checked:
+        _calendar_table_checked = True
+        try:
+            _calendar_table = CalendarTable(DEFAULT_TABLE_PATH)
+            logger.info(
+                f"✅ 만세력 테이블 로드: {_calendar_table.first_year}~{_calendar_table.last_year} "
+                f"({_calendar_table.days}일)"
+            )
+        except FileNotFoundError:
+            logger.warning(f"⚠️ 만세력 테이블 없음 → ephem 계산 사용: {DEFAULT_TABLE_PATH}")
+        except Exception as e:
+            logger.warning(f"⚠️ 만세력 테이블 로드 실패 → ephem 계산 사용: {e}")
+    return _calendar_table
@@ -0,0 +1,115 @@
+"""
+CPU 계산 실행기 (이벤트 루프 밖에서 실행)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- ephem 천문 계산 / 대량 계산(batch) 처럼 CPU 를 쓰는 작업을
+  스레드 풀 또는 프로세스 풀로 보내 SSE 스트림·리포트 워커 지연 방지
+- settings.compute_executor: "thread" (기본) | "process" | "inline"
+- settings.compute_max_workers: 풀 크기
+- 지표: 대기열 깊이, 실행 중, 완료 수, 평균/최대 소요 시간
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, Callable, TypeVar
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+
+class ComputePool:
+    """
+    CPU 작업 실행기
+
+    - run(fn, *args): 설정된 풀에서 실행 후 결과 await
+    - process 모드에서는 fn/인자/결과가 pickle 가능해야 함
+    """
+
+    def __init__(self, mode: Optional[str] = None, max_workers: Optional[int] = None):
+        settings = get_settings()
+        self.mode = mode or settings.compute_executor
+        if self.mode not in EXECUTOR_MODES:
+            logger.warning(f"⚠️ 알 수 없는 compute_executor={self.mode!r} → thread 사용")
+            self.mode = "thread"
+        self.max_workers = max_workers or settings.compute_max_workers
+        self._executor: Optional[Executor] = None
+
+        self._pending = 0
+        self._max_pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="saju-compute")
+            logger.info(f"✅ Compute pool: {self.mode} x{self.max_workers}")
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """fn(*args, **kwargs) 를 풀에서 실행"""
+        executor = self._get_executor()
+        started = time.perf_counter()
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        try:
+            if executor is None:
+                result = fn(*args, **kwargs)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+            self._completed += 1
+            return result
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        대기열 지표
+
+        - pending: 제출됐지만 끝나지 않은 작업 (실행 중 + 대기)
+        - queue_depth: 워커 수를 넘어 대기 중인 작업
+        """
+        finished = self._completed + self._failed
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "pending": self._pending,
+            "queue_depth": max(0, self._pending - self.max_workers) if self.mode != "inline" else 0,
+            "max_pending": self._max_pending,
+            "completed": self._completed,
+            "failed": self._failed,
+            "latency_ms": {
+                "avg": round(self._total_ms / finished, 3) if finished else 0,
+                "max": round(self._max_ms, 3),
+            },
+        }
+
+    def shutdown(self):
+        """앱 shutdown 에서 호출"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+compute_pool = ComputePool()
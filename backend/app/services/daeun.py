@@ -0,0 +1,136 @@
+"""
+대운(大運) 계산
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 방향: 양년생 남자 / 음년생 여자 → 순행, 그 외 → 역행
+- 대운수: 출생 시각 ~ 다음 절입(순행) / 직전 절입(역행) 까지의 시간
+  3일 = 1년, 1일 = 4개월 (반올림, 최소 1)
+- 절입 시각은 solar_terms_engine 절입 인덱스에서 bisect 1회 (O(log n))
+  → 요청마다 천문 계산 없음
+- 대운 기둥: 월주에서 60갑자 순/역으로 10개
+- (출생 분, 월주, 양년 여부, 성별) 단위 LRU 캐시
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import logging
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+
+from app.services.engine_v2 import GAN, JI
+from app.services.solar_terms import solar_terms_engine
+
+logger = logging.getLogger(__name__)
+
+DAEUN_STEPS = 10
+DAEUN_YEARS = 10
+
+MINUTES_PER_DAY = 1440
+# 3일 = 1년 → 1년 = 4320분, 1개월 = 360분
+MINUTES_PER_DAEUN_YEAR = 3 * MINUTES_PER_DAY
+MINUTES_PER_DAEUN_MONTH = MINUTES_PER_DAEUN_YEAR // 12
+
+MALE_VALUES = ("male", "남", "남성")
+
+
+def is_male(gender: str) -> bool:
+    return gender.lower() in MALE_VALUES
+
+
+def daeun_direction(year_gan_idx: int, gender: str) -> str:
+    """양년(갑병무경임) 남자 / 음년 여자 → forward"""
+    is_yang_year = year_gan_idx % 2 == 0
+    return "forward" if is_yang_year == is_male(gender) else "backward"
+
+
+@lru_cache(maxsize=8192)
+def _daeun_for_minute(
+    birth_minute: int,
+    term_index: int,
+    month_idx: int,
+    forward: bool
+) -> Tuple[int, int, Tuple[Tuple[int, int], ...]]:
+    """
+    (출생 epoch 분, 직전 절입 인덱스, 월주 60갑자 인덱스, 방향) → 대운
+
+    Returns:
+        (대운수, 대운수 개월 단위, ((60갑자 인덱스, 시작 나이), ...))
+    """
+    terms = solar_terms_engine.terms
+    if forward:
+        gap = terms[term_index + 1] - birth_minute
+    else:
+        gap = birth_minute - terms[term_index]
+
+    start_age = max(1, round(gap / MINUTES_PER_DAEUN_YEAR))
+    start_months = round(gap / MINUTES_PER_DAEUN_MONTH)
+
+    step = 1 if forward else -1
+    pillars = tuple(
+        ((month_idx + step * k) % 60, start_age + DAEUN_YEARS * (k - 1))
+        for k in range(1, DAEUN_STEPS + 1)
+    )
+    return start_age, start_months, pillars
+
+
+def calculate_daeun(
+    year: int,
+    month: int,
+    day: int,
+    hour: Optional[int],
+    minute: int,
+    gender: str,
+    year_gan_idx: int,
+    month_gan_idx: int,
+    month_ji_idx: int,
+    current_year: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    대운 계산
+
+    Args:
+        year~minute: 출생 일시 (KST 시계 시각, 시간 모름 → 12시)
+        gender: "male"/"female" (한글 허용)
+        year_gan_idx: 년간 인덱스 (방향 판정)
+        month_gan_idx, month_ji_idx: 월주 (대운 기둥 출발점)
+        current_year: 현재 대운 판정 연도 (None 이면 생략)
+
+    Returns:
+        start_age, start_age_months, direction, current_daeun, pillars
+    """
+    direction = daeun_direction(year_gan_idx, gender)
+    month_idx = (6 * month_gan_idx - 5 * month_ji_idx) % 60
+
+    term_index, birth_minute = solar_terms_engine.locate(
+        year, month, day, 12 if hour is None else hour, minute
+    )
+    start_age, start_months, steps = _daeun_for_minute(
+        birth_minute, term_index, month_idx, direction == "forward"
+    )
+
+    pillars = []
+    current_daeun = None
+    for order, (idx, age) in enumerate(steps, start=1):
+        ganji = GAN[idx % 10] + JI[idx % 12]
+        pillar = {
+            "order": order,
+            "ganji": ganji,
+            "gan": GAN[idx % 10],
+            "ji": JI[idx % 12],
+            "start_age": age,
+            "end_age": age + DAEUN_YEARS - 1,
+            "start_year": year + age,
+        }
+        pillars.append(pillar)
+        if current_year is not None and pillar["start_year"] <= current_year < pillar["start_year"] + DAEUN_YEARS:
+            current_daeun = ganji
+
+    return {
+        "start_age": start_age,
+        "start_age_months": start_months,
+        "direction": direction,
+        "current_daeun": current_daeun,
+        "pillars": pillars,
+    }
+
+
+def get_daeun_cache_info() -> Dict[str, int]:
+    info = _daeun_for_minute.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
@@ -14,7 +14,9 @@ import math
 import re
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Tuple
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, NamedTuple
 from dataclasses import dataclass
 import httpx
 
@@ -24,6 +26,11 @@ try:
 except ImportError:
     EPHEM_AVAILABLE = False
 
+from app.services.calendar_table import get_calendar_table, sexagenary_index
+from app.services.kasi_http import kasi_http
+from app.services.kasi_disk_cache import kasi_disk_cache
+from app.services.compute_pool import compute_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +81,99 @@ HOUR_OPTIONS = [
     {"index": 11, "ji": "해", "ji_hanja": "亥", "start": "21:00", "end": "22:59"},
 ]
 
+
+# ============ 불변 레코드 테이블 (모듈 로드 시 1회 생성, 요청마다 공유) ============
+
+PILLAR_FIELDS = (
+    "ganji", "gan", "ji", "gan_hanja", "ji_hanja",
+    "gan_element", "ji_element", "gan_index", "ji_index"
+)
+
+
+class PillarRecord(Mapping):
+    """
+    60갑자 기둥 (불변)
+    
+    - 기존 _make_pillar dict 와 같은 키로 조회 (record["ganji"], record.ganji 둘 다 가능)
+    - PILLARS[60갑자 인덱스] 로만 생성/공유, 값 변경 불가
+    """
+    __slots__ = PILLAR_FIELDS + ("index",)
+    
+    def __init__(self, index: int):
+        gan_idx, ji_idx = index % 10, index % 12
+        values = (
+            GAN[gan_idx] + JI[ji_idx], GAN[gan_idx], JI[ji_idx],
+            GAN_HANJA[gan_idx], JI_HANJA[ji_idx],
+            GAN_TO_ELEMENT[GAN[gan_idx]], JI_TO_ELEMENT[JI[ji_idx]],
+            gan_idx, ji_idx
+        )
+        for name, value in zip(PILLAR_FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "index", index)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("PillarRecord 는 변경할 수 없습니다")
+    
+    def __getitem__(self, key: str):
+        if key not in PILLAR_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(PILLAR_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(PILLAR_FIELDS)
+    
+    def __reduce__(self):
+        # pickle(process pool) 후에도 같은 인스턴스로 복원
+        return (pillar_by_index, (self.index,))
+    
+    def __repr__(self) -> str:
+        return f"PillarRecord({self.ganji})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+PILLARS: Tuple[PillarRecord, ...] = tuple(PillarRecord(i) for i in range(60))
+
+
+def pillar_by_index(index: int) -> PillarRecord:
+    """60갑자 인덱스 → 공유 기둥 레코드"""
+    return PILLARS[index % 60]
+
+
+def get_pillar(gan_idx: int, ji_idx: int) -> PillarRecord:
+    """천간/지지 인덱스 → 공유 기둥 레코드"""
+    return PILLARS[sexagenary_index(gan_idx, ji_idx)]
+
+
+class DayMaster(NamedTuple):
+    """일간 (천간, 오행, 설명)"""
+    gan: str
+    element: str
+    description: str
+
+
+DAY_MASTERS: Tuple[DayMaster, ...] = tuple(
+    DayMaster(g, GAN_TO_ELEMENT[g], DAY_MASTER_DESC[g]) for g in GAN
+)
+
+# 시주 표시 범위 ("23:00~00:59") / 선택 옵션 (HourOption 형식, 읽기 전용)
+HOUR_RANGES: Tuple[str, ...] = tuple(f"{h['start']}~{h['end']}" for h in HOUR_OPTIONS)
+HOUR_OPTION_ITEMS = tuple(
+    MappingProxyType({
+        "index": h["index"],
+        "ji": h["ji"],
+        "ji_hanja": h["ji_hanja"],
+        "range_start": h["start"],
+        "range_end": h["end"],
+        "label": f"{h['ji_hanja']}시 ({h['ji']}시) - {h['start']}~{h['end']}"
+    })
+    for h in HOUR_OPTIONS
+)
+
 # 절기 이름 (월지 인덱스별)
 SOLAR_TERM_NAMES = [
     "동지~소한 (자월)", "소한~입춘 (축월)", "입춘~경칩 (인월)",
@@ -88,6 +188,24 @@ class CalculationError(Exception):
     pass
 
 
+# ============ 태양 황경 (ephem) ============
+
+def ephem_solar_longitude(dt_utc: datetime) -> float:
+    """
+    태양 겉보기 황경 (당일 춘분점 기준, degree)
+
+    ephem.Ecliptic(sun)은 J2000 기준이라 절입 시각이 수 시간 어긋남
+    → 당일 epoch 적도좌표로 변환 후 황도좌표 계산 (KASI 절입 시각과 1분 이내)
+    """
+    if not EPHEM_AVAILABLE:
+        raise CalculationError("ephem 라이브러리 미설치")
+
+    d = ephem.Date(dt_utc)
+    sun = ephem.Sun(d)
+    equatorial = ephem.Equatorial(sun.ra, sun.dec, epoch=d)
+    return math.degrees(ephem.Ecliptic(equatorial).lon)
+
+
 # ============ 간지 정규화 (가짜 mismatch 방지) ============
 
 def _norm_ganji(x) -> str:
@@ -178,7 +296,7 @@ class SajuManager:
         day: int
     ) -> Optional[Dict[str, Any]]:
         """
-        KASI 음양력 API 호출
+        KASI 음양력 API 호출 (디스크 캐시 우선)
         
         Returns:
             {
@@ -188,100 +306,102 @@ class SajuManager:
                 "lunar_date": {...}
             }
         """
-        if not self.kasi_api_key:
-            logger.debug("KASI API key not configured")
-            return None
-        
-        params = {
-            "serviceKey": self.kasi_api_key,
-            "solYear": str(year),
-            "solMonth": str(month).zfill(2),
-            "solDay": str(day).zfill(2),
-            "_type": "json"
-        }
+        items = await kasi_disk_cache.aget_lunar(year, month, day)
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(self.KASI_LUNAR_URL, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", {})
-                )
-                
-                if items:
-                    return {
-                        "year_ganji": items.get("lunSecha", ""),
-                        "month_ganji": items.get("lunWolgeon", ""),
-                        "day_ganji": items.get("lunIljin", ""),
-                        "lunar_year": items.get("lunYear", ""),
-                        "lunar_month": items.get("lunMonth", ""),
-                        "lunar_day": items.get("lunDay", ""),
-                        "is_leap": items.get("lunLeapmonth", "") == "윤"
-                    }
-                
+        if not items:
+            if not self.kasi_api_key:
+                logger.debug("KASI API key not configured")
+                return None
+            
+            params = {
+                "serviceKey": self.kasi_api_key,
+                "solYear": str(year),
+                "solMonth": str(month).zfill(2),
+                "solDay": str(day).zfill(2),
+                "_type": "json"
+            }
+            
+            try:
+                data = await kasi_http.get_json(self.KASI_LUNAR_URL, params)
+            except httpx.TimeoutException:
+                logger.error(f"KASI API timeout for {year}-{month}-{day}")
+                return None
+            except httpx.HTTPError as e:
+                logger.error(f"KASI API HTTP error: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"KASI API unexpected error: {e}")
+                return None
+            
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", {})
+            )
+            
+            if not items:
                 logger.warning(f"KASI API returned empty for {year}-{month}-{day}")
                 return None
-                
-        except httpx.TimeoutException:
-            logger.error(f"KASI API timeout for {year}-{month}-{day}")
-            return None
-        except httpx.HTTPError as e:
-            logger.error(f"KASI API HTTP error: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"KASI API unexpected error: {e}")
-            return None
+            
+            await kasi_disk_cache.aset_lunar(year, month, day, items)
+        
+        return {
+            "year_ganji": items.get("lunSecha", ""),
+            "month_ganji": items.get("lunWolgeon", ""),
+            "day_ganji": items.get("lunIljin", ""),
+            "lunar_year": items.get("lunYear", ""),
+            "lunar_month": items.get("lunMonth", ""),
+            "lunar_day": items.get("lunDay", ""),
+            "is_leap": items.get("lunLeapmonth", "") == "윤"
+        }
     
     async def _fetch_kasi_solar_terms(
         self,
         year: int,
         month: int
     ) -> Optional[list]:
-        """KASI 24절기 API 호출"""
-        if not self.kasi_api_key:
-            return None
-        
-        params = {
-            "serviceKey": self.kasi_api_key,
-            "solYear": str(year),
-            "solMonth": str(month).zfill(2),
-            "_type": "json"
-        }
+        """KASI 24절기 API 호출 (디스크 캐시 우선)"""
+        items = await kasi_disk_cache.aget_solar_terms(year, month)
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(self.KASI_SOLAR_TERM_URL, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", [])
-                )
-                
-                if items:
-                    if isinstance(items, dict):
-                        items = [items]
-                    return [
-                        {
-                            "name": item.get("dateName", ""),
-                            "date": str(item.get("locdate", "")),
-                        }
-                        for item in items
-                    ]
-                
+        if not items:
+            if not self.kasi_api_key:
                 return None
-                
-        except Exception as e:
-            logger.error(f"KASI Solar Terms API error: {e}")
-            return None
+            
+            params = {
+                "serviceKey": self.kasi_api_key,
+                "solYear": str(year),
+                "solMonth": str(month).zfill(2),
+                "_type": "json"
+            }
+            
+            try:
+                data = await kasi_http.get_json(self.KASI_SOLAR_TERM_URL, params)
+            except Exception as e:
+                logger.error(f"KASI Solar Terms API error: {e}")
+                return None
+            
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", [])
+            )
+            
+            if not items:
+                return None
+            
+            if isinstance(items, dict):
+                items = [items]
+            await kasi_disk_cache.aset_solar_terms(year, month, items)
+        
+        return [
+            {
+                "name": item.get("dateName", ""),
+                "date": str(item.get("locdate", "")),
+            }
+            for item in items
+        ]
     
     # ============ ephem Fallback ============
     
@@ -294,30 +414,65 @@ class SajuManager:
         minute: int = 0
     ) -> float:
         """ephem으로 태양 황경 계산"""
-        if not EPHEM_AVAILABLE:
-            raise CalculationError("ephem 라이브러리 미설치")
-        
         dt_kst = datetime(year, month, day, hour, minute)
-        dt_utc = dt_kst - timedelta(hours=9)
-        
-        sun = ephem.Sun()
-        observer = ephem.Observer()
-        observer.date = dt_utc
-        sun.compute(observer)
-        
-        ecliptic = ephem.Ecliptic(sun)
-        return math.degrees(ecliptic.lon)
+        return ephem_solar_longitude(dt_kst - timedelta(hours=9))
     
+    def _table_calculate_ganji(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 12,
+        minute: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """만세력 테이블 조회 (1900~2100, 범위 밖/파일 없음이면 None)"""
+        table = get_calendar_table()
+        if table is None or not table.covers(year):
+            return None
+
+        row = table.lookup(year, month, day, hour, minute)
+        year_idx, month_idx, day_idx = row["year_idx"], row["month_idx"], row["day_idx"]
+
+        return {
+            "year_ganji": GAN[year_idx % 10] + JI[year_idx % 12],
+            "month_ganji": GAN[month_idx % 10] + JI[month_idx % 12],
+            "day_ganji": GAN[day_idx % 10] + JI[day_idx % 12],
+            "solar_longitude": round(row["solar_longitude"], 2),
+            "month_ji_idx": month_idx % 12
+        }
+
+    async def _local_calculate_ganji(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 12,
+        minute: int = 0
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        로컬 간지 계산: 만세력 테이블 우선, 범위 밖이면 ephem
+        
+        테이블 조회는 O(1) 이라 바로 처리, ephem 은 compute_pool 에서 실행 (이벤트 루프 보호)
+        """
+        table_data = self._table_calculate_ganji(year, month, day, hour, minute)
+        if table_data:
+            return table_data, "calendar_table"
+        if EPHEM_AVAILABLE:
+            ephem_data = await compute_pool.run(self._ephem_calculate_ganji, year, month, day, hour, minute)
+            return ephem_data, "ephem_fallback"
+        return None, None
+
     def _ephem_calculate_ganji(
         self,
         year: int,
         month: int,
         day: int,
-        hour: int = 12
+        hour: int = 12,
+        minute: int = 0
     ) -> Dict[str, str]:
         """ephem 기반 간지 계산 (Fallback)"""
         # 태양 황경
-        solar_lon = self._ephem_solar_longitude(year, month, day, hour)
+        solar_lon = self._ephem_solar_longitude(year, month, day, hour, minute)
         
         # 월지 인덱스
         normalized = (solar_lon + 45) % 360
@@ -381,41 +536,41 @@ class SajuManager:
         # 1. KASI API 시도
         kasi_data = await self._fetch_kasi_lunar(year, month, day)
         source = "kasi_api"
+        calc_hour = hour if hour is not None else 12
         
-        # 2. Fallback to ephem
+        # 2. Fallback to 만세력 테이블 / ephem
         if not kasi_data or not kasi_data.get("year_ganji"):
-            logger.info(f"Falling back to ephem for {year}-{month}-{day}")
+            local_data, local_source = await self._local_calculate_ganji(year, month, day, calc_hour, minute)
+            logger.info(f"Falling back to {local_source} for {year}-{month}-{day}")
             
-            if not EPHEM_AVAILABLE:
+            if not local_data:
                 raise CalculationError(
                     "KASI API 실패 및 ephem 미설치로 계산 불가"
                 )
             
-            ephem_data = self._ephem_calculate_ganji(year, month, day, hour or 12)
-            
             kasi_data = {
-                "year_ganji": ephem_data["year_ganji"],
-                "month_ganji": ephem_data["month_ganji"],
-                "day_ganji": ephem_data["day_ganji"],
+                "year_ganji": local_data["year_ganji"],
+                "month_ganji": local_data["month_ganji"],
+                "day_ganji": local_data["day_ganji"],
             }
-            source = "ephem_fallback"
-            solar_longitude = ephem_data.get("solar_longitude", 0)
-            month_ji_idx = ephem_data.get("month_ji_idx", 0)
+            source = local_source
+            solar_longitude = local_data.get("solar_longitude", 0)
+            month_ji_idx = local_data.get("month_ji_idx", 0)
         else:
-            # KASI 데이터 있으면 ephem으로 추가 정보만 계산
-            if EPHEM_AVAILABLE:
-                ephem_data = self._ephem_calculate_ganji(year, month, day, hour or 12)
-                solar_longitude = ephem_data.get("solar_longitude", 0)
-                month_ji_idx = ephem_data.get("month_ji_idx", 0)
+            # KASI 데이터 있으면 테이블(없으면 ephem)로 추가 정보만 계산
+            local_data, local_source = await self._local_calculate_ganji(year, month, day, calc_hour, minute)
+            if local_data:
+                solar_longitude = local_data.get("solar_longitude", 0)
+                month_ji_idx = local_data.get("month_ji_idx", 0)
                 
-                # 검증: KASI vs ephem 비교 (정규화 후)
+                # 검증: KASI vs 로컬 계산 비교 (정규화 후)
                 kasi_day = _norm_ganji(kasi_data["day_ganji"])
-                ephem_day = _norm_ganji(ephem_data["day_ganji"])
+                local_day = _norm_ganji(local_data["day_ganji"])
                 
-                if kasi_day != ephem_day:
+                if kasi_day != local_day:
                     logger.warning(
-                        "⚠️ KASI vs ephem 불일치! KASI: %r, ephem: %r → KASI 우선 사용",
-                        kasi_data['day_ganji'], ephem_data['day_ganji']
+                        "⚠️ KASI vs %s 불일치! KASI: %r, local: %r → KASI 우선 사용",
+                        local_source, kasi_data['day_ganji'], local_data['day_ganji']
                     )
                 else:
                     logger.info("✅ 간지 일치: %s", kasi_day)
@@ -453,13 +608,12 @@ class SajuManager:
             hour_gan_idx = (start_time_gan + hour_ji_idx) % 10
             
             hour_pillar = self._make_pillar(hour_gan_idx, hour_ji_idx)
-            h_opt = HOUR_OPTIONS[hour_ji_idx]
-            hour_range = f"{h_opt['start']}~{h_opt['end']}"
+            hour_range = HOUR_RANGES[hour_ji_idx]
         
         # 5. 경계일 확인
         is_boundary = False
         boundary_reason = None
-        if EPHEM_AVAILABLE and solar_longitude:
+        if solar_longitude:
             for boundary in range(0, 360, 15):
                 diff = abs((solar_longitude - boundary + 180) % 360 - 180)
                 if diff <= 1.5:
@@ -474,9 +628,9 @@ class SajuManager:
             "day_pillar": self._make_pillar(day_gan_idx, day_ji_idx),
             "hour_pillar": hour_pillar,
             "hour_range": hour_range,
-            "day_master": GAN[day_gan_idx],
-            "day_master_element": GAN_TO_ELEMENT[GAN[day_gan_idx]],
-            "day_master_description": DAY_MASTER_DESC[GAN[day_gan_idx]],
+            "day_master": DAY_MASTERS[day_gan_idx].gan,
+            "day_master_element": DAY_MASTERS[day_gan_idx].element,
+            "day_master_description": DAY_MASTERS[day_gan_idx].description,
             "meta": {
                 "source": source,
                 "solar_time_applied": use_solar_time,
@@ -489,34 +643,14 @@ class SajuManager:
             }
         }
     
-    def _make_pillar(self, gan_idx: int, ji_idx: int) -> Dict[str, Any]:
-        """Pillar 딕셔너리 생성"""
-        return {
-            "ganji": GAN[gan_idx] + JI[ji_idx],
-            "gan": GAN[gan_idx],
-            "ji": JI[ji_idx],
-            "gan_hanja": GAN_HANJA[gan_idx],
-            "ji_hanja": JI_HANJA[ji_idx],
-            "gan_element": GAN_TO_ELEMENT[GAN[gan_idx]],
-            "ji_element": JI_TO_ELEMENT[JI[ji_idx]],
-            "gan_index": gan_idx,
-            "ji_index": ji_idx
-        }
+    def _make_pillar(self, gan_idx: int, ji_idx: int) -> PillarRecord:
+        """공유 기둥 레코드 (PILLARS) 반환"""
+        return get_pillar(gan_idx, ji_idx)
     
     @staticmethod
     def get_hour_options():
         """시간대 선택 옵션"""
-        return [
-            {
-                "index": h["index"],
-                "ji": h["ji"],
-                "ji_hanja": h["ji_hanja"],
-                "range_start": h["start"],
-                "range_end": h["end"],
-                "label": f"{h['ji_hanja']}시 ({h['ji']}시) - {h['start']}~{h['end']}"
-            }
-            for h in HOUR_OPTIONS
-        ]
+        return list(HOUR_OPTION_ITEMS)
 
 
 # ============ 하위 호환용 ScientificSajuEngine ============
@@ -538,15 +672,7 @@ class ScientificSajuEngine:
     
     def _get_solar_longitude(self, year: int, month: int, day: int, hour: int, minute: int = 0) -> float:
         dt_kst = datetime(year, month, day, hour, minute)
-        dt_utc = dt_kst - timedelta(hours=9)
-        
-        sun = ephem.Sun()
-        observer = ephem.Observer()
-        observer.date = dt_utc
-        sun.compute(observer)
-        
-        ecliptic = ephem.Ecliptic(sun)
-        return math.degrees(ecliptic.lon)
+        return ephem_solar_longitude(dt_kst - timedelta(hours=9))
     
     def _get_solar_term_index(self, solar_longitude: float) -> Tuple[int, str]:
         deg = solar_longitude
@@ -575,33 +701,46 @@ class ScientificSajuEngine:
         minute: int = 0,
         use_solar_time: bool = True
     ) -> Dict[str, Any]:
-        """동기 계산 (ephem only - 기존 호환)"""
+        """동기 계산 (만세력 테이블 우선, 범위 밖이면 ephem - 기존 호환)"""
         try:
             calc_hour = hour if hour is not None else 12
-            solar_lon = self._get_solar_longitude(year, month, day, calc_hour, minute)
-            solar_idx, solar_term = self._get_solar_term_index(solar_lon)
-            is_boundary, boundary_reason = self._is_near_boundary(solar_lon)
-            
-            cal_year = year
-            if month <= 2:
-                if solar_idx <= 1:
-                    cal_year = year - 1
-            
-            year_gan_idx = (cal_year - 4) % 10
-            year_ji_idx = (cal_year - 4) % 12
+            table = get_calendar_table()
             
-            month_ji_idx = solar_idx
-            start_gan_idx = (year_gan_idx % 5) * 2 + 2
-            gap = month_ji_idx - 2
-            if gap < 0:
-                gap += 12
-            month_gan_idx = (start_gan_idx + gap) % 10
+            if table is not None and table.covers(year):
+                row = table.lookup(year, month, day, calc_hour, minute)
+                solar_lon = row["solar_longitude"]
+                solar_idx, solar_term = self._get_solar_term_index(solar_lon)
+                year_gan_idx, year_ji_idx = row["year_idx"] % 10, row["year_idx"] % 12
+                month_gan_idx, month_ji_idx = row["month_idx"] % 10, row["month_idx"] % 12
+                day_gan_idx, day_ji_idx = row["day_idx"] % 10, row["day_idx"] % 12
+                calculation_method = "calendar_table"
+            else:
+                solar_lon = self._get_solar_longitude(year, month, day, calc_hour, minute)
+                solar_idx, solar_term = self._get_solar_term_index(solar_lon)
+                
+                cal_year = year
+                if month <= 2:
+                    if solar_idx <= 1:
+                        cal_year = year - 1
+                
+                year_gan_idx = (cal_year - 4) % 10
+                year_ji_idx = (cal_year - 4) % 12
+                
+                month_ji_idx = solar_idx
+                start_gan_idx = (year_gan_idx % 5) * 2 + 2
+                gap = month_ji_idx - 2
+                if gap < 0:
+                    gap += 12
+                month_gan_idx = (start_gan_idx + gap) % 10
+                
+                target_dt = datetime(year, month, day)
+                days_diff = (target_dt - self.ANCHOR_DATE).days
+                curr_day_idx = (self.ANCHOR_IDX + days_diff) % 60
+                day_gan_idx = curr_day_idx % 10
+                day_ji_idx = curr_day_idx % 12
+                calculation_method = "ephem_astronomical"
             
-            target_dt = datetime(year, month, day)
-            days_diff = (target_dt - self.ANCHOR_DATE).days
-            curr_day_idx = (self.ANCHOR_IDX + days_diff) % 60
-            day_gan_idx = curr_day_idx % 10
-            day_ji_idx = curr_day_idx % 12
+            is_boundary, boundary_reason = self._is_near_boundary(solar_lon)
             
             hour_gan_idx = None
             hour_ji_idx = None
@@ -619,8 +758,7 @@ class ScientificSajuEngine:
                 start_time_gan = (day_gan_idx % 5) * 2
                 hour_gan_idx = (start_time_gan + hour_ji_idx) % 10
                 
-                h_opt = HOUR_OPTIONS[hour_ji_idx]
-                hour_range = f"{h_opt['start']}~{h_opt['end']}"
+                hour_range = HOUR_RANGES[hour_ji_idx]
             
             return {
                 "year_pillar": self._make_pillar(year_gan_idx, year_ji_idx),
@@ -628,9 +766,9 @@ class ScientificSajuEngine:
                 "day_pillar": self._make_pillar(day_gan_idx, day_ji_idx),
                 "hour_pillar": self._make_pillar(hour_gan_idx, hour_ji_idx) if hour is not None else None,
                 "hour_range": hour_range,
-                "day_master": GAN[day_gan_idx],
-                "day_master_element": GAN_TO_ELEMENT[GAN[day_gan_idx]],
-                "day_master_description": DAY_MASTER_DESC[GAN[day_gan_idx]],
+                "day_master": DAY_MASTERS[day_gan_idx].gan,
+                "day_master_element": DAY_MASTERS[day_gan_idx].element,
+                "day_master_description": DAY_MASTERS[day_gan_idx].description,
                 "meta": {
                     "solar_time_applied": use_solar_time,
                     "solar_longitude_deg": round(solar_lon, 2),
@@ -638,7 +776,7 @@ class ScientificSajuEngine:
                     "solar_term_name": solar_term,
                     "is_boundary": is_boundary,
                     "boundary_reason": boundary_reason,
-                    "calculation_method": "ephem_astronomical",
+                    "calculation_method": calculation_method,
                     "timezone": "Asia/Seoul"
                 }
             }
@@ -646,32 +784,12 @@ class ScientificSajuEngine:
         except Exception as e:
             raise CalculationError(f"사주 계산 실패: {str(e)}")
     
-    def _make_pillar(self, gan_idx: int, ji_idx: int) -> Dict[str, Any]:
-        return {
-            "ganji": GAN[gan_idx] + JI[ji_idx],
-            "gan": GAN[gan_idx],
-            "ji": JI[ji_idx],
-            "gan_hanja": GAN_HANJA[gan_idx],
-            "ji_hanja": JI_HANJA[ji_idx],
-            "gan_element": GAN_TO_ELEMENT[GAN[gan_idx]],
-            "ji_element": JI_TO_ELEMENT[JI[ji_idx]],
-            "gan_index": gan_idx,
-            "ji_index": ji_idx
-        }
+    def _make_pillar(self, gan_idx: int, ji_idx: int) -> PillarRecord:
+        return get_pillar(gan_idx, ji_idx)
     
     @staticmethod
     def get_hour_options():
-        return [
-            {
-                "index": h["index"],
-                "ji": h["ji"],
-                "ji_hanja": h["ji_hanja"],
-                "range_start": h["start"],
-                "range_end": h["end"],
-                "label": f"{h['ji_hanja']}시 ({h['ji']}시) - {h['start']}~{h['end']}"
-            }
-            for h in HOUR_OPTIONS
-        ]
+        return list(HOUR_OPTION_ITEMS)
 
 
 # ============ 싱글톤 인스턴스 ============
@@ -0,0 +1,224 @@
+"""
+FeatureTags 사전 계산 테이블 (년/월/일주 60³ × 오버레이 연도)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- tools/build_feature_tag_table.py 로 오프라인 생성, 결과(data/feature_tags_no_time.bin)는 저장소에 포함
+  (calendar_1900_2100.bin 과 같음, feature_tags_no_time.py 를 고치면 다시 생성해 함께 커밋)
+  (지장간 전개 / 십신 / 오행 비율 / 신강약 / 지지 다이내믹 계산은 빌드 때 1회)
+- 태그 집합 = 고정 태그 어휘(정렬) 위 비트마스크 → 조회는 mmap 오프셋 계산 O(1) + 비트 디코드
+- 원본 계산 함수(feature_tags_no_time.build_feature_tags_no_time_from_pillars)는 그대로 유지
+  → 테이블 없음 / stale / 범위 밖 입력이면 원본 계산, 빌드 도구 --verify 로 대조
+- 원본 모듈 파일 sha256 을 헤더에 저장 → 계산 규칙이 바뀌면 stale 로 보고 사용 안 함
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import hashlib
+import mmap
+import struct
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.services import feature_tags_no_time as _ft
+from app.services.feature_tags_no_time import (
+    HANJA_BRANCH, HANJA_STEM, build_feature_tags_no_time_from_pillars, to_hanja_pillar,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 파일 포맷 ============
+# 헤더: magic(8) + 버전(u32) + 원본 모듈 sha256(32) + 태그 수(u16) + 마스크 바이트 수(u16)
+#       + 오버레이 연도 수(u16) + pad(u16) + 어휘 바이트 수(u32)
+# 오버레이 연도(u16 × 수) → 어휘(UTF-8, "\x00" 구분, 정렬) → 8바이트 정렬 → 레코드
+# 레코드: (년주 × 60 + 월주) × 60 + 일주 순서, 각 기둥마다 슬롯 (오버레이 연도 수 + 1)개
+#   슬롯 i < 오버레이 연도 수: overlay_year = 해당 연도
+#   마지막 슬롯: 목록에 없는 연도 (원본 계산은 오버레이 연도 외에는 모두 같은 결과)
+# 마스크: little-endian, 비트 i = 어휘 i 번째 태그
+
+TABLE_MAGIC = b"SAJUFTT1"
+TABLE_VERSION = 1
+HEADER = struct.Struct("<8sI32sHHHHI")
+OVERLAY = struct.Struct("<H")
+
+N_PILLARS = 60
+DEFAULT_OVERLAY_YEARS: Tuple[int, ...] = (2026,)
+# 마지막 슬롯 계산용 (오버레이 목록에 없는 연도)
+NO_OVERLAY_YEAR = 0
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parents[2] / "data" / "feature_tags_no_time.bin"
+
+
+def source_digest() -> bytes:
+    """원본 계산 모듈(feature_tags_no_time.py) sha256"""
+    return hashlib.sha256(Path(_ft.__file__).read_bytes()).digest()
+
+
+def pillar_index(pillar: str) -> Optional[int]:
+    """간지(한글/한자) → 60갑자 인덱스 (idx % 10 = 천간, idx % 12 = 지지), 60갑자가 아니면 None"""
+    if not pillar or len(pillar) < 2:
+        return None
+    p = to_hanja_pillar(pillar)
+    try:
+        g = HANJA_STEM.index(p[0])
+        j = HANJA_BRANCH.index(p[1])
+    except ValueError:
+        return None
+    if g % 2 != j % 2:
+        return None
+    return (6 * g - 5 * j) % 60
+
+
+def pillar_of(idx: int) -> str:
+    """60갑자 인덱스 → 한자 간지"""
+    return HANJA_STEM[idx % 10] + HANJA_BRANCH[idx % 12]
+
+
+def encode_mask(tags: Iterable[str], vocab_index: Dict[str, int]) -> int:
+    mask = 0
+    for t in tags:
+        mask |= 1 << vocab_index[t]
+    return mask
+
+
+def decode_mask(mask: int, vocab: Sequence[str]) -> List[str]:
+    """비트마스크 → 태그 목록 (어휘가 정렬돼 있으므로 결과도 정렬)"""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(vocab[low.bit_length() - 1])
+        mask ^= low
+    return out
+
+
+# ============ 쓰기 (빌드 도구) ============
+
+def write_table(
+    out_path: str,
+    vocab: Sequence[str],
+    overlay_years: Sequence[int],
+    masks: Sequence[int],
+    digest: bytes,
+) -> int:
+    """
+    마스크 배열 → 테이블 파일 (원자적 교체)
+
+    masks: 레코드 순서 (파일 포맷 참고), 길이 60³ × (오버레이 연도 수 + 1)
+    Returns:
+        파일 크기 (bytes)
+    """
+    n_slots = len(overlay_years) + 1
+    assert len(masks) == N_PILLARS ** 3 * n_slots, "레코드 수 불일치"
+    assert list(vocab) == sorted(vocab), "어휘는 정렬돼 있어야 함"
+    width = (len(vocab) + 7) // 8
+    vocab_blob = "\x00".join(vocab).encode("utf-8")
+
+    buf = bytearray(HEADER.pack(
+        TABLE_MAGIC, TABLE_VERSION, digest, len(vocab), width,
+        len(overlay_years), 0, len(vocab_blob),
+    ))
+    for y in overlay_years:
+        buf += OVERLAY.pack(y)
+    buf += vocab_blob
+    buf += b"\x00" * (-len(buf) % 8)
+    buf += b"".join(m.to_bytes(width, "little") for m in masks)
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+    Path(tmp_path).replace(out_path)
+    return len(buf)
+
+
+# ============ 런타임 조회 ============
+
+class FeatureTagTable:
+    """
+    mmap 기반 FeatureTags 테이블
+
+    - lookup(): 기둥 3개 + overlay_year → 태그 목록 (정렬), 60갑자가 아니면 None
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, digest, n_tags, width, n_overlay, _pad, vocab_len = HEADER.unpack_from(self._mm, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            raise ValueError(f"FeatureTags 테이블 포맷 불일치: {self.path}")
+
+        pos = HEADER.size
+        self.overlay_years: Tuple[int, ...] = tuple(
+            OVERLAY.unpack_from(self._mm, pos + i * OVERLAY.size)[0] for i in range(n_overlay)
+        )
+        pos += n_overlay * OVERLAY.size
+        self.vocab: Tuple[str, ...] = tuple(self._mm[pos:pos + vocab_len].decode("utf-8").split("\x00"))
+        pos += vocab_len
+        pos += -pos % 8
+        if len(self.vocab) != n_tags:
+            raise ValueError(f"FeatureTags 테이블 어휘 불일치: {self.path}")
+
+        self.digest = digest
+        self.width = width
+        self._n_slots = n_overlay + 1
+        self._slot = {y: i for i, y in enumerate(self.overlay_years)}
+        self._base = pos
+        if len(self._mm) != pos + N_PILLARS ** 3 * self._n_slots * width:
+            raise ValueError(f"FeatureTags 테이블 크기 불일치: {self.path}")
+
+    def mask_at(self, y: int, m: int, d: int, overlay_year: int) -> int:
+        """60갑자 인덱스 3개 → 비트마스크"""
+        slot = self._slot.get(overlay_year, self._n_slots - 1)
+        off = self._base + (((y * N_PILLARS + m) * N_PILLARS + d) * self._n_slots + slot) * self.width
+        return int.from_bytes(self._mm[off:off + self.width], "little")
+
+    def lookup(
+        self, year_pillar: str, month_pillar: str, day_pillar: str, overlay_year: int = 2026
+    ) -> Optional[List[str]]:
+        y, m, d = pillar_index(year_pillar), pillar_index(month_pillar), pillar_index(day_pillar)
+        if y is None or m is None or d is None:
+            return None
+        return decode_mask(self.mask_at(y, m, d, overlay_year), self.vocab)
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+_feature_tag_table: Optional[FeatureTagTable] = None
+_feature_tag_table_checked = False
+
+
+def get_feature_tag_table() -> Optional[FeatureTagTable]:
+    """FeatureTags 테이블 싱글톤 (없음 / stale → None, 원본 계산 사용)"""
+    global _feature_tag_table, _feature_tag_table_checked
+    if not _feature_tag_table_checked:
+        _feature_tag_table_checked = True
+        try:
+            table = FeatureTagTable(DEFAULT_TABLE_PATH)
+            if table.digest != source_digest():
+                table.close()
+                logger.warning(f"⚠️ FeatureTags 테이블 stale (계산 규칙 변경) → 원본 계산 사용: {DEFAULT_TABLE_PATH}")
+            else:
+                _feature_tag_table = table
+                logger.info(f"✅ FeatureTags 테이블 로드: 태그 {len(table.vocab)}개, 오버레이 {table.overlay_years}")
+        except FileNotFoundError:
+            logger.info(f"FeatureTags 테이블 없음 → 원본 계산 사용: {DEFAULT_TABLE_PATH}")
+        except Exception as e:
+            logger.warning(f"⚠️ FeatureTags 테이블 로드 실패 → 원본 계산 사용: {e}")
+    return _feature_tag_table
+
+
+def feature_tags_no_time(
+    year_pillar: str, month_pillar: str, day_pillar: str, overlay_year: int = 2026
+) -> List[str]:
+    """
+    원국 FeatureTags (시주 없음) 태그 목록
+    = build_feature_tags_no_time_from_pillars(...)["tags"], 테이블이 있으면 O(1) 조회
+    """
+    table = get_feature_tag_table()
+    if table is not None:
+        tags = table.lookup(year_pillar, month_pillar, day_pillar, overlay_year)
+        if tags is not None:
+            return tags
+    return build_feature_tags_no_time_from_pillars(
+        year_pillar, month_pillar, day_pillar, overlay_year=overlay_year
+    ).get("tags", [])
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 # ============ 한글 ↔ 한자 변환 ============
 
@@ -119,22 +119,40 @@ def season_by_month_branch(mb: str) -> str:
 def build_feature_tags_no_time_from_pillars(
     year_pillar: str, month_pillar: str, day_pillar: str, overlay_year: int = 2026
 ) -> Dict:
+    return build_feature_tags_from_pillars(year_pillar, month_pillar, day_pillar, None, overlay_year)
+
+def build_feature_tags_from_pillars(
+    year_pillar: str, month_pillar: str, day_pillar: str,
+    hour_pillar: Optional[str] = None, overlay_year: int = 2026
+) -> Dict:
+    """
+    원국 FeatureTags (시주 선택)
+    hour_pillar 가 None 이면 build_feature_tags_no_time_from_pillars 와 동일
+    시주가 있으면 시간(時干)·시지(時支)를 년/월 기둥과 같은 방식으로 반영
+    """
     # 한글 → 한자 변환 (한글 입력 지원)
     year_pillar = to_hanja_pillar(year_pillar)
     month_pillar = to_hanja_pillar(month_pillar)
     day_pillar = to_hanja_pillar(day_pillar)
+    hour_pillar = to_hanja_pillar(hour_pillar) if hour_pillar else None
     
     yStem, yBranch = year_pillar[0], year_pillar[1]
     mStem, mBranch = month_pillar[0], month_pillar[1]
     dStem, dBranch = day_pillar[0], day_pillar[1]  # day master
 
+    # 일간 외 천간 / 지지 목록 (시주 있으면 뒤에 추가)
+    other_stems = [yStem, mStem]
+    branches = [yBranch, mBranch, dBranch]
+    if hour_pillar:
+        other_stems.append(hour_pillar[0])
+        branches.append(hour_pillar[1])
+
     tags: Set[str] = set()
 
     # 기본 태그
     tags.add(STEM_TO_TAG.get(dStem, ""))
-    tags.add(BRANCH_TO_TAG.get(yBranch, ""))
-    tags.add(BRANCH_TO_TAG.get(mBranch, ""))
-    tags.add(BRANCH_TO_TAG.get(dBranch, ""))
+    for b in branches:
+        tags.add(BRANCH_TO_TAG.get(b, ""))
     tags.add(STEM_META[dStem][0])  # 일간 오행
     tags.add("조후")
 
@@ -147,18 +165,20 @@ def build_feature_tags_no_time_from_pillars(
         grp_cnt[group_of(tg)] += w
         tags.add(tg); tags.add(group_of(tg))
 
-    push_tg(ten_god(dStem, yStem), 1.0)
-    push_tg(ten_god(dStem, mStem), 1.0)
-    for b in [yBranch, mBranch, dBranch]:
+    for st in other_stems:
+        push_tg(ten_god(dStem, st), 1.0)
+    for b in branches:
         for hs, w in HIDDEN_STEMS.get(b, []):
             push_tg(ten_god(dStem, hs), w)
 
     # 오행 비율(간단)
     elem_mass = {"목":0.0,"화":0.0,"토":0.0,"금":0.0,"수":0.0}
     def add_elem(e: str, w: float): elem_mass[e] += w
-    add_elem(STEM_META[yStem][0], 1); add_elem(STEM_META[mStem][0], 1); add_elem(STEM_META[dStem][0], 1)
-    add_elem(BRANCH_MAIN_ELEM[yBranch], 1); add_elem(BRANCH_MAIN_ELEM[mBranch], 1); add_elem(BRANCH_MAIN_ELEM[dBranch], 1)
-    for b in [yBranch, mBranch, dBranch]:
+    for st in [yStem, mStem, dStem] + other_stems[2:]:
+        add_elem(STEM_META[st][0], 1)
+    for b in branches:
+        add_elem(BRANCH_MAIN_ELEM[b], 1)
+    for b in branches:
         for hs, w in HIDDEN_STEMS.get(b, []):
             add_elem(STEM_META[hs][0], 0.6*w)
 
@@ -176,9 +196,9 @@ def build_feature_tags_no_time_from_pillars(
     elif GEN[dm_elem] == month_elem: strength -= 0.5
 
     # 주변 가중
-    token_elems = [(STEM_META[yStem][0],1.0),(STEM_META[mStem][0],1.0),
-                   (BRANCH_MAIN_ELEM[yBranch],1.0),(BRANCH_MAIN_ELEM[mBranch],1.0),(BRANCH_MAIN_ELEM[dBranch],1.0)]
-    for b in [yBranch, mBranch, dBranch]:
+    token_elems = [(STEM_META[st][0],1.0) for st in other_stems] + \
+                  [(BRANCH_MAIN_ELEM[b],1.0) for b in branches]
+    for b in branches:
         for hs, w in HIDDEN_STEMS.get(b, []):
             token_elems.append((STEM_META[hs][0], w))
     for e, w in token_elems:
@@ -200,13 +220,13 @@ def build_feature_tags_no_time_from_pillars(
     if cool_wet - hot_dry > 0.15: tags.add("습윤")
 
     # 지지 다이내믹(원국)
-    for t in branch_dynamics([yBranch, mBranch, dBranch]):
+    for t in branch_dynamics(branches):
         tags.add(t)
 
     # 2026 오버레이(병오)
     if overlay_year == 2026:
         tags.update(["병화","오화","화"])
-        for t in branch_dynamics([yBranch, mBranch, dBranch, "午"]):
+        for t in branch_dynamics(branches + ["午"]):
             tags.add(t)
 
     # 사업가형 실무 태그(그룹 기반)
@@ -238,7 +258,8 @@ def build_feature_tags_no_time_from_pillars(
     return {
         "tags": sorted(out),
         "debug": {
-            "pillars": {"year":year_pillar,"month":month_pillar,"day":day_pillar},
+            "pillars": {"year":year_pillar,"month":month_pillar,"day":day_pillar,
+                        **({"hour":hour_pillar} if hour_pillar else {})},
             "elem_ratio": elem_ratio,
             "strength_score": round(strength, 2),
             "group_counts": grp_cnt,
@@ -7,6 +7,8 @@
 from datetime import date, datetime
 from typing import Tuple, Optional
 
+from app.services.calendar_table import get_calendar_table, ANCHOR_DATE, ANCHOR_IDX
+
 # 천간 (10개)
 CHEONGAN = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
 
@@ -123,22 +125,21 @@ class GanjiCalculator:
         """
         일주 계산
         
-        기준일: 1900년 1월 31일 = 갑자일 (검증된 기준)
-        (참고: 1900년 1월 1일은 갑술일이 아니라 계해일이라는 자료도 있음)
-        
-        ※ 여기서는 검증된 기준일 사용: 2000년 1월 1일 = 갑진일
+        만세력 테이블(1900~2100) 우선 조회, 범위 밖이면 기준일 계산
+        기준일: 2000년 1월 1일 = 무오일 (engine_v2와 동일)
         
         Returns:
             (천간, 지지, 천간인덱스, 지지인덱스)
         """
-        # 검증된 기준: 2000년 1월 1일 = 갑진일 (갑=0, 진=4)
-        base_date = date(2000, 1, 1)
-        target_date = date(year, month, day)
-        days_diff = (target_date - base_date).days
-        
-        # 2000년 1월 1일: 갑(0) + 진(4)
-        day_gan_idx = (0 + days_diff) % 10
-        day_ji_idx = (4 + days_diff) % 12
+        table = get_calendar_table()
+        if table is not None and table.covers(year):
+            day_idx = table.record(year, month, day)[3]
+        else:
+            days_diff = (date(year, month, day) - ANCHOR_DATE).days
+            day_idx = (ANCHOR_IDX + days_diff) % 60
+        
+        day_gan_idx = day_idx % 10
+        day_ji_idx = day_idx % 12
         
         return CHEONGAN[day_gan_idx], JIJI[day_ji_idx], day_gan_idx, day_ji_idx
     
@@ -11,6 +11,8 @@ import logging
 from functools import lru_cache
 
 from app.config import get_settings
+from app.services.kasi_http import kasi_http
+from app.services.kasi_disk_cache import kasi_disk_cache
 
 logger = logging.getLogger(__name__)
 
@@ -56,53 +58,53 @@ class KasiApiClient:
                 "lunIljin": "임오"       # 일 간지
             }
         """
-        if not self.api_key:
-            logger.warning("KASI API key not configured, using fallback")
-            return None
+        items = await kasi_disk_cache.aget_lunar(year, month, day)
         
-        url = f"{self.BASE_URL_LUNAR}/getLunCalInfo"
-        params = {
-            "serviceKey": self.api_key,
-            "solYear": str(year),
-            "solMonth": str(month).zfill(2),
-            "solDay": str(day).zfill(2),
-            "_type": "json"
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # 응답 파싱
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", {})
-                )
-                
-                if items:
-                    return {
-                        "year_ganji": items.get("lunSecha", ""),      # 세차 (년 간지)
-                        "month_ganji": items.get("lunWolgeon", ""),   # 월건 (월 간지)
-                        "day_ganji": items.get("lunIljin", ""),       # 일진 (일 간지)
-                        "lunar_year": items.get("lunYear", ""),
-                        "lunar_month": items.get("lunMonth", ""),
-                        "lunar_day": items.get("lunDay", ""),
-                        "is_leap_month": items.get("lunLeapmonth", "") == "윤"
-                    }
-                
+        if not items:
+            if not self.api_key:
+                logger.warning("KASI API key not configured, using fallback")
+                return None
+            
+            url = f"{self.BASE_URL_LUNAR}/getLunCalInfo"
+            params = {
+                "serviceKey": self.api_key,
+                "solYear": str(year),
+                "solMonth": str(month).zfill(2),
+                "solDay": str(day).zfill(2),
+                "_type": "json"
+            }
+            
+            try:
+                data = await kasi_http.get_json(url, params)
+            except httpx.HTTPError as e:
+                logger.error(f"KASI API HTTP error: {e}")
                 return None
-                
-        except httpx.HTTPError as e:
-            logger.error(f"KASI API HTTP error: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"KASI API error: {e}")
-            return None
+            except Exception as e:
+                logger.error(f"KASI API error: {e}")
+                return None
+            
+            # 응답 파싱
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", {})
+            )
+            
+            if not items:
+                return None
+            
+            await kasi_disk_cache.aset_lunar(year, month, day, items)
+        
+        return {
+            "year_ganji": items.get("lunSecha", ""),      # 세차 (년 간지)
+            "month_ganji": items.get("lunWolgeon", ""),   # 월건 (월 간지)
+            "day_ganji": items.get("lunIljin", ""),       # 일진 (일 간지)
+            "lunar_year": items.get("lunYear", ""),
+            "lunar_month": items.get("lunMonth", ""),
+            "lunar_day": items.get("lunDay", ""),
+            "is_leap_month": items.get("lunLeapmonth", "") == "윤"
+        }
     
     async def get_solar_terms(
         self,
@@ -119,50 +121,49 @@ class KasiApiClient:
                 "term_time": "23:10"
             }
         """
-        if not self.api_key:
-            return None
-        
-        url = f"{self.BASE_URL_SPECIAL}/get24DivisionsInfo"
-        params = {
-            "serviceKey": self.api_key,
-            "solYear": str(year),
-            "solMonth": str(month).zfill(2),
-            "_type": "json"
-        }
+        items = await kasi_disk_cache.aget_solar_terms(year, month)
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", [])
-                )
-                
-                # 여러 절기가 있을 수 있음 (입절, 중기)
-                if items:
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    result = []
-                    for item in items:
-                        result.append({
-                            "name": item.get("dateName", ""),
-                            "date": item.get("locdate", ""),
-                            "is_holiday": item.get("isHoliday", "N") == "Y"
-                        })
-                    return result
-                
+        if not items:
+            if not self.api_key:
                 return None
-                
-        except Exception as e:
-            logger.error(f"KASI Solar Terms API error: {e}")
-            return None
+            
+            url = f"{self.BASE_URL_SPECIAL}/get24DivisionsInfo"
+            params = {
+                "serviceKey": self.api_key,
+                "solYear": str(year),
+                "solMonth": str(month).zfill(2),
+                "_type": "json"
+            }
+            
+            try:
+                data = await kasi_http.get_json(url, params)
+            except Exception as e:
+                logger.error(f"KASI Solar Terms API error: {e}")
+                return None
+            
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", [])
+            )
+            
+            if not items:
+                return None
+            
+            # 여러 절기가 있을 수 있음 (입절, 중기)
+            if isinstance(items, dict):
+                items = [items]
+            await kasi_disk_cache.aset_solar_terms(year, month, items)
+        
+        result = []
+        for item in items:
+            result.append({
+                "name": item.get("dateName", ""),
+                "date": item.get("locdate", ""),
+                "is_holiday": item.get("isHoliday", "N") == "Y"
+            })
+        return result
     
     async def get_ganji_data(
         self,
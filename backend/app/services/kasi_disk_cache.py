@@ -0,0 +1,178 @@
+"""
+KASI 응답 영구 캐시 (SQLite)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 음양력(날짜별) / 24절기(년월별) KASI 원본 item 을 그대로 저장
+- 과거 날짜 데이터는 바뀌지 않음 → TTL 없음, 한 번 받으면 재호출 안 함
+- SajuManager / KasiApiClient 가 네트워크 호출 전에 조회
+  (async 경로는 aget_* / aset_* → sqlite 작업은 스레드에서, 이벤트 루프를 막지 않음)
+- 일괄 채우기: tools/prefetch_kasi.py
+- 경로: settings.kasi_cache_path (배포 간 유지하려면 볼륨 경로로 지정)
+  비어 있으면 DEFAULT_CACHE_PATH (작업 디렉터리와 무관하게 backend/data)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import json
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Set, Tuple
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "kasi_cache.sqlite3"
+
+
+class KasiDiskCache:
+    """
+    KASI 응답 SQLite 캐시
+
+    - get_lunar / set_lunar: (년, 월, 일) → getLunCalInfo item
+    - get_solar_terms / set_solar_terms: (년, 월) → get24DivisionsInfo item 리스트
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._con: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """최초 사용 시 연결 (실패하면 캐시 없이 동작)"""
+        if self._con is not None or self._disabled:
+            return self._con
+        path = self.path or get_settings().kasi_cache_path or str(DEFAULT_CACHE_PATH)
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute("PRAGMA synchronous=NORMAL;")
+            con.execute("""
+            CREATE TABLE IF NOT EXISTS kasi_lunar (
+                sol_date TEXT PRIMARY KEY,
+                item_json TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+            """)
+            con.execute("""
+            CREATE TABLE IF NOT EXISTS kasi_solar_terms (
+                sol_year INTEGER NOT NULL,
+                sol_month INTEGER NOT NULL,
+                items_json TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                PRIMARY KEY (sol_year, sol_month)
+            )
+            """)
+            con.commit()
+            self._con = con
+            logger.info(f"✅ KASI 디스크 캐시: {path}")
+        except Exception as e:
+            self._disabled = True
+            logger.warning(f"⚠️ KASI 디스크 캐시 사용 불가 (네트워크만 사용): {e}")
+        return self._con
+
+    @staticmethod
+    def _date_key(year: int, month: int, day: int) -> str:
+        return f"{year:04d}-{month:02d}-{day:02d}"
+
+    def _get(self, sql: str, params: Tuple) -> Optional[Any]:
+        con = self._connect()
+        if con is None:
+            return None
+        with self._lock:
+            row = con.execute(sql, params).fetchone()
+            self.stats["misses" if row is None else "hits"] += 1
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def _put(self, sql: str, params: Tuple):
+        con = self._connect()
+        if con is None:
+            return
+        with self._lock:
+            con.execute(sql, params)
+            con.commit()
+            self.stats["writes"] += 1
+
+    # ============ 음양력 (날짜별) ============
+
+    def get_lunar(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        return self._get(
+            "SELECT item_json FROM kasi_lunar WHERE sol_date = ?",
+            (self._date_key(year, month, day),)
+        )
+
+    def set_lunar(self, year: int, month: int, day: int, item: Dict[str, Any]):
+        self._put(
+            "INSERT OR REPLACE INTO kasi_lunar (sol_date, item_json, fetched_at) VALUES (?, ?, ?)",
+            (self._date_key(year, month, day), json.dumps(item, ensure_ascii=False), datetime.utcnow().isoformat())
+        )
+
+    def cached_lunar_dates(self, start_year: int, end_year: int) -> Set[str]:
+        """prefetch 용: 이미 저장된 날짜 키 집합"""
+        con = self._connect()
+        if con is None:
+            return set()
+        with self._lock:
+            rows = con.execute(
+                "SELECT sol_date FROM kasi_lunar WHERE sol_date >= ? AND sol_date < ?",
+                (f"{start_year:04d}", f"{end_year + 1:04d}")
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    # ============ 24절기 (년월별) ============
+
+    def get_solar_terms(self, year: int, month: int) -> Optional[List[Dict[str, Any]]]:
+        return self._get(
+            "SELECT items_json FROM kasi_solar_terms WHERE sol_year = ? AND sol_month = ?",
+            (year, month)
+        )
+
+    def set_solar_terms(self, year: int, month: int, items: List[Dict[str, Any]]):
+        self._put(
+            "INSERT OR REPLACE INTO kasi_solar_terms (sol_year, sol_month, items_json, fetched_at) VALUES (?, ?, ?, ?)",
+            (year, month, json.dumps(items, ensure_ascii=False), datetime.utcnow().isoformat())
+        )
+
+    def cached_solar_term_months(self, start_year: int, end_year: int) -> Set[Tuple[int, int]]:
+        con = self._connect()
+        if con is None:
+            return set()
+        with self._lock:
+            rows = con.execute(
+                "SELECT sol_year, sol_month FROM kasi_solar_terms WHERE sol_year BETWEEN ? AND ?",
+                (start_year, end_year)
+            ).fetchall()
+        return {(r[0], r[1]) for r in rows}
+
+    # ============ async (이벤트 루프 밖 스레드에서 sqlite 작업) ============
+
+    async def aget_lunar(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.get_lunar, year, month, day)
+
+    async def aset_lunar(self, year: int, month: int, day: int, item: Dict[str, Any]):
+        await asyncio.to_thread(self.set_lunar, year, month, day, item)
+
+    async def aget_solar_terms(self, year: int, month: int) -> Optional[List[Dict[str, Any]]]:
+        return await asyncio.to_thread(self.get_solar_terms, year, month)
+
+    async def aset_solar_terms(self, year: int, month: int, items: List[Dict[str, Any]]):
+        await asyncio.to_thread(self.set_solar_terms, year, month, items)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "enabled": self._connect() is not None}
+
+    def close(self):
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+
+# 싱글톤 인스턴스
+kasi_disk_cache = KasiDiskCache()
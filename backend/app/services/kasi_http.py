@@ -0,0 +1,112 @@
+"""
+KASI 공용 HTTP 클라이언트
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- httpx.AsyncClient 1개를 앱 수명(startup/shutdown) 동안 재사용
+  → 요청마다 TCP/TLS 새로 맺지 않음 (keep-alive + 연결 수 제한)
+- singleflight: 같은 URL+파라미터 동시 요청은 upstream 호출 1회를 공유
+- SajuManager / KasiApiClient 공용
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import logging
+from typing import Optional, Dict, Any, Tuple
+
+import httpx
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class KasiHttpClient:
+    """
+    KASI API 호출용 풀링 클라이언트
+
+    - startup(): 앱 시작 시 클라이언트 생성
+    - aclose(): 앱 종료 시 연결 정리
+    - get_json(): singleflight 로 묶인 GET → JSON
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self.stats = {"requests": 0, "upstream_calls": 0, "coalesced": 0}
+
+    def _new_client(self) -> httpx.AsyncClient:
+        settings = get_settings()
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.kasi_timeout_seconds, connect=settings.kasi_connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.kasi_max_connections,
+                max_keepalive_connections=settings.kasi_max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+        )
+
+    async def startup(self):
+        """앱 startup 에서 호출"""
+        await self.aclose()
+        self._client = self._new_client()
+        self._loop = asyncio.get_running_loop()
+        logger.info("✅ KASI HTTP 클라이언트 시작 (keep-alive pool)")
+
+    async def aclose(self):
+        """앱 shutdown 에서 호출"""
+        client, self._client = self._client, None
+        self._inflight.clear()
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프의 클라이언트
+
+        startup 없이 쓰는 경우(스크립트/테스트) 또는 루프가 바뀐 경우 새로 생성
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._new_client()
+            self._loop = loop
+            self._inflight.clear()
+        return self._client
+
+    async def _fetch(self, url: str, params: Dict[str, str]) -> Dict[str, Any]:
+        self.stats["upstream_calls"] += 1
+        resp = await self._get_client().get(url, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _on_done(self, key: Tuple, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        # 호출자가 모두 취소된 경우에도 예외 회수 (unretrieved 경고 방지)
+        if not task.cancelled():
+            task.exception()
+
+    async def get_json(self, url: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        GET → JSON (동일 요청 in-flight 공유)
+
+        httpx 예외는 그대로 전달 (호출 측에서 fallback 처리)
+        """
+        self.stats["requests"] += 1
+        self._get_client()
+
+        key = (url, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+        else:
+            self.stats["coalesced"] += 1
+
+        # 한 호출자가 취소돼도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "inflight": len(self._inflight)}
+
+
+# 싱글톤 인스턴스
+kasi_http = KasiHttpClient()
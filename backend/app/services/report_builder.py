@@ -28,6 +28,8 @@ from app.services.terminology_mapper import (
     get_business_prompt_rules,
 )
 from app.services.job_store import job_store, JobStore
+from app.services.topk_select import top_k, select_mmr
+from app.services.tag_matcher import get_tag_matcher, card_text
 
 # 🔥 v7: 품질 게이트 + 설문 + 스코어링 모듈
 from app.services.quality_gate import (
@@ -501,20 +503,18 @@ class GlobalRuleCardSelection:
     top100_card_ids: List[str]
 
 
-def score_rulecard_global(card: Dict[str, Any], feature_tags: List[str]) -> float:
-    score = 0.0
-    card_text = f"{card.get('topic', '')} {' '.join(card.get('tags', []))} {card.get('mechanism', '')} {card.get('action', '')}"
-    card_text_lower = card_text.lower()
-    
-    for ft in feature_tags:
-        if ft.lower() in card_text_lower:
-            score += 3.0
-    
-    for core_tag in BUSINESS_OWNER_CORE_TAGS:
-        if core_tag.lower() in card_text_lower:
-            score += 1.0
-    
-    return score
+def _global_tag_matcher(feature_tags: List[str]):
+    """FeatureTag(+3) + 사업가 핵심태그(+1) 를 한 오토마톤으로 (FeatureTags 별 캐시)"""
+    return get_tag_matcher(
+        list(feature_tags) + BUSINESS_OWNER_CORE_TAGS,
+        [3.0] * len(feature_tags) + [1.0] * len(BUSINESS_OWNER_CORE_TAGS)
+    )
+
+
+def score_rulecard_global(card: Dict[str, Any], feature_tags: List[str], matcher=None) -> float:
+    # 카드 텍스트(로드 시 소문자화) 1회 스캔
+    matcher = matcher or _global_tag_matcher(feature_tags)
+    return float(matcher.score(card_text(card).full))
 
 
 def select_global_top100(all_cards: List[Dict[str, Any]], feature_tags: List[str], top_limit: int = 100) -> GlobalRuleCardSelection:
@@ -522,9 +522,9 @@ def select_global_top100(all_cards: List[Dict[str, Any]], feature_tags: List[str
     if original_pool == 0:
         return GlobalRuleCardSelection(0, 0, [], [])
     
-    scored = [(score_rulecard_global(card, feature_tags), card) for card in all_cards]
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top100 = [card for _, card in scored[:top_limit]]
+    matcher = _global_tag_matcher(feature_tags)
+    scored = [(score_rulecard_global(card, feature_tags, matcher), card) for card in all_cards]
+    top100 = [card for _, card in top_k(scored, top_limit, key=lambda x: x[0])]
     top100_ids = [card.get("id", card.get("_id", f"card_{i}")) for i, card in enumerate(top100)]
     
     logger.info(f"[GlobalTop100] Pool={original_pool} → Top100={len(top100)}")
@@ -543,22 +543,42 @@ def allocate_rulecards_to_section(
     top100_cards: List[Dict[str, Any]],
     section_id: str,
     max_cards: int,
-    already_used_ids: set
+    already_used_ids: set,
+    mmr_penalty: Optional[float] = None
 ) -> SectionRuleCardAllocation:
-    section_tags = SECTION_WEIGHT_TAGS.get(section_id, [])
+    """
+    섹션 점수 상위 max_cards 장 분배
+
+    mmr_penalty: 이미 고른 카드와 태그/topic 이 겹칠수록 감점 (점수 단위, 0 → 점수순)
+                 None 이면 settings.rulecard_mmr_penalty
+    """
+    section_matcher = get_tag_matcher(SECTION_WEIGHT_TAGS.get(section_id, []))
+    if mmr_penalty is None:
+        mmr_penalty = get_settings().rulecard_mmr_penalty
     
-    scored = []
+    candidates = []
+    scores = []
     for card in top100_cards:
         cid = card.get("id", card.get("_id", ""))
         if cid in already_used_ids:
             continue
         
-        card_text = f"{card.get('topic', '')} {card.get('mechanism', '')} {card.get('action', '')}".lower()
-        section_score = sum(2.0 for st in section_tags if st.lower() in card_text)
-        scored.append((section_score, card))
+        section_score = 2.0 * section_matcher.score(card_text(card).section)
+        candidates.append(card)
+        scores.append(section_score)
+    
+    tag_sets = []
+    for card in candidates:
+        tags = card.get("tags") or []
+        tag_sets.append(frozenset([tags] if isinstance(tags, str) else tags))
     
-    scored.sort(key=lambda x: x[0], reverse=True)
-    allocated = [card for _, card in scored[:max_cards]]
+    picked = select_mmr(
+        scores, max_cards,
+        tags_of=tag_sets.__getitem__,
+        penalty=mmr_penalty,
+        topic_of=lambda i: candidates[i].get("topic", "")
+    )
+    allocated = [candidates[i] for i in picked]
     
     lines = []
     ids = []
@@ -14,6 +14,8 @@ import time
 from typing import Dict, Any, Optional, List
 
 from app.services.supabase_service import supabase_service, SECTION_SPECS
+from app.services.rulecards_store import CardView, RuleCard
+from app.services.selection_cache import selection_cache
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,9 @@ class ReportWorker:
         # 🔥 RuleCards 진단 로그
         if rulestore:
             card_count = len(getattr(rulestore, 'cards', [])) if hasattr(rulestore, 'cards') else 0
-            logger.info(f"[Worker] RuleStore 수신: total={card_count}장, id={id(rulestore)}")
+            # 잡 시작 시 받은 스토어(버전)를 끝까지 사용 → 도중 핫 리로드와 무관
+            logger.info(f"[Worker] RuleStore 수신: total={card_count}장, id={id(rulestore)}, "
+                        f"version={(getattr(rulestore, 'content_hash', None) or '')[:12]}")
         else:
             logger.warning(f"[Worker] ⚠️ RuleStore가 None!")
         
@@ -326,19 +330,42 @@ class ReportWorker:
         
         logger.info(f"[Worker] RuleStore.cards: {len(all_cards)}장")
         
+        # feature_tags 는 기둥/일간의 함수 → 같은 태그 + 같은 스토어 버전이면 캐시된 선택 재사용
+        if hasattr(rulestore, 'card_position'):
+            selected, _ = selection_cache.get_or_compute(
+                "worker",
+                tuple(feature_tags),
+                rulestore,
+                lambda: (self._pick_rulecards(rulestore, all_cards, feature_tags), feature_tags),
+            )
+        else:
+            selected = self._pick_rulecards(rulestore, all_cards, feature_tags)
+        # 메모리 저장소는 읽기 전용 뷰(CardView), SQLite 저장소는 본문을 여기서 조회
+        if hasattr(rulestore, 'card_dicts'):
+            return rulestore.card_dicts(selected)
+        return [self._card_to_dict(c) for c in selected]
+    
+    def _pick_rulecards(self, rulestore: Any, all_cards: List, feature_tags: List[str]) -> List:
+        """feature_tags 기반 카드 선택 (RuleCard 목록)"""
         # 🔥 feature_tags 기반 필터링 (간단 버전)
         if not feature_tags:
             # feature_tags 없으면 전체 중 priority 상위 100개
             sorted_cards = sorted(all_cards, key=lambda c: getattr(c, 'priority', 0), reverse=True)
             selected = sorted_cards[:100]
             logger.info(f"[Worker] feature_tags 없음 → priority 상위 {len(selected)}개 선택")
-            return [self._card_to_dict(c) for c in selected]
+            return selected
         
-        # feature_tags로 필터링
+        # feature_tags로 필터링 (역색인 있으면 태그를 공유한 카드만 검사)
         matched = []
         feature_set = set(t.lower() for t in feature_tags)
         
-        for card in all_cards:
+        candidates = all_cards
+        if getattr(rulestore, 'postings', None):
+            # 아래 필터가 소문자 비교 → 역색인도 소문자 기준으로 조회 (후보가 줄지 않음)
+            ids = rulestore.card_ids_for_lower(feature_tags)
+            candidates = [all_cards[i] for i in ids]
+        
+        for card in candidates:
             card_tags = getattr(card, 'tags', [])
             card_tags_lower = set(t.lower() for t in card_tags)
             
@@ -351,16 +378,18 @@ class ReportWorker:
             sorted_matched = sorted(matched, key=lambda c: getattr(c, 'priority', 0), reverse=True)
             selected = sorted_matched[:50]
             logger.info(f"[Worker] feature_tags 매칭: {len(matched)}개 중 {len(selected)}개 선택")
-            return [self._card_to_dict(c) for c in selected]
+            return selected
         
         # 🔥 매칭 없으면 fallback: priority 상위 50개
         sorted_cards = sorted(all_cards, key=lambda c: getattr(c, 'priority', 0), reverse=True)
         selected = sorted_cards[:50]
         logger.info(f"[Worker] feature_tags 매칭 없음 → fallback priority 상위 {len(selected)}개")
-        return [self._card_to_dict(c) for c in selected]
+        return selected
     
     def _card_to_dict(self, card) -> Dict:
-        """RuleCard를 dict로 변환"""
+        """RuleCard를 dict로 변환 (RuleCard 는 복사 없이 읽기 전용 뷰)"""
+        if isinstance(card, RuleCard):
+            return CardView(card)
         return {
             "id": getattr(card, 'id', ''),
             "topic": getattr(card, 'topic', ''),
@@ -371,6 +400,7 @@ class ReportWorker:
             "interpretation": getattr(card, 'interpretation', ''),
             "action": getattr(card, 'action', ''),
             "cautions": getattr(card, 'cautions', []),
+            "_text": getattr(card, 'text', None),
         }
     
     def _build_markdown(self, result_json: Dict) -> str:
@@ -0,0 +1,113 @@
+"""
+룰카드 희소 행렬 점수 계산 (CSR, NumPy)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 카드 × 토큰 CSR 행렬 (값 = idf), 행 번호 = store.cards 위치, 열 = store.vocab
+- 사용자 태그 / 섹션 포커스 태그 → 0/1 쿼리 벡터
+- score_card 의 total (idf 매칭 + 0.35·포커스 + 0.25·priority) 을
+  전체 카드에 대해 행렬-벡터 곱 한 번으로 계산
+- 행 안의 토큰은 card.tokens 정렬 순서 → 합산 순서가 score_card 와 같아 결과 동일
+- rulecard_selector 의 backend="matrix" 로 선택 (settings.rulecard_scoring_backend)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import logging
+from typing import Dict, Iterable, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from app.services.rulecards_store import RuleCardStore
+
+logger = logging.getLogger(__name__)
+
+FOCUS_WEIGHT = 0.35
+PRIORITY_WEIGHT = 0.25
+
+
+class RuleCardMatrix:
+    """
+    룰카드 CSR 행렬
+
+    - indptr / indices / data: 표준 CSR (data = 토큰 idf)
+    - rows: 0 아닌 원소별 행 번호 (bincount 로 행 합산)
+    - topic_ids[토픽]: by_topic 순서(priority 내림차순)의 카드 번호 배열
+    """
+
+    def __init__(self, store: RuleCardStore):
+        cards = store.cards
+        n = len(cards)
+        lengths = np.fromiter((len(c.token_ids) for c in cards), dtype=np.int64, count=n)
+
+        self.n_cards = n
+        self.n_tokens = len(store.vocab)
+        self.vocab = store.vocab
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        nnz = int(self.indptr[-1])
+        self.indices = np.fromiter(
+            (t for c in cards for t in c.token_ids), dtype=np.int32, count=nnz
+        )
+        self.data = np.fromiter(
+            (w for c in cards for w in c.token_idf), dtype=np.float64, count=nnz
+        )
+        self.rows = np.repeat(np.arange(n, dtype=np.int32), lengths)
+
+        self.priority = np.fromiter((c.priority for c in cards), dtype=np.float64, count=n)
+        self.topic_ids: Dict[str, "np.ndarray"] = {}
+        rank = np.asarray(store.topic_rank, dtype=np.int64)
+        for topic, pool in store.by_topic.items():
+            self.topic_ids[topic] = np.empty(len(pool), dtype=np.int64)
+        for cid, card in enumerate(cards):
+            self.topic_ids[card.topic][rank[cid]] = cid
+
+        logger.info(f"✅ RuleCard CSR: {n}장 × {self.n_tokens}토큰 (nnz={nnz})")
+
+    def query_vector(self, tokens: Iterable[str]) -> "np.ndarray":
+        """토큰 집합 → 0/1 쿼리 벡터 (사전에 없는 토큰은 무시)"""
+        q = np.zeros(self.n_tokens, dtype=np.float64)
+        ids = [self.vocab[t] for t in tokens if t in self.vocab]
+        if ids:
+            q[ids] = 1.0
+        return q
+
+    def matvec(self, q: "np.ndarray", weighted: bool = True) -> "np.ndarray":
+        """행렬(또는 0/1 패턴) × 쿼리 벡터 → 카드별 합"""
+        hits = q[self.indices]
+        weights = self.data * hits if weighted else hits
+        return np.bincount(self.rows, weights=weights, minlength=self.n_cards)
+
+    def score_user(self, user_tags: Iterable[str]) -> Dict[str, "np.ndarray"]:
+        """사용자 태그 부분 (섹션과 무관 → 리포트당 1회)"""
+        q = self.query_vector(user_tags)
+        return {
+            "overlap": self.matvec(q, weighted=False).astype(np.int64),
+            "matchScore": self.matvec(q, weighted=True),
+        }
+
+    def score(self, user: Dict[str, "np.ndarray"], focus_tags: Iterable[str]) -> Dict[str, "np.ndarray"]:
+        """score_user 결과 + 섹션 포커스 → 전체 카드 점수 배열"""
+        focus_hit = self.matvec(self.query_vector(focus_tags), weighted=False).astype(np.int64)
+        total = user["matchScore"] + (focus_hit * FOCUS_WEIGHT) + (self.priority * PRIORITY_WEIGHT)
+        return {**user, "focusHit": focus_hit, "total": total}
+
+    def rank(self, topic: str, total: "np.ndarray") -> "np.ndarray":
+        """토픽 카드 번호를 total 내림차순 (동점은 토픽 순서) 으로 정렬"""
+        ids = self.topic_ids.get(topic)
+        if ids is None or not len(ids):
+            return np.zeros(0, dtype=np.int64)
+        # topic_ids 는 이미 토픽 순서 → stable 정렬이면 동점 순서 유지
+        order = np.argsort(-total[ids], kind="stable")
+        return ids[order]
+
+
+def get_rulecard_matrix(store: RuleCardStore) -> Optional[RuleCardMatrix]:
+    """store 별 CSR 행렬 (최초 사용 시 생성, store.load 후 다시 생성)"""
+    if not NUMPY_AVAILABLE:
+        return None
+    matrix = getattr(store, "_matrix", None)
+    if matrix is None or matrix.n_cards != len(store.cards):
+        matrix = RuleCardMatrix(store)
+        store._matrix = matrix
+    return matrix
@@ -2,15 +2,18 @@
 RuleCard Scorer - 사업가형 핵심태그 50 기반 스코어링 엔진
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 각 섹션에 가장 관련 높은 Top-100 RuleCards 선발
-+ 다양성 보장 (topic 분산)
++ 다양성 보장 (topic 분산, 또는 태그 겹침 기반 MMR)
+- 선택은 topk_select 힙 → 전체 카드 정렬 없음
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 import logging
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, List, Set, Tuple, FrozenSet
 from dataclasses import dataclass, field
 from collections import defaultdict
 import random
 
+from app.services.topk_select import group_by, select_diverse, select_mmr
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,6 +137,17 @@ class ScoredCard:
         return self.score + self.diversity_bonus
 
 
+@dataclass(frozen=True)
+class _PreparedCard:
+    """섹션과 무관한 카드 특징 (score_all_sections 에서 1회 계산)"""
+    card_id: str
+    topic: str
+    subtopic: str
+    core: Tuple[Tuple[str, int], ...]  # (핵심태그, 기본 가중치), 카드 태그 순서
+    feature_bonus: int
+    tag_set: FrozenSet[str] = frozenset()  # MMR 유사도용
+
+
 @dataclass 
 class SectionCards:
     """섹션별 선택된 카드들"""
@@ -155,9 +169,11 @@ class RuleCardScorer:
         self,
         cards_per_section: int = 100,
         min_diversity_ratio: float = 0.3,  # 최소 다양성 (topic 분산)
+        mmr_penalty: float = 0.0,  # > 0 이면 MMR 선택 (태그/topic 겹침 감점, 점수 단위)
     ):
         self.cards_per_section = cards_per_section
         self.min_diversity_ratio = min_diversity_ratio
+        self.mmr_penalty = mmr_penalty
     
     def score_cards_for_section(
         self,
@@ -178,65 +194,97 @@ class RuleCardScorer:
         Returns:
             SectionCards: 선택된 카드들 + 메타데이터
         """
-        existing_topics = existing_topics or set()
-        
-        # 섹션별 태그 가중치 가져오기
-        section_weights = SECTION_TAG_WEIGHTS.get(section_id, {})
-        
-        scored_cards: List[ScoredCard] = []
+        prepared = self._prepare_cards(all_cards, feature_tags)
+        return self._score_prepared(prepared, section_id, existing_topics or set(), self._topic_groups(prepared))
+    
+    def _prepare_cards(
+        self,
+        all_cards: List[Dict[str, Any]],
+        feature_tags: List[str]
+    ) -> List[_PreparedCard]:
+        """섹션과 무관한 부분 1회 계산 (핵심태그 매칭, FeatureTags 보너스)"""
+        prepared: List[_PreparedCard] = []
         
         for card in all_cards:
-            card_id = card.get("id", "")
-            topic = card.get("topic", "")
-            subtopic = card.get("subtopic", "")
             card_tags = card.get("tags", [])
-            
             if isinstance(card_tags, str):
                 card_tags = [card_tags]
             
-            # 1. 기본 점수: 사업가 핵심 태그 50 매칭
-            base_score = 0.0
-            matched_tags = []
+            # 1. 사업가 핵심 태그 50 매칭 (카드 태그 순서 유지, 섹션 가중치는 나중에)
+            core = tuple(
+                (tag, BUSINESS_CORE_TAGS_50[tag]) for tag in card_tags if tag in BUSINESS_CORE_TAGS_50
+            )
+            
+            # 2. FeatureTags 매칭 보너스 (매칭당 +5점)
+            tag_set = set(card_tags)
+            feature_bonus = sum(1 for ft in feature_tags if ft in tag_set) * 5
             
-            for tag in card_tags:
-                if tag in BUSINESS_CORE_TAGS_50:
-                    tag_score = BUSINESS_CORE_TAGS_50[tag]
-                    
+            prepared.append(_PreparedCard(
+                card_id=card.get("id", ""),
+                topic=card.get("topic", ""),
+                subtopic=card.get("subtopic", ""),
+                core=core,
+                feature_bonus=feature_bonus,
+                tag_set=frozenset(tag_set) if self.mmr_penalty > 0 else frozenset()
+            ))
+        
+        return prepared
+    
+    def _score_prepared(
+        self,
+        prepared: List[_PreparedCard],
+        section_id: str,
+        existing_topics: Set[str],
+        topic_groups: Dict[str, List[int]]
+    ) -> SectionCards:
+        """미리 계산한 카드 특징 + 섹션 가중치/Topic/다양성 보너스 → Top-N"""
+        section_weights = SECTION_TAG_WEIGHTS.get(section_id, {})
+        
+        # 같은 핵심태그 조합 / 같은 topic 은 섹션당 1회만 계산
+        base_by_core: Dict[Tuple, float] = {(): 0.0}
+        topic_bonus_by_topic: Dict[str, float] = {}
+        
+        scores: List[float] = []
+        diversity: List[float] = []
+        finals: List[float] = []
+        for p in prepared:
+            base_score = base_by_core.get(p.core)
+            if base_score is None:
+                base_score = 0.0
+                for tag, tag_score in p.core:
                     # 섹션별 가중치 적용
                     if tag in section_weights:
                         tag_score *= section_weights[tag]
-                    
                     base_score += tag_score
-                    matched_tags.append(tag)
-            
-            # 2. FeatureTags 매칭 보너스
-            feature_match_count = sum(1 for ft in feature_tags if ft in card_tags)
-            feature_bonus = feature_match_count * 5  # 매칭당 +5점
+                base_by_core[p.core] = base_score
             
             # 3. Topic 관련성 보너스
-            topic_bonus = self._get_topic_relevance(topic, section_id)
+            topic_bonus = topic_bonus_by_topic.get(p.topic)
+            if topic_bonus is None:
+                topic_bonus = topic_bonus_by_topic[p.topic] = self._get_topic_relevance(p.topic, section_id)
             
             # 4. 다양성 보너스 (이미 선택된 topic이 아니면 가산점)
-            diversity_bonus = 0.0
-            if topic and topic not in existing_topics:
-                diversity_bonus = 3.0
+            diversity_bonus = 3.0 if p.topic and p.topic not in existing_topics else 0.0
             
-            total_score = base_score + feature_bonus + topic_bonus
-            
-            scored_cards.append(ScoredCard(
-                card_id=card_id,
-                topic=topic,
-                subtopic=subtopic,
-                score=total_score,
-                matched_tags=matched_tags,
-                diversity_bonus=diversity_bonus
-            ))
-        
-        # 5. 점수순 정렬
-        scored_cards.sort(key=lambda c: c.final_score, reverse=True)
-        
-        # 6. 다양성 보장하면서 Top-N 선택
-        selected = self._select_with_diversity(scored_cards)
+            total_score = base_score + p.feature_bonus + topic_bonus
+            scores.append(total_score)
+            diversity.append(diversity_bonus)
+            finals.append(total_score + diversity_bonus)
+        
+        # 5~6. 다양성 보장하면서 Top-N 선택 (힙, 동점은 원래 순서)
+        #      선택된 카드만 ScoredCard 생성
+        picked = self._select(prepared, finals, topic_groups)
+        selected = [
+            ScoredCard(
+                card_id=prepared[i].card_id,
+                topic=prepared[i].topic,
+                subtopic=prepared[i].subtopic,
+                score=scores[i],
+                matched_tags=[tag for tag, _ in prepared[i].core],
+                diversity_bonus=diversity[i]
+            )
+            for i in picked
+        ]
         
         # 7. 통계 계산
         topic_dist = defaultdict(int)
@@ -275,58 +323,38 @@ class RuleCardScorer:
         
         return 0.0
     
-    def _select_with_diversity(
+    @staticmethod
+    def _topic_groups(prepared: List[_PreparedCard]) -> Dict[str, List[int]]:
+        """topic → 카드 번호 (섹션 공통)"""
+        return group_by(len(prepared), lambda i: prepared[i].topic)
+    
+    def _select(
         self,
-        scored_cards: List[ScoredCard]
-    ) -> List[ScoredCard]:
+        prepared: List[_PreparedCard],
+        finals: List[float],
+        topic_groups: Dict[str, List[int]]
+    ) -> List[int]:
         """
-        다양성을 보장하면서 Top-N 선택
+        다양성을 보장하면서 Top-N 선택 (카드 번호 반환)
         
-        전략:
+        전략 (기본):
         1. 상위 50%는 점수순으로 선택
-        2. 나머지 50%는 topic 다양성 고려해서 선택
-        """
-        if not scored_cards:
-            return []
-        
-        target_count = min(self.cards_per_section, len(scored_cards))
-        top_half = int(target_count * 0.5)
-        
-        # 1. 상위 50%는 점수순
-        selected = scored_cards[:top_half]
-        used_topics = {c.topic for c in selected}
-        
-        # 2. 나머지는 다양성 고려
-        remaining = scored_cards[top_half:]
-        
-        # Topic별로 그룹화
-        by_topic: Dict[str, List[ScoredCard]] = defaultdict(list)
-        for card in remaining:
-            by_topic[card.topic].append(card)
+        2. 나머지 50%는 topic 라운드로빈 (아직 선택되지 않은 topic 우선)
         
-        # 아직 선택되지 않은 topic 우선 + 라운드로빈
-        unused_topics = [t for t in by_topic.keys() if t not in used_topics]
-        used_topic_list = list(used_topics & set(by_topic.keys()))
-        
-        # 순서: 미사용 topic -> 사용 topic
-        topic_order = unused_topics + used_topic_list
-        
-        while len(selected) < target_count:
-            added_any = False
-            
-            for topic in topic_order:
-                if len(selected) >= target_count:
-                    break
-                
-                if by_topic[topic]:
-                    card = by_topic[topic].pop(0)
-                    selected.append(card)
-                    added_any = True
-            
-            if not added_any:
-                break
-        
-        return selected
+        mmr_penalty > 0: 이미 선택된 카드와 태그/topic 이 겹칠수록 감점하며 선택
+        """
+        if self.mmr_penalty > 0:
+            return select_mmr(
+                finals, self.cards_per_section,
+                tags_of=lambda i: prepared[i].tag_set,
+                penalty=self.mmr_penalty,
+                topic_of=lambda i: prepared[i].topic
+            )
+        return select_diverse(
+            finals, self.cards_per_section,
+            topic_of=lambda i: prepared[i].topic,
+            groups=topic_groups
+        )
     
     def score_all_sections(
         self,
@@ -351,13 +379,12 @@ class RuleCardScorer:
         results = {}
         used_topics: Set[str] = set()
         
+        # 태그 분해/핵심태그/FeatureTags 매칭은 전체 섹션 공통 → 1회
+        prepared = self._prepare_cards(all_cards, feature_tags)
+        topic_groups = self._topic_groups(prepared)
+        
         for section_id in section_ids:
-            section_cards = self.score_cards_for_section(
-                all_cards=all_cards,
-                section_id=section_id,
-                feature_tags=feature_tags,
-                existing_topics=used_topics
-            )
+            section_cards = self._score_prepared(prepared, section_id, used_topics, topic_groups)
             
             results[section_id] = section_cards
             
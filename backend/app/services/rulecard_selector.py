@@ -1,84 +1,238 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Tuple
+from heapq import merge
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from ..config import get_settings
 from .rulecards_store import RuleCardStore, RuleCard, canon_tag, explode_tag_tokens
+from .rulecard_matrix import RuleCardMatrix, get_rulecard_matrix
 
 def score_card(store: RuleCardStore, card: RuleCard, user_tags: Set[str], focus_tags: Set[str]) -> Dict:
-    tokens = set()
-    for t in card.tags:
-        for x in explode_tag_tokens(t):
-            tokens.add(x)
+    tokens, weights = card.tokens, card.token_idf
+    if not tokens:
+        # store.load 를 거치지 않은 카드
+        tokens = tuple(sorted(RuleCardStore._card_tokens(card)))
+        weights = tuple(store.idf.get(t, 1.0) for t in tokens)
 
     overlap = 0
     match_score = 0.0
     focus_hit = 0
 
-    for t in tokens:
+    for t, w in zip(tokens, weights):
         if t in user_tags:
             overlap += 1
-            match_score += store.idf.get(t, 1.0)
+            match_score += w
         if t in focus_tags:
             focus_hit += 1
 
     total = match_score + (focus_hit * 0.35) + (card.priority * 0.25)
     return {"overlap": overlap, "matchScore": match_score, "focusHit": focus_hit, "total": total}
 
-def select_cards_for_preset(store: RuleCardStore, preset: Dict, feature_tags: List[str]) -> Dict:
+def _accumulate(store: RuleCardStore, tokens: Set[str], weighted: bool) -> Dict[int, List[float]]:
+    """
+    역색인 순회 → {카드 번호: [겹친 토큰 수, idf 합]}
+    토큰을 하나도 공유하지 않는 카드는 건드리지 않음
+    """
+    acc: Dict[int, List[float]] = {}
+    # 정렬 순서로 누적 → 카드별 idf 합산 순서가 score_card(정렬된 card.tokens)와 같음
+    for t in sorted(tokens):
+        lst = store.postings.get(t)
+        if lst is None:
+            continue
+        w = store.idf.get(t, 1.0) if weighted else 0.0
+        for cid in lst:
+            a = acc.get(cid)
+            if a is None:
+                acc[cid] = [1, w]
+            else:
+                a[0] += 1
+                a[1] += w
+    return acc
+
+def _score_from_index(card: RuleCard, user_acc: Dict[int, List[float]], focus_acc: Dict[int, List[float]], cid: int) -> Dict:
+    """score_card 와 같은 결과 (역색인 누적값 사용)"""
+    u = user_acc.get(cid)
+    overlap, match_score = (int(u[0]), u[1]) if u else (0, 0.0)
+    f = focus_acc.get(cid)
+    focus_hit = int(f[0]) if f else 0
+    total = match_score + (focus_hit * 0.35) + (card.priority * 0.25)
+    return {"overlap": overlap, "matchScore": match_score, "focusHit": focus_hit, "total": total}
+
+def _stages_index(
+    store: RuleCardStore,
+    touched: List[Tuple[RuleCard, Dict, int]],
+    pool_topic: str,
+    used: Set[str],
+) -> Tuple[Iterable, Iterable, Iterable, Iterable]:
+    """역색인 경로: 토큰을 공유한 카드만 정렬, 나머지는 s4 에서 토픽 순서로 병합"""
+    # 점수 내림차순, 동점은 토픽 내 순위(priority 내림차순) 순
+    ranked = [x for x in touched if x[0].id not in used]
+    ranked.sort(key=lambda x: (-x[1]["total"], x[2]))
+
+    def untouched() -> Iterator[Tuple[RuleCard, Dict, int]]:
+        # 토큰 미공유 카드: total = priority * 0.25 → 토픽 순서가 곧 점수 순서
+        touched_ids = {id(x[0]) for x in touched}
+        for r, c in enumerate(store.by_topic.get(pool_topic, [])):
+            if id(c) not in touched_ids:
+                yield c, {"overlap": 0, "matchScore": 0.0, "focusHit": 0, "total": c.priority * 0.25}, r
+
+    return (
+        [x for x in ranked if x[1]["overlap"] >= 2],        # 정밀
+        [x for x in ranked if x[1]["overlap"] >= 1],        # 완화
+        [x for x in ranked if x[1]["focusHit"] >= 1],       # 섹션 포커스
+        merge(ranked, untouched(), key=lambda x: (-x[1]["total"], x[2])),
+    )
+
+def _score_from_matrix(scores: Dict, cid: int) -> Dict:
+    """CSR 점수 배열 → score_card 와 같은 형태"""
+    return {
+        "overlap": int(scores["overlap"][cid]),
+        "matchScore": float(scores["matchScore"][cid]),
+        "focusHit": int(scores["focusHit"][cid]),
+        "total": float(scores["total"][cid]),
+    }
+
+def _stage_trigger(
+    store: RuleCardStore,
+    cids: Iterable[int],
+    score_of: Callable[[int], Dict],
+) -> List[Tuple[RuleCard, Dict, int]]:
+    """trigger 하드 매칭 카드: 조건 수 내림차순(더 구체적인 카드 먼저), 점수 내림차순, 토픽 내 순위 순"""
+    arity, topic_rank = store.trigger_arity, store.topic_rank
+    scored = [(cid, score_of(cid)) for cid in cids]
+    scored.sort(key=lambda x: (-arity[x[0]], -x[1]["total"], topic_rank[x[0]]))
+    return [(store.cards[cid], s, topic_rank[cid]) for cid, s in scored]
+
+def _stages_matrix(
+    store: RuleCardStore,
+    matrix: RuleCardMatrix,
+    scores: Dict,
+    pool_topic: str,
+) -> Tuple[Iterable, Iterable, Iterable, Iterable]:
+    """CSR 경로: 전체 카드 점수 배열에서 토픽 카드만 정렬 후 단계별 마스크"""
+    ordered = matrix.rank(pool_topic, scores["total"])
+
+    def rows(ids) -> Iterator[Tuple[RuleCard, Dict, int]]:
+        for cid in ids.tolist():
+            yield store.cards[cid], _score_from_matrix(scores, cid), 0
+
+    return (
+        rows(ordered[scores["overlap"][ordered] >= 2]),
+        rows(ordered[scores["overlap"][ordered] >= 1]),
+        rows(ordered[scores["focusHit"][ordered] >= 1]),
+        rows(ordered),
+    )
+
+def select_cards_for_preset(
+    store: RuleCardStore,
+    preset: Dict,
+    feature_tags: List[str],
+    backend: Optional[str] = None,
+    as_cards: bool = False,
+    trigger_features: Optional[Dict[str, str]] = None,
+) -> Dict:
+    """
+    preset 섹션별 룰카드 선택
+
+    backend: "index"(역색인, 기본) | "matrix"(CSR 행렬, NumPy 필요)
+             None 이면 settings.rulecard_scoring_backend
+    as_cards: True 면 섹션 "cards" 를 dict 대신 RuleCard 객체로 (selection_cache 용)
+    trigger_features: 원국 특징 (rulecard_triggers.chart_trigger_features)
+                      주어지면 trigger 하드 조건을 전부 만족하는 카드를 태그 겹침보다 먼저 (s0)
+    """
+    backend = backend or get_settings().rulecard_scoring_backend
+    matrix = get_rulecard_matrix(store) if backend == "matrix" else None
+
     used: Set[str] = set()
     user_tags: Set[str] = set()
     for t in feature_tags:
         for x in explode_tag_tokens(t):
             user_tags.add(x)
 
+    # 사용자 태그 누적은 섹션과 무관 → 1회
+    if matrix is not None:
+        user_scores = matrix.score_user(user_tags)
+    else:
+        user_acc = _accumulate(store, user_tags, weighted=True)
+    cards = store.cards
+    topic_rank = store.topic_rank
+
+    # trigger 하드 매칭은 섹션과 무관 → 역색인 조회 1회, 토픽별로 나눠 둠
+    trigger_hits: Dict[str, List[int]] = {}
+    if trigger_features:
+        for cid in store.trigger_matches(trigger_features):
+            trigger_hits.setdefault(cards[cid].topic, []).append(cid)
+
     out_sections = []
     for sec in preset["sections"]:
         focus = set(canon_tag(x) for x in sec["focusTags"])
         sec_cards: List[RuleCard] = []
-        by_stage = {"s1":0,"s2":0,"s3":0,"s4":0}
+        sec_scores: List[Dict] = []
+        by_stage = {"s0":0,"s1":0,"s2":0,"s3":0,"s4":0}
+
+        if matrix is not None:
+            scores = matrix.score(user_scores, focus)
+
+            def score_of(cid: int) -> Dict:
+                return _score_from_matrix(scores, cid)
+        else:
+            focus_acc = _accumulate(store, focus, weighted=False)
+            # 토큰을 공유한 카드 중 섹션이 쓰는 토픽만 점수 계산
+            sec_topics = {tq["topic"] for tq in sec["perTopic"]}
+            if "HEALTH" in sec_topics:
+                sec_topics.add("ELEMENTS")
+            touched_by_topic: Dict[str, List[Tuple[RuleCard, Dict, int]]] = {}
+            for cid in user_acc.keys() | focus_acc.keys():
+                c = cards[cid]
+                if c.topic not in sec_topics:
+                    continue
+                touched_by_topic.setdefault(c.topic, []).append(
+                    (c, _score_from_index(c, user_acc, focus_acc, cid), topic_rank[cid])
+                )
+
+            def score_of(cid: int) -> Dict:
+                return _score_from_index(cards[cid], user_acc, focus_acc, cid)
 
         for tq in sec["perTopic"]:
             topic = tq["topic"]
             k = int(tq["k"])
 
-            pool = [c for c in store.by_topic.get(topic, []) if c.id not in used]
-
+            pool_topic = topic
             # HEALTH 토픽이 부족하면 ELEMENTS에서 보충
-            if topic == "HEALTH" and len(pool) < k:
-                pool = [c for c in store.by_topic.get("ELEMENTS", []) if c.id not in used]
-
-            ranked: List[Tuple[RuleCard, Dict]] = []
-            for c in pool:
-                s = score_card(store, c, user_tags, focus)
-                ranked.append((c, s))
-            ranked.sort(key=lambda x: x[1]["total"], reverse=True)
-
-            s1 = [x for x in ranked if x[1]["overlap"] >= 2]        # 정밀
-            s2 = [x for x in ranked if x[1]["overlap"] >= 1]        # 완화
-            s3 = [x for x in ranked if x[1]["focusHit"] >= 1]       # 섹션 포커스
+            if topic == "HEALTH" and sum(1 for c in store.by_topic.get(topic, []) if c.id not in used) < k:
+                pool_topic = "ELEMENTS"
+
+            if matrix is not None:
+                s1, s2, s3, s4 = _stages_matrix(store, matrix, scores, pool_topic)
+            else:
+                s1, s2, s3, s4 = _stages_index(store, touched_by_topic.get(pool_topic, []), pool_topic, used)
             need = k
             got = 0
 
             def pick(lst, stage):
                 nonlocal got
-                for c, _s in lst:
+                for c, _s, _r in lst:
                     if got >= need: break
                     if c.id in used: continue
                     used.add(c.id)
                     sec_cards.append(c)
+                    sec_scores.append(_s)
                     by_stage[stage] += 1
                     got += 1
 
+            if trigger_hits.get(pool_topic):
+                pick(_stage_trigger(store, trigger_hits[pool_topic], score_of), "s0")
             pick(s1, "s1")
             pick(s2, "s2")
             pick(s3, "s3")
-            pick(ranked, "s4")
+            if got < need:
+                pick(s4, "s4")
 
-        overlaps = [score_card(store, c, user_tags, focus)["overlap"] for c in sec_cards]
+        overlaps = [s["overlap"] for s in sec_scores]
         avg_overlap = round(sum(overlaps)/len(overlaps), 2) if overlaps else 0.0
 
         out_sections.append({
             "key": sec["key"],
             "title": sec["title"],
-            "cards": [c.__dict__ for c in sec_cards],
+            "cards": sec_cards if as_cards else store.card_dicts(sec_cards),
             "meta": {
                 "target": sec["totalTarget"],
                 "picked": len(sec_cards),
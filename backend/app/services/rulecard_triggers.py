@@ -0,0 +1,131 @@
+"""
+룰카드 trigger 하드 조건 정규화
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 카드 trigger dict 중 원국에서 바로 판정되는 조건만 (key, 값) 으로 정규화
+  (tools/generate_2026_report_v0_2.1.py 의 trigger_hard_match 와 같은 키)
+    day_master   : 일간 천간      ("병화", "丙", "병" → "丙")
+    day_pillar   : 일주           ("기묘일주", "기묘" → "己卯")
+    month_pillar : 월주           ("병인월" → "丙寅")
+    month_branch : 월지           ("인월", "인", "인목" → "寅")
+  별칭: daymaster / day_stem → day_master, month → month_branch (또는 month_pillar)
+- 값은 한자 간지로 통일 → 원국 특징(chart_trigger_features)과 문자열 비교 1번
+- 하드 키 값을 해석할 수 없는 카드("4월", "토", "비견" 등)는 인덱스에서 제외
+  (오프라인 trigger_hard_match 도 문자열이 다르면 불일치 → 보수적으로 같게 처리)
+- RuleCardStore.trigger_postings[(key, 값)] = 카드 번호 → 매칭은 사전 조회 몇 번
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .feature_tags_no_time import (
+    BRANCH_TO_TAG, HANGUL_TO_HANJA_BRANCH, HANGUL_TO_HANJA_STEM, HANJA_BRANCH, HANJA_STEM,
+    STEM_TO_TAG, to_hanja_pillar,
+)
+
+Condition = Tuple[str, str]
+
+# 조건 없음으로 취급하는 값
+WILDCARDS = frozenset({"", "any", "all", "*"})
+
+
+def _stem(s: str) -> Optional[str]:
+    """"병화" / "병" / "丙" → "丙" """
+    head = HANGUL_TO_HANJA_STEM.get(s[:1], s[:1])
+    if head not in STEM_TO_TAG:
+        return None
+    if len(s) == 1 or s == STEM_TO_TAG[head]:
+        return head
+    return None
+
+
+def _branch(s: str) -> Optional[str]:
+    """"인월" / "인" / "인목" / "寅" → "寅" """
+    s = s.removesuffix("월")
+    head = HANGUL_TO_HANJA_BRANCH.get(s[:1], s[:1])
+    if head not in BRANCH_TO_TAG:
+        return None
+    if len(s) == 1 or s == BRANCH_TO_TAG[head]:
+        return head
+    return None
+
+
+def _pillar(s: str) -> Optional[str]:
+    """"기묘일주" / "병인월" / "기묘" / "己卯" → 60갑자 한자 (음양이 안 맞으면 None)"""
+    for suffix in ("일주", "월"):
+        s = s.removesuffix(suffix)
+    if len(s) != 2:
+        return None
+    p = to_hanja_pillar(s)
+    if p[0] not in STEM_TO_TAG or p[1] not in BRANCH_TO_TAG:
+        return None
+    if HANJA_STEM.index(p[0]) % 2 != HANJA_BRANCH.index(p[1]) % 2:
+        return None
+    return p
+
+
+def _pillar_or_branch(s: str) -> Optional[Condition]:
+    p = _pillar(s)
+    if p is not None:
+        return "month_pillar", p
+    b = _branch(s)
+    return ("month_branch", b) if b is not None else None
+
+
+def _day_master(s: str) -> Optional[Condition]:
+    v = _stem(s)
+    return ("day_master", v) if v is not None else None
+
+
+def _day_pillar(s: str) -> Optional[Condition]:
+    v = _pillar(s)
+    return ("day_pillar", v) if v is not None else None
+
+
+# trigger 키 → 정규화 함수 ((key, 값) 또는 해석 불가 None)
+HARD_TRIGGER_KEYS = {
+    "day_master": _day_master,
+    "daymaster": _day_master,
+    "day_stem": _day_master,
+    "day_pillar": _day_pillar,
+    "month_pillar": _pillar_or_branch,
+    "month_branch": _pillar_or_branch,
+    "month": _pillar_or_branch,
+}
+
+
+def hard_conditions(trigger: Any) -> Optional[FrozenSet[Condition]]:
+    """
+    카드 trigger → 하드 조건 집합
+
+    Returns:
+        조건 집합 (모두 만족해야 매칭), 하드 조건이 없거나 해석 불가 값이 있으면 None
+    """
+    if not isinstance(trigger, dict):
+        return None
+    out = set()
+    for key, value in trigger.items():
+        norm = HARD_TRIGGER_KEYS.get(key)
+        if norm is None:
+            continue
+        if not isinstance(value, str):
+            return None
+        s = value.strip()
+        if s.lower() in WILDCARDS:
+            continue
+        cond = norm(s)
+        if cond is None:
+            return None
+        out.add(cond)
+    return frozenset(out) if out else None
+
+
+def chart_trigger_features(month_pillar: str, day_pillar: str) -> Dict[str, str]:
+    """원국 기둥(한글/한자) → 하드 조건 비교용 특징 {key: 한자 값}"""
+    m, d = to_hanja_pillar(month_pillar), to_hanja_pillar(day_pillar)
+    return {
+        "day_master": d[0],
+        "day_pillar": d,
+        "month_pillar": m,
+        "month_branch": m[1],
+    }
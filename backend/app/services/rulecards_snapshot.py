@@ -0,0 +1,250 @@
+"""
+룰카드 바이너리 스냅샷 (컬럼형 + 문자열 테이블, mmap 로드)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- tools/build_rulecards_snapshot.py 로 JSONL → 스냅샷 생성
+- 카드 필드 + 토큰/idf/역색인/토픽 순위를 빌드 때 1회 계산해 저장
+  → 부팅/워커마다 JSON 파싱, 토큰 분해, idf 계산 없음
+- 헤더에 원본 JSONL sha256 → 내용이 바뀌면 stale 로 보고 JSONL 로드
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# ============ 파일 포맷 ============
+# 헤더: magic(8) + 버전(u32) + 원본 sha256(32) + 카드 수(u32) + 문자열 수(u32) + 토큰 수(u32)
+# 섹션 테이블: SECTIONS 순서대로 (바이트 오프셋 u64, 바이트 길이 u64)
+# 섹션 본문: 8바이트 정렬, 정수/실수 배열은 little-endian
+#
+# 문자열 테이블: str_blob(UTF-8, "\x00" 구분) + str_offsets(코드포인트 오프셋, 문자열 수 + 1)
+#   "\x00" 이 든 문자열이 있으면 split 대신 오프셋으로 자름
+# 문자열 참조는 u32 번호, NONE = 값 없음(None)
+# card_text: tag_matcher.CardText (소문자 검색 텍스트 + 구간 오프셋) 도 빌드 때 계산
+# trigger / cautions 는 값 형태가 제각각 → 카드 순서 JSON 배열 하나로 저장
+
+SNAPSHOT_MAGIC = b"SAJURC01"
+# 포맷 또는 토큰 분해/idf/검색 텍스트 규칙이 바뀌면 올림 (기존 스냅샷은 stale 처리)
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct("<8sI32sIII")
+SECTION = struct.Struct("<QQ")
+NONE = 0xFFFFFFFF
+
+# (섹션 이름, array typecode / "bytes")
+SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("str_offsets", "I"),
+    ("str_blob", "bytes"),
+    ("card_id", "I"),
+    ("card_topic", "I"),
+    ("card_priority", "d"),
+    ("card_mechanism", "I"),
+    ("card_interpretation", "I"),
+    ("card_action", "I"),
+    ("card_text", "I"),
+    ("card_text_topic_end", "I"),
+    ("card_text_body_start", "I"),
+    ("card_tags_ptr", "I"),
+    ("card_tags", "I"),
+    ("card_token_ptr", "I"),
+    ("card_token_ids", "I"),
+    ("card_trigger_json", "bytes"),
+    ("card_cautions_json", "bytes"),
+    ("vocab", "I"),          # 토큰 id 순서의 문자열 번호
+    ("idf", "d"),            # 토큰 id 별 idf
+    ("postings_ptr", "I"),   # 토큰 id 별 역색인 구간
+    ("postings", "i"),
+    ("topic_rank", "i"),
+)
+
+
+def snapshot_path_for(jsonl_path: str) -> str:
+    """JSONL 옆 기본 스냅샷 경로 (sajuos_master_db.jsonl → sajuos_master_db.rcsnap)"""
+    return str(Path(jsonl_path).with_suffix(".rcsnap"))
+
+
+def source_hash(path: str) -> bytes:
+    """원본 JSONL sha256 (stale 판정용)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _native_ok() -> bool:
+    """array 를 그대로 쓸 수 있는 플랫폼인지 (little-endian, I/i=4바이트, d=8바이트)"""
+    return (
+        sys.byteorder == "little"
+        and array("I").itemsize == 4
+        and array("i").itemsize == 4
+        and array("d").itemsize == 8
+    )
+
+
+# ============ 쓰기 (빌드 도구) ============
+
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def ref(self, s: Optional[str]) -> int:
+        if s is None:
+            return NONE
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+
+def write_snapshot(store, out_path: str, digest: bytes) -> int:
+    """
+    로드된 RuleCardStore → 스냅샷 파일 (원자적 교체)
+
+    Returns:
+        파일 크기 (bytes)
+    """
+    if not _native_ok():
+        raise RuntimeError("little-endian 플랫폼에서만 스냅샷 생성 가능")
+
+    cards = store.cards
+    st = _StringTable()
+    vocab_tokens = sorted(store.vocab, key=store.vocab.__getitem__)
+
+    parts: Dict[str, Any] = {
+        "card_id": array("I", (st.ref(c.id) for c in cards)),
+        "card_topic": array("I", (st.ref(c.topic) for c in cards)),
+        "card_priority": array("d", (c.priority for c in cards)),
+        "card_mechanism": array("I", (st.ref(c.mechanism) for c in cards)),
+        "card_interpretation": array("I", (st.ref(c.interpretation) for c in cards)),
+        "card_action": array("I", (st.ref(c.action) for c in cards)),
+        "card_text": array("I", (st.ref(c.text.full) for c in cards)),
+        "card_text_topic_end": array("I", (c.text.topic_end for c in cards)),
+        "card_text_body_start": array("I", (c.text.body_start for c in cards)),
+        "card_tags_ptr": array("I", [0]),
+        "card_tags": array("I"),
+        "card_token_ptr": array("I", [0]),
+        "card_token_ids": array("I"),
+        "card_trigger_json": json.dumps([c.trigger for c in cards], ensure_ascii=False).encode("utf-8"),
+        "card_cautions_json": json.dumps([c.cautions for c in cards], ensure_ascii=False).encode("utf-8"),
+        "vocab": array("I", (st.ref(t) for t in vocab_tokens)),
+        "idf": array("d", (store.idf[t] for t in vocab_tokens)),
+        "postings_ptr": array("I", [0]),
+        "postings": array("i"),
+        "topic_rank": array("i", store.topic_rank),
+    }
+    for c in cards:
+        parts["card_tags"].extend(st.ref(t) for t in c.tags)
+        parts["card_tags_ptr"].append(len(parts["card_tags"]))
+        parts["card_token_ids"].extend(c.token_ids)
+        parts["card_token_ptr"].append(len(parts["card_token_ids"]))
+    for t in vocab_tokens:
+        parts["postings"].extend(store.postings.get(t, ()))
+        parts["postings_ptr"].append(len(parts["postings"]))
+
+    offsets = array("I", [0])
+    for s in st.strings:
+        offsets.append(offsets[-1] + len(s) + 1)
+    parts["str_offsets"] = offsets
+    parts["str_blob"] = "\x00".join(st.strings).encode("utf-8")
+
+    # 섹션 배치 (8바이트 정렬)
+    pos = HEADER.size + SECTION.size * len(SECTIONS)
+    table = []
+    blobs = []
+    for name, _tc in SECTIONS:
+        pos = (pos + 7) & ~7
+        data = parts[name] if isinstance(parts[name], bytes) else parts[name].tobytes()
+        table.append((pos, len(data)))
+        blobs.append((pos, data))
+        pos += len(data)
+
+    buf = bytearray(pos)
+    HEADER.pack_into(buf, 0, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, digest,
+                     len(cards), len(st.strings), len(vocab_tokens))
+    for i, (off, length) in enumerate(table):
+        SECTION.pack_into(buf, HEADER.size + i * SECTION.size, off, length)
+    for off, data in blobs:
+        buf[off:off + len(data)] = data
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+    os.replace(tmp_path, out_path)
+    return len(buf)
+
+
+# ============ 읽기 (런타임) ============
+
+class RuleCardSnapshot:
+    """
+    mmap 으로 연 스냅샷
+
+    - digest: 빌드 시 원본 JSONL sha256
+    - section(name): 섹션 memoryview (정수/실수 배열은 cast, 복사 없음)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < HEADER.size + SECTION.size * len(SECTIONS):
+            raise ValueError(f"룰카드 스냅샷 크기 불일치: {path}")
+
+        magic, version, digest, n_cards, n_strings, n_tokens = HEADER.unpack_from(self._mm, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"룰카드 스냅샷 포맷 불일치: {path}")
+
+        self.digest = digest
+        self.n_cards = n_cards
+        self.n_strings = n_strings
+        self.n_tokens = n_tokens
+        self._mv = memoryview(self._mm)
+        self._sections: Dict[str, Tuple[int, int, str]] = {}
+        for i, (name, tc) in enumerate(SECTIONS):
+            off, length = SECTION.unpack_from(self._mm, HEADER.size + i * SECTION.size)
+            if off + length > len(self._mm):
+                raise ValueError(f"룰카드 스냅샷 섹션 범위 오류: {name}")
+            self._sections[name] = (off, length, tc)
+
+    def section(self, name: str) -> memoryview:
+        off, length, tc = self._sections[name]
+        mv = self._mv[off:off + length]
+        return mv if tc == "bytes" else mv.cast(tc)
+
+    def strings(self) -> List[str]:
+        """문자열 테이블 전체 (UTF-8 1회 디코드 후 분할)"""
+        text = bytes(self.section("str_blob")).decode("utf-8")
+        parts = text.split("\x00")
+        if len(parts) == self.n_strings:
+            return parts
+        offs = self.section("str_offsets").tolist()
+        return [text[a:b - 1] for a, b in zip(offs, offs[1:])]
+
+    def close(self) -> None:
+        self._mv.release()
+        self._mm.close()
+
+
+def open_snapshot(path: str, digest: Optional[bytes] = None) -> Optional[RuleCardSnapshot]:
+    """
+    스냅샷 열기 (없음 / 포맷 오류 / stale → None)
+
+    digest: 원본 JSONL sha256 (None 이면 검사 생략)
+    """
+    if not _native_ok() or not os.path.exists(path):
+        return None
+    try:
+        snap = RuleCardSnapshot(path)
+    except (OSError, ValueError):
+        return None
+    if digest is not None and snap.digest != digest:
+        snap.close()
+        return None
+    return snap
@@ -0,0 +1,211 @@
+"""
+룰카드 SQLite 백엔드 (본문 지연 조회)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- tools/build_sajuos_sqlite.py 가 만든 DB(rule_cards 테이블)를 원본으로 사용
+- 메모리에는 id / topic / priority / tags / 토큰 id + 역색인만 (RuleCardStore 와 같은 인덱스)
+  → 랭킹(select_cards_for_preset 등)은 지금과 같이 메모리 인덱스에서
+- mechanism / interpretation / action / cautions / trigger 본문은
+  최종 top-k 카드만 card_dicts() 에서 읽기 전용 커넥션 풀로 조회 (rowid IN ...)
+- 자주 쓰는 본문은 LRU 로 보관 (카드 수와 무관하게 메모리 상한 고정)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import weakref
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from cachetools import LRUCache
+
+from .rulecards_store import CARD_FIELDS, RuleCard, RuleCardStore, intern_tags, safe_priority
+from .rulecards_snapshot import source_hash
+from .tag_matcher import build_card_text
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# IN (...) 한 번에 넘기는 rowid 수 (SQLite 변수 개수 제한 아래)
+_IN_CHUNK = 500
+
+# (trigger, mechanism, interpretation, action, cautions)
+Body = Tuple[Any, Optional[str], Optional[str], Optional[str], Any]
+
+
+class ReadOnlyPool:
+    """
+    SQLite 읽기 전용 커넥션 풀
+
+    - mode=ro + query_only → 본문 조회 외 쓰기 불가
+    - 필요할 때 최대 size 개까지 생성, 반납된 커넥션 재사용
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        self.path = path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        uri = f"file:{quote(str(Path(self.path).resolve()))}?mode=ro"
+        con = sqlite3.connect(uri, uri=True, timeout=30, check_same_thread=False)
+        con.execute("PRAGMA query_only=1;")
+        return con
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            con = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._created < self.size
+                if can_open:
+                    self._created += 1
+            if can_open:
+                try:
+                    con = self._open()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                con = self._idle.get()
+        try:
+            yield con
+        finally:
+            self._idle.put(con)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+class SqliteRuleCardStore(RuleCardStore):
+    """
+    본문을 SQLite 에 두는 RuleCardStore
+
+    - load(): rule_cards 의 id / topic / priority / tags (+ trigger 하드 조건 역색인용) 만 읽어 인덱스 생성
+    - card_dicts(): 본문 조회 후 dict (RuleCard.to_dict() 와 같은 키)
+    - 카드 객체의 본문 필드는 None (랭킹에는 쓰지 않음)
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, body_cache_size: int = 2048):
+        super().__init__(path)
+        self.pool = ReadOnlyPool(path, pool_size)
+        self._rowids: array = array("q")
+        self._bodies: LRUCache = LRUCache(maxsize=body_cache_size)
+        self._bodies_lock = threading.Lock()
+        # 핫 리로드로 교체된 스토어: 마지막 사용자가 놓으면(GC) 풀 닫기 (finalizer 는 풀만 참조)
+        self._finalizer = weakref.finalize(self, self.pool.close)
+
+    def load(self, use_snapshot: bool = True) -> None:
+        """rule_cards → 카드 인덱스 (스냅샷은 JSONL 저장소 전용 → use_snapshot 무시)"""
+        p = self.path
+        if not Path(p).exists():
+            raise FileNotFoundError(f"Rulecards SQLite not found: {p}")
+
+        self.content_hash = source_hash(p).hex()
+        cards: List[RuleCard] = []
+        triggers: List[Any] = []
+        rowids = array("q")
+        with self.pool.connection() as con:
+            rows = con.execute(
+                "SELECT rowid, id, topic, priority, tags_json, trigger_json FROM rule_cards ORDER BY rowid"
+            ).fetchall()
+        for rowid, cid, topic, priority, tags_json, trigger_json in rows:
+            try:
+                tags = json.loads(tags_json) if tags_json else []
+            except ValueError:
+                continue
+            if not cid or not topic or not tags:
+                continue
+            cards.append(RuleCard(
+                id=cid,
+                topic=sys.intern(topic),
+                tags=intern_tags(tags),
+                priority=safe_priority(priority),
+            ))
+            rowids.append(rowid)
+            # trigger 는 카드에 두지 않고 하드 조건 역색인만 (본문은 card_dicts 에서)
+            try:
+                triggers.append(json.loads(trigger_json) if trigger_json else None)
+            except ValueError:
+                triggers.append(None)
+
+        self._rowids = rowids
+        with self._bodies_lock:
+            self._bodies.clear()
+        self._build(cards, triggers)
+        self.loaded_from = "sqlite"
+
+    def _card_text(self, card: RuleCard) -> None:
+        # 검색 텍스트에 본문(mechanism/action)이 들어감 → card_dicts() 에서 생성
+        return None
+
+    def _fetch_bodies(self, rowids: List[int]) -> Dict[int, Body]:
+        out: Dict[int, Body] = {}
+        with self.pool.connection() as con:
+            for i in range(0, len(rowids), _IN_CHUNK):
+                chunk = rowids[i:i + _IN_CHUNK]
+                rows = con.execute(
+                    "SELECT rowid, trigger_json, mechanism, interpretation, action, cautions_json "
+                    f"FROM rule_cards WHERE rowid IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for rowid, trigger_json, mechanism, interpretation, action, cautions_json in rows:
+                    out[rowid] = (
+                        json.loads(trigger_json) if trigger_json else None,
+                        mechanism, interpretation, action,
+                        json.loads(cautions_json) if cautions_json else None,
+                    )
+        return out
+
+    def card_dicts(self, cards: Iterable[RuleCard]) -> List[Dict]:
+        cards = list(cards)
+        rowids = [self._rowids[self.card_position(c)] for c in cards]
+
+        with self._bodies_lock:
+            bodies = {r: self._bodies.get(r) for r in rowids}
+        missing = [r for r, b in bodies.items() if b is None]
+        if missing:
+            fetched = self._fetch_bodies(missing)
+            bodies.update(fetched)
+            with self._bodies_lock:
+                for r, b in fetched.items():
+                    self._bodies[r] = b
+
+        out = []
+        for c, r in zip(cards, rowids):
+            trigger, mechanism, interpretation, action, cautions = bodies.get(r) or (None,) * 5
+            d = dict(zip(CARD_FIELDS, (
+                c.id, c.topic, c.tags, c.priority, trigger,
+                mechanism, interpretation, action, cautions,
+            )))
+            d["_text"] = build_card_text(c.topic, c.tags, mechanism, action)
+            out.append(d)
+        return out
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+def open_rulestore(path: str) -> RuleCardStore:
+    """경로 확장자로 저장소 선택 (.db/.sqlite/.sqlite3 → SQLite 본문 지연 조회, 그 외 JSONL) 후 로드"""
+    if Path(path).suffix.lower() in SQLITE_SUFFIXES:
+        store: RuleCardStore = SqliteRuleCardStore(path)
+    else:
+        store = RuleCardStore(path)
+    store.load()
+    return store
@@ -1,19 +1,84 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List, Set, Optional
-import json, os, math
+from array import array
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Set, Optional, Tuple
+import json, os, math, sys
 
-@dataclass
+from .tag_matcher import CardText, build_card_text
+from .rulecard_triggers import hard_conditions
+from .rulecards_snapshot import NONE, RuleCardSnapshot, open_snapshot, snapshot_path_for, source_hash
+
+# 카드 본문 필드 (API 응답 / dict 변환 대상)
+CARD_FIELDS = (
+    "id", "topic", "tags", "priority", "trigger",
+    "mechanism", "interpretation", "action", "cautions",
+)
+
+# 카드 1장 = 슬롯 객체 (인스턴스 __dict__ 없음), 생성 후 읽기 전용
+# - topic / tags 문자열은 sys.intern → 8천여 장이 같은 문자열 객체 공유
+# - tags 는 tuple (리스트 대비 작고, 밖에서 바꿀 수 없음)
+# - 로드 시 계산 필드(tokens/text)는 RuleCardStore._build 가 계산 후 dataclasses.replace 로 새 카드 생성
+@dataclass(slots=True, frozen=True)
 class RuleCard:
     id: str
     topic: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     priority: float = 0.0
     trigger: Optional[str] = None
     mechanism: Optional[str] = None
     interpretation: Optional[str] = None
     action: Optional[str] = None
     cautions: Optional[List[str]] = None
+    # 로드 시 1회 계산 (RuleCardStore.load): 분해 토큰(정렬), 토큰 id, 토큰별 idf
+    tokens: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    token_ids: Tuple[int, ...] = field(default=(), repr=False, compare=False)
+    token_idf: Tuple[float, ...] = field(default=(), repr=False, compare=False)
+    # 소문자 검색 텍스트 (tag_matcher 스캔용, 로드 시 1회)
+    text: Optional[CardText] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict:
+        d = {k: getattr(self, k) for k in CARD_FIELDS}
+        if self.text is not None:
+            d["_text"] = self.text
+        return d
+
+
+class CardView(Mapping):
+    """
+    RuleCard 읽기 전용 dict 뷰 (복사 없음)
+
+    - to_dict() 와 같은 키 ("_text" 는 검색 텍스트가 있을 때만)
+    - card.get("tags") / card["mechanism"] 등 dict 소비 코드 그대로 사용
+    - 값 대입 불가 (카드 공유 → 요청 간 오염 방지), 필요하면 dict(view) 로 복사
+    """
+    __slots__ = ("_card",)
+
+    def __init__(self, card: RuleCard):
+        self._card = card
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "_text":
+            text = self._card.text
+            if text is None:
+                raise KeyError(key)
+            return text
+        if key not in _CARD_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self._card, key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from CARD_FIELDS
+        if self._card.text is not None:
+            yield "_text"
+
+    def __len__(self) -> int:
+        return len(CARD_FIELDS) + (self._card.text is not None)
+
+    def __repr__(self) -> str:
+        return f"CardView({self._card.id!r}, topic={self._card.topic!r})"
+
+
+_CARD_FIELD_SET = frozenset(CARD_FIELDS)
 
 TAG_NORMALIZE = {
     "정제": "정재",
@@ -30,6 +95,10 @@ def canon_tag(t: str) -> str:
     s = " ".join(str(t).strip().split())
     return TAG_NORMALIZE.get(s, s)
 
+def intern_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """카드 태그 → 정규화 + intern 된 tuple"""
+    return tuple(sys.intern(canon_tag(x)) for x in tags)
+
 def explode_tag_tokens(t: str) -> List[str]:
     """
     카드 태그를 토큰화해서 매칭 안정성을 높임.
@@ -54,19 +123,60 @@ def safe_priority(p) -> float:
 
 class RuleCardStore:
     """
-    JSONL 룰카드 로드 + 토픽 인덱스 + IDF(희소 태그 가중치) 생성
+    JSONL 룰카드 로드 + 토픽 인덱스 + IDF(희소 태그 가중치) + 역색인 생성
+
+    - 카드 번호(card id 정수) = self.cards 내 위치
+    - postings[토큰] = 그 토큰을 가진 카드 번호 (오름차순 array("i"))
+    - topic_rank[카드 번호] = by_topic[카드 토픽] 안에서의 순위 (priority 내림차순)
+    - vocab[토큰] = 토큰 id (카드 token_ids 와 같은 번호)
+    - trigger_postings[(key, 값)] = 그 trigger 하드 조건을 가진 카드 번호 (rulecard_triggers)
+      trigger_arity[카드 번호] = 카드의 하드 조건 수 (0 = 없음)
+    - 같은 내용의 바이너리 스냅샷(.rcsnap)이 있으면 위 인덱스까지 그대로 로드
     """
     def __init__(self, path: str):
         self.path = path
         self.cards: List[RuleCard] = []
         self.by_topic: Dict[str, List[RuleCard]] = {}
         self.idf: Dict[str, float] = {}
+        self.postings: Dict[str, array] = {}
+        self.topic_rank: array = array("i")
+        self.vocab: Dict[str, int] = {}
+        self.trigger_postings: Dict[Tuple[str, str], array] = {}
+        self.trigger_arity: array = array("i")
+        self._matrix = None  # rulecard_matrix.get_rulecard_matrix 캐시
+        self._pos: Optional[Dict[int, int]] = None  # card_position 캐시
+        self._lower_keys: Optional[Dict[str, List[str]]] = None  # card_ids_for_lower 캐시
+        self.content_hash: Optional[str] = None  # 원본 JSONL sha256 (hex)
+        self.loaded_from: Optional[str] = None   # "snapshot" | "jsonl"
 
-    def load(self) -> None:
+    def load(self, use_snapshot: bool = True) -> None:
+        """
+        룰카드 로드
+
+        use_snapshot: 원본 JSONL 과 sha256 이 같은 스냅샷(.rcsnap)이 있으면 그것을 mmap 으로 로드
+                      (tools/build_rulecards_snapshot.py), 없거나 stale 이면 JSONL 파싱
+        """
         p = self.path
         if not os.path.exists(p):
             raise FileNotFoundError(f"Rulecards JSONL not found: {p}")
 
+        digest = source_hash(p)
+        self.content_hash = digest.hex()
+        if use_snapshot:
+            snap = open_snapshot(snapshot_path_for(p), digest)
+            if snap is not None:
+                try:
+                    self._load_snapshot(snap)
+                finally:
+                    snap.close()
+                self.loaded_from = "snapshot"
+                return
+
+        self._build(self._parse_jsonl(p))
+        self.loaded_from = "jsonl"
+
+    @staticmethod
+    def _parse_jsonl(p: str) -> List[RuleCard]:
         cards: List[RuleCard] = []
         with open(p, "r", encoding="utf-8") as f:
             for line in f:
@@ -83,8 +193,8 @@ class RuleCardStore:
 
                 cards.append(RuleCard(
                     id=obj["id"],
-                    topic=obj["topic"],
-                    tags=[canon_tag(x) for x in obj.get("tags", [])],
+                    topic=sys.intern(obj["topic"]),
+                    tags=intern_tags(obj.get("tags", [])),
                     priority=safe_priority(obj.get("priority", 0)),
                     trigger=obj.get("trigger"),
                     mechanism=obj.get("mechanism"),
@@ -92,10 +202,138 @@ class RuleCardStore:
                     action=obj.get("action"),
                     cautions=obj.get("cautions"),
                 ))
+        return cards
+
+    def _build(self, cards: List[RuleCard], triggers: Optional[List] = None) -> None:
+        """
+        파싱된 카드 → 토큰 컴파일 / idf / 토픽 인덱스 / 역색인
 
+        카드는 읽기 전용 → 토큰·idf·검색 텍스트를 먼저 계산하고 그 값을 넣은 카드로 교체
+        triggers: 카드 순서의 trigger (카드에 trigger 를 두지 않는 저장소용, None 이면 card.trigger)
+        """
+        token_sets = [self._card_tokens(c) for c in cards]
+        self.idf = self._build_idf(token_sets)
+        self.vocab, compiled = self._compile_tokens(token_sets)
+        cards = [
+            replace(c, tokens=tokens, token_ids=token_ids, token_idf=token_idf, text=self._card_text(c))
+            for c, (tokens, token_ids, token_idf) in zip(cards, compiled)
+        ]
         self.cards = cards
         self.by_topic = self._build_topic_index(cards)
-        self.idf = self._build_idf(cards)
+        self.postings = self._build_postings(token_sets)
+        self.topic_rank = self._build_topic_rank(cards)
+        self._build_trigger_index([c.trigger for c in cards] if triggers is None else triggers)
+        self._matrix = None
+        self._pos = None
+        self._lower_keys = None
+
+    def _card_text(self, card: RuleCard) -> Optional[CardText]:
+        """카드 검색 텍스트 (tag_matcher), 로드 시 1회"""
+        return build_card_text(card.topic, card.tags, card.mechanism, card.action)
+
+    def card_dicts(self, cards: Iterable[RuleCard]) -> List[Mapping]:
+        """
+        선택된 카드 → API/리포트용 읽기 전용 dict 뷰 (CardView, 복사 없음)
+        본문을 따로 두는 저장소는 여기서 본문 조회
+        """
+        return [CardView(c) for c in cards]
+
+    def _load_snapshot(self, snap: RuleCardSnapshot) -> None:
+        """스냅샷 → 카드/인덱스 (빌드 때 계산한 토큰·idf·역색인 그대로 사용)"""
+        strings = snap.strings()
+        n = snap.n_cards
+
+        def refs(name: str) -> List[Optional[str]]:
+            return [None if i == NONE else strings[i] for i in snap.section(name).tolist()]
+
+        ids, topics = refs("card_id"), refs("card_topic")
+        mechanisms, interpretations, actions = refs("card_mechanism"), refs("card_interpretation"), refs("card_action")
+        priorities = snap.section("card_priority").tolist()
+        tags_ptr, tag_refs = snap.section("card_tags_ptr").tolist(), snap.section("card_tags").tolist()
+        tok_ptr, tok_ids = snap.section("card_token_ptr").tolist(), snap.section("card_token_ids").tolist()
+        triggers = json.loads(bytes(snap.section("card_trigger_json")).decode("utf-8"))
+        cautions = json.loads(bytes(snap.section("card_cautions_json")).decode("utf-8"))
+
+        vocab_tokens = [strings[i] for i in snap.section("vocab").tolist()]
+        idf_values = snap.section("idf").tolist()
+
+        texts = refs("card_text")
+        text_topic_end = snap.section("card_text_topic_end").tolist()
+        text_body_start = snap.section("card_text_body_start").tolist()
+
+        # 카드별 구간은 전체 배열을 한 번에 변환한 뒤 슬라이스 (카드마다 map 하지 않음)
+        all_tags = tuple(map(strings.__getitem__, tag_refs))
+        all_token_ids = tuple(tok_ids)
+        all_tokens = tuple(map(vocab_tokens.__getitem__, tok_ids))
+        all_token_idf = tuple(map(idf_values.__getitem__, tok_ids))
+
+        cards: List[RuleCard] = []
+        for i in range(n):
+            t0, t1 = tok_ptr[i], tok_ptr[i + 1]
+            cards.append(RuleCard(
+                ids[i], sys.intern(topics[i]), all_tags[tags_ptr[i]:tags_ptr[i + 1]],
+                priorities[i], triggers[i],
+                mechanisms[i], interpretations[i], actions[i], cautions[i],
+                all_tokens[t0:t1], all_token_ids[t0:t1], all_token_idf[t0:t1],
+                CardText.from_span(texts[i], text_topic_end[i], text_body_start[i]),
+            ))
+
+        rank = array("i")
+        rank.frombytes(snap.section("topic_rank").tobytes())
+        by_topic: Dict[str, List[RuleCard]] = {}
+        for c in cards:
+            by_topic.setdefault(c.topic, []).append(c)
+        for pool in by_topic.values():
+            pool[:] = [None] * len(pool)
+        for i, c in enumerate(cards):
+            by_topic[c.topic][rank[i]] = c
+
+        post_ptr = snap.section("postings_ptr").tolist()
+        post_raw = snap.section("postings").tobytes()
+        postings: Dict[str, array] = {}
+        for t, tok in enumerate(vocab_tokens):
+            lst = array("i")
+            lst.frombytes(post_raw[post_ptr[t] * 4:post_ptr[t + 1] * 4])
+            postings[tok] = lst
+
+        self.cards = cards
+        self.by_topic = by_topic
+        self.idf = dict(zip(vocab_tokens, idf_values))
+        self.postings = postings
+        self.topic_rank = rank
+        self.vocab = {t: i for i, t in enumerate(vocab_tokens)}
+        self._build_trigger_index(triggers)
+        self._matrix = None
+        self._pos = None
+        self._lower_keys = None
+
+    @staticmethod
+    def _card_tokens(card: RuleCard) -> Set[str]:
+        token_set: Set[str] = set()
+        for t in card.tags:
+            for x in explode_tag_tokens(t):
+                token_set.add(x)
+        return token_set
+
+    def _compile_tokens(
+        self, token_sets: List[Set[str]]
+    ) -> Tuple[Dict[str, int], List[Tuple[Tuple[str, ...], Tuple[int, ...], Tuple[float, ...]]]]:
+        """
+        카드별 토큰(정렬)/토큰 id/idf 를 미리 계산 (점수 계산 시 분해·정규화 없음)
+
+        Returns:
+            (vocab, 카드 순서의 (tokens, token_ids, token_idf) 목록)
+        """
+        vocab: Dict[str, int] = {}
+        compiled = []
+        for token_set in token_sets:
+            tokens = tuple(sorted(sys.intern(t) for t in token_set))
+            compiled.append((
+                tokens,
+                tuple(vocab.setdefault(t, len(vocab)) for t in tokens),
+                tuple(self.idf[t] for t in tokens),
+            ))
+        return vocab, compiled
 
     def _build_topic_index(self, cards: List[RuleCard]) -> Dict[str, List[RuleCard]]:
         m: Dict[str, List[RuleCard]] = {}
@@ -105,14 +343,87 @@ class RuleCardStore:
             m[k].sort(key=lambda x: x.priority, reverse=True)
         return m
 
-    def _build_idf(self, cards: List[RuleCard]) -> Dict[str, float]:
+    def _build_topic_rank(self, cards: List[RuleCard]) -> array:
+        pos = {id(c): i for i, c in enumerate(cards)}
+        rank = array("i", [0]) * len(cards)
+        for pool in self.by_topic.values():
+            for r, c in enumerate(pool):
+                rank[pos[id(c)]] = r
+        return rank
+
+    def _build_postings(self, token_sets: List[Set[str]]) -> Dict[str, array]:
+        postings: Dict[str, array] = {}
+        for i, token_set in enumerate(token_sets):
+            for t in token_set:
+                lst = postings.get(t)
+                if lst is None:
+                    lst = postings[t] = array("i")
+                lst.append(i)  # 카드 순서대로 추가 → 오름차순
+        return postings
+
+    def card_position(self, card: RuleCard) -> int:
+        """카드 객체 → 카드 번호 (self.cards 내 위치, id 가 겹치는 카드도 구분)"""
+        if self._pos is None:
+            self._pos = {id(c): i for i, c in enumerate(self.cards)}
+        return self._pos[id(card)]
+
+    def _build_trigger_index(self, triggers: Iterable) -> None:
+        """카드 trigger (카드 순서) → 하드 조건 역색인 / 조건 수"""
+        postings: Dict[Tuple[str, str], array] = {}
+        arity = array("i")
+        for i, trigger in enumerate(triggers):
+            conds = hard_conditions(trigger)
+            arity.append(len(conds) if conds else 0)
+            for cond in conds or ():
+                lst = postings.get(cond)
+                if lst is None:
+                    lst = postings[cond] = array("i")
+                lst.append(i)
+        self.trigger_postings = postings
+        self.trigger_arity = arity
+
+    def trigger_matches(self, features: Dict[str, str]) -> List[int]:
+        """
+        원국 특징 (rulecard_triggers.chart_trigger_features) → 하드 조건을 전부 만족하는 카드 번호 (오름차순)
+
+        특징 (key, 값) 마다 역색인 1번 조회, 카드별 적중 수 = 조건 수면 매칭 (전수 스캔 없음)
+        """
+        hits: Dict[int, int] = {}
+        for cond in features.items():
+            for cid in self.trigger_postings.get(cond, ()):
+                hits[cid] = hits.get(cid, 0) + 1
+        arity = self.trigger_arity
+        return sorted(cid for cid, n in hits.items() if n == arity[cid])
+
+    def close(self) -> None:
+        """보유 자원 해제 (메모리 저장소는 없음, SqliteRuleCardStore 는 커넥션 풀)"""
+
+    def card_ids_for(self, tokens: Iterable[str]) -> List[int]:
+        """토큰 중 하나라도 가진 카드 번호 (오름차순, 중복 없음)"""
+        hit: Set[int] = set()
+        for t in tokens:
+            lst = self.postings.get(t)
+            if lst is not None:
+                hit.update(lst)
+        return sorted(hit)
+
+    def card_ids_for_lower(self, tags: Iterable[str]) -> List[int]:
+        """
+        card_ids_for 의 대소문자 무시 버전 (워커의 소문자 태그 비교와 같은 기준)
+
+        소문자로 같은 역색인 토큰을 모두 조회 → "CEO" 카드도 "ceo" 로 찾음
+        """
+        if self._lower_keys is None:
+            lower_keys: Dict[str, List[str]] = {}
+            for t in self.postings:
+                lower_keys.setdefault(t.lower(), []).append(t)
+            self._lower_keys = lower_keys
+        return self.card_ids_for(k for t in tags for k in self._lower_keys.get(str(t).lower(), ()))
+
+    def _build_idf(self, token_sets: List[Set[str]]) -> Dict[str, float]:
         df: Dict[str, int] = {}
-        N = len(cards)
-        for c in cards:
-            token_set: Set[str] = set()
-            for t in c.tags:
-                for x in explode_tag_tokens(t):
-                    token_set.add(x)
+        N = len(token_sets)
+        for token_set in token_sets:
             for t in token_set:
                 df[t] = df.get(t, 0) + 1
 
@@ -0,0 +1,182 @@
+"""
+룰카드 스토어 핫 리로드 (버전 교체)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 새 RuleCardStore 는 백그라운드 스레드에서 끝까지 빌드한 뒤 참조 1개만 교체
+  → 요청/잡은 시작 시 받은 스토어(버전)를 끝까지 사용, 반쯤 만든 스토어는 보이지 않음
+- 버전 = 원본 JSONL sha256 앞 12자리 (내용이 같으면 교체 안 함)
+- 트리거: 관리자 엔드포인트 (POST /interpret/rulecards-reload) 또는 파일 감시(폴링)
+- 교체 시 구독자 콜백 호출 (main.py: app.state.rulestore 갱신)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.rulecards_store import RuleCardStore
+from app.services.rulecards_sqlite import open_rulestore
+
+logger = logging.getLogger(__name__)
+
+
+def store_version(store: Any) -> Optional[str]:
+    """스토어 버전 (content_hash 앞 12자리, 없으면 None)"""
+    h = getattr(store, "content_hash", None)
+    return h[:12] if h else None
+
+
+class RuleStoreManager:
+    """현재 룰카드 스토어 + 리로드/교체"""
+
+    def __init__(self):
+        self.store: Optional[RuleCardStore] = None
+        self.path: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self.swap_count = 0
+        self.last_error: Optional[str] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._listeners: List[Callable[[RuleCardStore], None]] = []
+        self._watch_task: Optional[asyncio.Task] = None
+        self._file_stat: Optional[Tuple[float, int]] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        return store_version(self.store)
+
+    def subscribe(self, callback: Callable[[RuleCardStore], None]) -> None:
+        """교체 때마다 새 스토어로 호출 (현재 스토어가 있으면 즉시 1회)"""
+        self._listeners.append(callback)
+        if self.store is not None:
+            callback(self.store)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 로드 / 교체
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @staticmethod
+    def _build(path: str) -> RuleCardStore:
+        # .db/.sqlite → 본문 지연 조회 저장소, 그 외 JSONL
+        return open_rulestore(path)
+
+    def _stat(self, path: str) -> Optional[Tuple[float, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime, st.st_size)
+
+    def _swap(self, store: RuleCardStore) -> None:
+        # 참조 1개 대입 → 진행 중인 요청은 이전 스토어를 계속 들고 있음
+        # 이전 스토어의 자원(SQLite 커넥션 풀)은 마지막 사용자가 놓을 때 finalizer 가 해제
+        self.store = store
+        self.loaded_at = time.time()
+        self.swap_count += 1
+        for cb in self._listeners:
+            try:
+                cb(store)
+            except Exception as e:
+                logger.warning(f"⚠️ RuleStore 교체 콜백 실패: {e}")
+
+    def load(self, path: str) -> RuleCardStore:
+        """최초 로드 (startup, 동기)"""
+        stat = self._stat(path)
+        store = self._build(path)
+        self.path = path
+        self._file_stat = stat
+        self._swap(store)
+        logger.info(f"✅ RuleStore 로드: {len(store.cards)}장, version={self.version} ({store.loaded_from})")
+        return store
+
+    async def reload(self, force: bool = False) -> Dict[str, Any]:
+        """
+        백그라운드 스레드에서 새 스토어 빌드 → 교체
+
+        force: 내용(sha256)이 같아도 교체
+        빌드 실패 시 기존 스토어 유지
+        """
+        if self.path is None:
+            raise RuntimeError("RuleStore 경로 없음 (최초 로드 전)")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            previous = self.version
+            stat = self._stat(self.path)
+            t0 = time.perf_counter()
+            try:
+                store = await asyncio.to_thread(self._build, self.path)
+            except Exception as e:
+                self.last_error = str(e)[:200]
+                logger.error(f"❌ RuleStore 리로드 실패 (기존 version={previous} 유지): {e}")
+                raise
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            self._file_stat = stat
+            self.last_error = None
+
+            changed = force or store_version(store) != previous
+            if changed:
+                self._swap(store)
+                logger.info(f"🔄 RuleStore 교체: {previous} → {self.version}, "
+                            f"{len(store.cards)}장, {elapsed_ms:.0f}ms")
+            else:
+                logger.info(f"RuleStore 변경 없음: version={previous}")
+            return {
+                "swapped": changed,
+                "previous_version": previous,
+                "version": self.version,
+                "total_cards": len(self.store.cards) if self.store else 0,
+                "elapsed_ms": round(elapsed_ms, 1),
+            }
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 파일 감시 (mtime/size 폴링)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def start_watch(self, interval: float) -> None:
+        """interval 초마다 JSONL 변경 확인 → 바뀌었으면 reload (interval <= 0 이면 끔)"""
+        if interval <= 0 or self.path is None or self._watch_task is not None:
+            return
+        self._watch_task = asyncio.create_task(self._watch(interval))
+        logger.info(f"👀 RuleStore 파일 감시: {self.path} ({interval}s)")
+
+    async def _watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            stat = self._stat(self.path)
+            if stat is None or stat == self._file_stat:
+                continue
+            try:
+                await self.reload()
+            except Exception:
+                # 쓰는 도중일 수 있음 → 다음 주기에 다시 시도
+                pass
+
+    async def stop_watch(self) -> None:
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def close(self) -> None:
+        """현재 스토어 자원 해제 (shutdown)"""
+        if self.store is not None:
+            self.store.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "path": self.path,
+            "loaded_from": getattr(self.store, "loaded_from", None),
+            "loaded_at": self.loaded_at,
+            "swap_count": self.swap_count,
+            "last_error": self.last_error,
+            "watching": self._watch_task is not None,
+        }
+
+
+# 싱글톤
+rulestore_manager = RuleStoreManager()
@@ -4,10 +4,11 @@
 - KASI API (Source of Truth) + ephem (Fallback)
 - API 응답 형식에 맞게 변환
 """
-from typing import Optional
+import logging
+from typing import Optional, Dict, Any, Sequence, List, Tuple
 from dataclasses import dataclass
 
-from app.models.schemas import Pillar, SajuWonGuk, DaeunInfo, QualityInfo
+from app.models.schemas import Pillar, SajuWonGuk, DaeunInfo, QualityInfo, HourOption
 from app.services.engine_v2 import (
     ScientificSajuEngine, 
     SajuManager,
@@ -18,10 +19,30 @@ from app.services.engine_v2 import (
     JI,
     GAN_TO_ELEMENT,
     JI_TO_ELEMENT,
-    DAY_MASTER_DESC
+    DAY_MASTER_DESC,
+    HOUR_OPTIONS,
+    HOUR_RANGES,
+    HOUR_OPTION_ITEMS,
+    PILLARS,
+    sexagenary_index
 )
+from app.services.batch_engine import calculate_batch_columns
+from app.services.calendar_table import get_calendar_table
+from app.services.feature_tags_no_time import build_feature_tags_from_pillars
+from app.services.daeun import calculate_daeun
+from app.services.compute_pool import compute_pool
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+
+# 60갑자 Pillar 모델 / 시간대 옵션 (모듈 로드 시 1회 검증, 요청마다 공유)
+PILLAR_MODELS = tuple(
+    Pillar(**{k: p[k] for k in ("gan", "ji", "ganji", "gan_element", "ji_element", "gan_index", "ji_index")})
+    for p in PILLARS
+)
+HOUR_OPTION_MODELS = tuple(HourOption(**h) for h in HOUR_OPTION_ITEMS)
+
 
 @dataclass
 class CalculationResult:
@@ -81,7 +102,7 @@ class SajuEngine:
             use_solar_time=use_solar_time
         )
         
-        return self._to_calculation_result(result, hour, gender, timezone)
+        return self._to_calculation_result(result, (year, month, day, hour, minute), gender, timezone)
     
     async def calculate_async(
         self,
@@ -111,16 +132,134 @@ class SajuEngine:
             use_solar_time=use_solar_time
         )
         
-        return self._to_calculation_result(result, hour, gender, timezone)
+        return self._to_calculation_result(result, (year, month, day, hour, minute), gender, timezone)
+    
+    def calculate_batch(
+        self,
+        years: Sequence[int],
+        months: Sequence[int],
+        days: Sequence[int],
+        hours: Optional[Sequence[Optional[int]]] = None,
+        minutes: Optional[Sequence[int]] = None,
+        use_solar_time: bool = True
+    ) -> Dict[str, Any]:
+        """
+        대량 사주 계산 (만세력 테이블 + NumPy 벡터 연산)
+        
+        Returns:
+            컬럼형 결과 (year_pillar/month_pillar/day_pillar/hour_pillar 등 리스트)
+        """
+        return calculate_batch_columns(
+            years, months, days, hours, minutes, use_solar_time=use_solar_time
+        )
+    
+    async def calculate_batch_async(
+        self,
+        years: Sequence[int],
+        months: Sequence[int],
+        days: Sequence[int],
+        hours: Optional[Sequence[Optional[int]]] = None,
+        minutes: Optional[Sequence[int]] = None,
+        use_solar_time: bool = True
+    ) -> Dict[str, Any]:
+        """대량 사주 계산 (compute_pool 에서 실행, 이벤트 루프 비차단)"""
+        return await compute_pool.run(
+            calculate_batch_columns,
+            years, months, days, hours, minutes, use_solar_time=use_solar_time
+        )
+    
+    async def calculate_hour_variants(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        gender: Optional[str] = None,
+        timezone: str = "Asia/Seoul",
+        use_solar_time: bool = True,
+        target_year: int = 2026
+    ) -> Dict[str, Any]:
+        """
+        시간 모름 → 12시진 후보 한 번에 계산
+        
+        - 년/월/일주는 1회 계산 (KASI → 만세력 테이블 → ephem)
+        - 시주 12개는 일간에서 바로 도출 (시두법)
+        - 후보마다 시주 반영 FeatureTags 와 시간 모름 기준 태그의 차이(added/removed)
+        - 당일 절입이 있으면 시진별 년/월주를 테이블로 다시 판정 (month_varies=True)
+        """
+        base = await self.calculate_async(
+            year=year,
+            month=month,
+            day=day,
+            hour=None,
+            gender=gender,
+            timezone=timezone,
+            use_solar_time=use_solar_time
+        )
+        saju = base.saju
+        base_tags = set(build_feature_tags_from_pillars(
+            saju.year_pillar.ganji, saju.month_pillar.ganji, saju.day_pillar.ganji,
+            None, overlay_year=target_year
+        )["tags"])
+        
+        # 당일 절입 여부 (00:00 / 23:59 월주 비교)
+        table = get_calendar_table()
+        month_varies = False
+        if table is not None and table.covers(year):
+            month_varies = (
+                table.lookup(year, month, day, 0, 0)["month_idx"]
+                != table.lookup(year, month, day, 23, 59)["month_idx"]
+            )
+        
+        day_gan_idx = saju.day_pillar.gan_index
+        variants: List[Dict[str, Any]] = []
+        for h_opt in HOUR_OPTIONS:
+            ji_idx = h_opt["index"]
+            gan_idx = ((day_gan_idx % 5) * 2 + ji_idx) % 10
+            hour_pillar = PILLAR_MODELS[sexagenary_index(gan_idx, ji_idx)]
+            year_pillar, month_pillar = saju.year_pillar, saju.month_pillar
+            
+            if month_varies:
+                # 시진 중간 시각 (자시는 당일 00시대) 기준, 태양시면 시계 시각 +30분
+                mid_minute = (ji_idx * 120) % 1440 + (30 if use_solar_time else 0)
+                found = table.lookup(year, month, day, mid_minute // 60, mid_minute % 60)
+                year_pillar = PILLAR_MODELS[found["year_idx"]]
+                month_pillar = PILLAR_MODELS[found["month_idx"]]
+            
+            tags = set(build_feature_tags_from_pillars(
+                year_pillar.ganji, month_pillar.ganji, saju.day_pillar.ganji,
+                hour_pillar.ganji, overlay_year=target_year
+            )["tags"])
+            
+            variants.append({
+                "index": ji_idx,
+                "ji": h_opt["ji"],
+                "ji_hanja": h_opt["ji_hanja"],
+                "hour_range": HOUR_RANGES[ji_idx],
+                "hour_pillar": hour_pillar.model_dump(),
+                "year_pillar": year_pillar.model_dump() if month_varies else None,
+                "month_pillar": month_pillar.model_dump() if month_varies else None,
+                "feature_tags_delta": {
+                    "added": sorted(tags - base_tags),
+                    "removed": sorted(base_tags - tags),
+                },
+            })
+        
+        return {
+            "base": base,
+            "base_feature_tags": sorted(base_tags),
+            "month_varies": month_varies,
+            "variants": variants,
+        }
     
     def _to_calculation_result(
         self,
         result: dict,
-        hour: Optional[int],
+        birth: Tuple[int, int, int, Optional[int], int],
         gender: Optional[str],
         timezone: str
     ) -> CalculationResult:
-        """내부 결과 → CalculationResult 변환"""
+        """내부 결과 → CalculationResult 변환 (birth: 년, 월, 일, 시, 분)"""
+        hour = birth[3]
         
         # Pillar 객체로 변환
         year_pillar = self._to_pillar(result["year_pillar"])
@@ -148,7 +287,9 @@ class SajuEngine:
         
         # 대운 정보
         daeun = self._calc_daeun(
-            year_gan_idx=result["year_pillar"]["gan_index"],
+            birth=birth,
+            year_pillar=result["year_pillar"],
+            month_pillar=result["month_pillar"],
             gender=gender
         )
         
@@ -161,44 +302,41 @@ class SajuEngine:
             quality=quality
         )
     
-    def _to_pillar(self, pillar_data: dict) -> Pillar:
-        """딕셔너리 → Pillar 객체 변환"""
-        return Pillar(
-            gan=pillar_data["gan"],
-            ji=pillar_data["ji"],
-            ganji=pillar_data["ganji"],
-            gan_element=pillar_data["gan_element"],
-            ji_element=pillar_data["ji_element"],
-            gan_index=pillar_data["gan_index"],
-            ji_index=pillar_data["ji_index"]
-        )
+    def _to_pillar(self, pillar_data) -> Pillar:
+        """기둥 레코드(dict/PillarRecord) → 공유 Pillar 모델"""
+        return PILLAR_MODELS[sexagenary_index(pillar_data["gan_index"], pillar_data["ji_index"])]
     
     def _calc_daeun(
         self,
-        year_gan_idx: int,
+        birth: Tuple[int, int, int, Optional[int], int],
+        year_pillar: dict,
+        month_pillar: dict,
         gender: Optional[str]
     ) -> Optional[DaeunInfo]:
-        """대운 정보 계산"""
+        """대운 정보 계산 (절입 인덱스 기반, daeun.py)"""
         if not gender:
             return None
         
-        is_yang_year = year_gan_idx % 2 == 0
-        is_male = gender.lower() in ["male", "남", "남성"]
-        
-        if (is_male and is_yang_year) or (not is_male and not is_yang_year):
-            direction = "forward"
-        else:
-            direction = "backward"
+        year, month, day, hour, minute = birth
+        try:
+            daeun = calculate_daeun(
+                year, month, day, hour, minute,
+                gender=gender,
+                year_gan_idx=year_pillar["gan_index"],
+                month_gan_idx=month_pillar["gan_index"],
+                month_ji_idx=month_pillar["ji_index"],
+                current_year=SajuManager.get_today_kst().year
+            )
+        except (ValueError, OSError) as e:
+            # 절입 인덱스 범위 밖 / 파일 없음 → 대운 생략
+            logger.warning(f"⚠️ 대운 계산 생략: {e}")
+            return None
         
-        return DaeunInfo(
-            start_age=3,
-            direction=direction,
-            current_daeun=None
-        )
+        return DaeunInfo(**daeun)
     
     def get_hour_options(self) -> list:
-        """시간대 선택 옵션"""
-        return self.engine.get_hour_options()
+        """시간대 선택 옵션 (공유 HourOption 모델)"""
+        return list(HOUR_OPTION_MODELS)
     
     @staticmethod
     def get_today_context() -> str:
@@ -0,0 +1,197 @@
+"""
+룰카드 선택 결과 캐시 (사주 기둥 키 LRU + 선택적 SQLite 영구 저장)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 선택 결과는 (년/월/일 기둥, target_year, preset, 스토어 버전) 의 순수 함수
+  → 기둥 조합 최대 60³ = 216,000, 인기 출생연도는 계속 겹침
+- 저장 값: 카드 번호(store.cards 위치) 목록 + feature tags
+  (카드 id 는 중복될 수 있음 → 위치로 저장, 위치는 스토어 버전이 같으면 고정)
+  카드 dict 는 호출자가 매번 새로 생성 → 호출자 간 공유 없음
+- 스토어 버전(content_hash)이 키에 포함 → 핫 리로드 후 이전 버전 결과는 자연히 miss
+- 선택 로직 버전(SELECTION_VERSION) + FeatureTags 계산 모듈 digest 도 키에 포함
+  → 로직이 바뀐 배포 후 디스크에 남은 이전 결과는 miss
+- /interpret, /generate-report, /generate-report-async, /regenerate-section, 워커가 공유
+- 경로: settings.rulecard_selection_cache_path (비어 있으면 메모리만)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import hashlib
+import json
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+from app.config import get_settings
+from app.services.feature_tag_table import source_digest
+
+logger = logging.getLogger(__name__)
+
+# 선택 로직 버전: rulecard_selector / focus_boost / 워커 선택 규칙을 바꾸면 올림
+SELECTION_VERSION = 2
+
+# FeatureTags 계산 규칙(feature_tags_no_time.py) 버전
+_FEATURE_TAGS_DIGEST = source_digest().hex()[:16]
+
+
+def preset_digest(preset: Dict[str, Any]) -> str:
+    """preset dict 내용 → 짧은 digest (이름이 같아도 섹션/포커스가 바뀌면 다른 키)"""
+    raw = json.dumps(preset, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+# (카드 번호 목록, feature tags)
+Selection = Tuple[Tuple[int, ...], Tuple[str, ...]]
+
+
+class SelectionCache:
+    """
+    룰카드 선택 결과 캐시
+
+    - get_or_compute(kind, key, store, compute): hit 면 저장된 번호로 카드 복원,
+      miss 면 compute() → (RuleCard 목록, feature tags) 를 번호로 바꿔 저장
+    - kind: 선택 방식 구분 ("preset" / "worker" 등, 같은 기둥이라도 결과가 다름)
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, path: Optional[str] = None):
+        settings = get_settings()
+        self.maxsize = maxsize or settings.rulecard_selection_cache_size
+        self.path = settings.rulecard_selection_cache_path if path is None else path
+        self._lru: LRUCache = LRUCache(maxsize=self.maxsize)
+        self._lock = threading.Lock()
+        self._con: Optional[sqlite3.Connection] = None
+        self._disk_disabled = not self.path
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "disk_writes": 0}
+
+    @staticmethod
+    def make_key(kind: str, key: Tuple[Hashable, ...], store: Any) -> str:
+        """kind + 입력 + 스토어 버전 + 선택 로직 버전 → 문자열 키 (디스크 저장 겸용)"""
+        version = getattr(store, "content_hash", None) or f"id:{id(store)}"
+        return json.dumps(
+            [kind, list(key), version, SELECTION_VERSION, _FEATURE_TAGS_DIGEST], ensure_ascii=False
+        )
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 디스크 (SQLite)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """최초 사용 시 연결 (실패하면 메모리만 사용)"""
+        if self._con is not None or self._disk_disabled:
+            return self._con
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute("PRAGMA synchronous=NORMAL;")
+            con.execute("""
+            CREATE TABLE IF NOT EXISTS rulecard_selection (
+                cache_key TEXT PRIMARY KEY,
+                card_pos_json TEXT NOT NULL,
+                feature_tags_json TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """)
+            con.commit()
+            self._con = con
+            logger.info(f"✅ 룰카드 선택 디스크 캐시: {self.path}")
+        except Exception as e:
+            self._disk_disabled = True
+            logger.warning(f"⚠️ 룰카드 선택 디스크 캐시 사용 불가 (메모리만 사용): {e}")
+        return self._con
+
+    def _disk_get(self, key: str) -> Optional[Selection]:
+        con = self._connect()
+        if con is None:
+            return None
+        row = con.execute(
+            "SELECT card_pos_json, feature_tags_json FROM rulecard_selection WHERE cache_key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return tuple(json.loads(row[0])), tuple(json.loads(row[1]))
+
+    def _disk_put(self, key: str, value: Selection) -> None:
+        con = self._connect()
+        if con is None:
+            return
+        con.execute(
+            "INSERT OR REPLACE INTO rulecard_selection "
+            "(cache_key, card_pos_json, feature_tags_json, created_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value[0], ensure_ascii=False), json.dumps(value[1], ensure_ascii=False),
+             datetime.utcnow().isoformat())
+        )
+        con.commit()
+        self.stats["disk_writes"] += 1
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def get_or_compute(
+        self,
+        kind: str,
+        key: Tuple[Hashable, ...],
+        store: Any,
+        compute: Callable[[], Tuple[List[Any], List[str]]],
+    ) -> Tuple[List[Any], List[str]]:
+        """
+        Returns:
+            (RuleCard 목록, feature tags 목록) - 매번 새 리스트
+        """
+        cache_key = self.make_key(kind, key, store)
+        # 내용 해시가 없는 스토어는 프로세스 밖에서 같은 버전임을 보장 못 함 → 메모리만
+        persist = getattr(store, "content_hash", None) is not None
+        with self._lock:
+            value = self._lru.get(cache_key)
+            if value is not None:
+                self.stats["hits"] += 1
+            elif persist:
+                value = self._disk_get(cache_key)
+                if value is not None:
+                    self.stats["disk_hits"] += 1
+                    self._lru[cache_key] = value
+
+        if value is None:
+            cards, feature_tags = compute()
+            value = (tuple(map(store.card_position, cards)), tuple(feature_tags))
+            with self._lock:
+                self.stats["misses"] += 1
+                self._lru[cache_key] = value
+                if persist:
+                    try:
+                        self._disk_put(cache_key, value)
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ 룰카드 선택 디스크 캐시 저장 실패: {e}")
+
+        all_cards = store.cards
+        return [all_cards[i] for i in value[0]], list(value[1])
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        hit_rate = ((self.stats["hits"] + self.stats["disk_hits"]) / total * 100) if total else 0
+        return {
+            **self.stats,
+            "hit_rate": f"{hit_rate:.1f}%",
+            "size": len(self._lru),
+            "maxsize": self.maxsize,
+            "disk": not self._disk_disabled,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            for k in self.stats:
+                self.stats[k] = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+
+# 싱글톤 인스턴스
+selection_cache = SelectionCache()
@@ -2,11 +2,19 @@
 24절기 데이터 및 절입 시각 판정
 - 월주 계산의 핵심: 어느 절기 구간인지 판단
 - 입춘 기준 연주 보정
+- 절입 시각 인덱스: data/solar_terms_1899_2101.bin (tools/build_calendar_table.py 로 생성)
 """
+import struct
+import logging
+from array import array
+from bisect import bisect_right
 from datetime import datetime, date
+from pathlib import Path
 from typing import Tuple, Optional, Dict, List
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SolarTermInfo:
@@ -37,7 +45,7 @@ SOLAR_TERMS_ENTRY = [
     SolarTermInfo("소한", 11, 1, 6),   # 축월 시작
 ]
 
-# 2020-2030년 정밀 절기 시각 (KST 기준)
+# 정밀 절기 시각 (KST 기준) - 참고용, 판정에는 아래 절입 인덱스 사용
 # 형식: (년, 월, 일, 시, 분)
 # 출처: 한국천문연구원 데이터 기반
 SOLAR_TERMS_PRECISE: Dict[int, List[Tuple[int, int, int, int, int]]] = {
@@ -143,16 +151,78 @@ SOLAR_TERMS_PRECISE: Dict[int, List[Tuple[int, int, int, int, int]]] = {
 }
 
 
+# ============ 절입 시각 인덱스 ============
+# 헤더: magic(8) + 시작연도(u16) + 개수(u32)
+# 본문: int32 epoch minutes (UTC) 배열, 시작연도 입춘부터 12입절 순서대로 정렬
+# → i번째 절입: 월지 인덱스 i % 12 (0=인), 입춘 보정연도 시작연도 + i // 12
+
+TERMS_MAGIC = b"SAJUTRM1"
+TERMS_HEADER = struct.Struct("<8sHI")
+
+TERMS_FIRST_YEAR = 1899
+TERMS_LAST_YEAR = 2101
+
+DEFAULT_TERMS_PATH = Path(__file__).resolve().parents[2] / "data" / "solar_terms_1899_2101.bin"
+
+EPOCH = datetime(1970, 1, 1)
+KST_OFFSET_MINUTES = 9 * 60
+
+BOUNDARY_MINUTES = 48 * 60
+
+
+def kst_to_epoch_minutes(dt_kst: datetime) -> int:
+    """KST naive datetime → epoch minutes (UTC)"""
+    return int((dt_kst - EPOCH).total_seconds()) // 60 - KST_OFFSET_MINUTES
+
+
+def load_term_index(path: Path = DEFAULT_TERMS_PATH) -> Tuple[int, array]:
+    """절입 인덱스 로드 → (시작연도, epoch minutes 배열)"""
+    raw = Path(path).read_bytes()
+    magic, first_year, count = TERMS_HEADER.unpack_from(raw, 0)
+    if magic != TERMS_MAGIC:
+        raise ValueError(f"절입 인덱스 포맷 불일치: {path}")
+
+    minutes = array("i")
+    minutes.frombytes(raw[TERMS_HEADER.size:TERMS_HEADER.size + count * minutes.itemsize])
+    if len(minutes) != count:
+        raise ValueError(f"절입 인덱스 크기 불일치: {path}")
+    return first_year, minutes
+
+
 class SolarTermsEngine:
     """
     절기 엔진
     - 출생일시가 어느 절기 구간에 속하는지 판정
     - 월지 인덱스(0~11) 반환
     - 입춘 보정된 연도 반환
+    - 절입 시각 배열에 bisect 1회 (O(log n))
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, path: Path = DEFAULT_TERMS_PATH):
+        self.path = path
+        self._first_year: Optional[int] = None
+        self._terms: Optional[array] = None
+    
+    @property
+    def terms(self) -> array:
+        """절입 시각 배열 (최초 사용 시 로드)"""
+        if self._terms is None:
+            self._first_year, self._terms = load_term_index(self.path)
+            logger.info(f"✅ 절입 인덱스 로드: {len(self._terms)}개 ({self._first_year}년 입춘~)")
+        return self._terms
+    
+    def locate(self, year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> Tuple[int, int]:
+        """
+        출생 시각 → (직전 절입 인덱스, epoch minutes)
+        
+        절입 시각과 같은 분이면 절입 후로 판정
+        """
+        terms = self.terms
+        t = kst_to_epoch_minutes(datetime(year, month, day, hour, minute))
+        i = bisect_right(terms, t) - 1
+        if i < 0 or i + 1 >= len(terms):
+            raise ValueError(f"절입 인덱스 범위 밖: {year}-{month}-{day}")
+        return i, t
     
     def get_solar_term_month_index(
         self,
@@ -167,122 +237,31 @@ class SolarTermsEngine:
         
         Args:
             year, month, day: 양력 날짜
-            hour, minute: 시분 (정밀 계산용)
+            hour, minute: 시분 (KST)
         
         Returns:
             (월지인덱스, 입춘보정연도, 경계여부, 경계사유)
             - 월지인덱스: 0=인(寅), 1=묘(卯), ..., 11=축(丑)
             - 입춘보정연도: 입춘 전이면 year-1, 아니면 year
-            - 경계여부: 절기 ±48시간 이내면 True
+            - 경계여부: 앞/뒤 절입 ±48시간 이내면 True
             - 경계사유: "near_ipchun" | "near_term_change" | None
         """
-        birth_dt = datetime(year, month, day, hour, minute)
-        
-        # 1. 정밀 데이터가 있는 연도인지 확인
-        if year in SOLAR_TERMS_PRECISE:
-            return self._calc_with_precise_data(birth_dt, year)
-        
-        # 2. 정밀 데이터가 없으면 근사 계산 (경계 표시 필수)
-        return self._calc_with_approx_data(birth_dt, year)
-    
-    def _calc_with_precise_data(
-        self,
-        birth_dt: datetime,
-        year: int
-    ) -> Tuple[int, int, bool, Optional[str]]:
-        """정밀 절기 데이터 기반 계산"""
-        
-        terms = SOLAR_TERMS_PRECISE.get(year, [])
-        
-        # 입춘 시각 확인 (첫 번째 절기)
-        ipchun = terms[0]
-        ipchun_dt = datetime(*ipchun)
-        
-        # 입춘 보정 연도
-        if birth_dt < ipchun_dt:
-            adjusted_year = year - 1
-            # 전년도 절기 데이터 사용
-            prev_terms = SOLAR_TERMS_PRECISE.get(year - 1, [])
-            if prev_terms:
-                terms = prev_terms
-            else:
-                # 전년도 데이터 없으면 근사 계산
-                return self._calc_with_approx_data(birth_dt, year - 1, is_pre_ipchun=True)
-        else:
-            adjusted_year = year
-        
-        # 월지 인덱스 결정
-        month_idx = 11  # 기본값 (축월)
-        is_boundary = False
-        boundary_reason = None
-        
-        for i, term_data in enumerate(terms):
-            term_dt = datetime(*term_data)
-            
-            # 경계 체크 (±48시간)
-            time_diff = abs((birth_dt - term_dt).total_seconds())
-            if time_diff <= 48 * 3600:
-                is_boundary = True
-                if i == 0:
-                    boundary_reason = "near_ipchun"
-                else:
-                    boundary_reason = "near_term_change"
-            
-            # 해당 절기 이전인지 확인
-            if birth_dt < term_dt:
-                # 이전 월지
-                if i == 0:
-                    month_idx = 11  # 축월 (입춘 전)
-                else:
-                    month_idx = i - 1
-                break
-            else:
-                month_idx = i
-        
-        # 12번째(소한) 이후면 축월
-        if month_idx >= 12:
-            month_idx = 11
-        
-        return month_idx, adjusted_year, is_boundary, boundary_reason
-    
-    def _calc_with_approx_data(
-        self,
-        birth_dt: datetime,
-        year: int,
-        is_pre_ipchun: bool = False
-    ) -> Tuple[int, int, bool, Optional[str]]:
-        """근사 절기 데이터 기반 계산 (정밀 데이터 없는 연도)"""
-        
-        # 근사 입춘: 2월 4일
-        approx_ipchun = datetime(year, 2, 4, 0, 0)
-        
-        if is_pre_ipchun or birth_dt < approx_ipchun:
-            adjusted_year = year - 1 if not is_pre_ipchun else year
-        else:
-            adjusted_year = year
+        i, t = self.locate(year, month, day, hour, minute)
+        terms = self.terms
         
-        # 근사 월지 계산
-        month_idx = 11  # 기본값
+        month_idx = i % 12
+        adjusted_year = self._first_year + i // 12
         
-        for i, term_info in enumerate(SOLAR_TERMS_ENTRY):
-            approx_term = datetime(
-                year if term_info.approx_month >= 2 else year + 1,
-                term_info.approx_month,
-                term_info.approx_day,
-                0, 0
-            )
-            
-            if birth_dt < approx_term:
-                month_idx = (i - 1) % 12
-                break
-            else:
-                month_idx = i % 12
+        # 경계 체크: 가까운 쪽 절입 기준
+        prev_gap = t - terms[i]
+        next_gap = terms[i + 1] - t
+        nearest = i if prev_gap <= next_gap else i + 1
         
-        # 근사 계산은 항상 경계로 표시
-        is_boundary = True
-        boundary_reason = "approx_calculation"
+        if min(prev_gap, next_gap) <= BOUNDARY_MINUTES:
+            boundary_reason = "near_ipchun" if nearest % 12 == 0 else "near_term_change"
+            return month_idx, adjusted_year, True, boundary_reason
         
-        return month_idx, adjusted_year, is_boundary, boundary_reason
+        return month_idx, adjusted_year, False, None
     
     def is_near_solar_term(
         self,
@@ -0,0 +1,136 @@
+"""
+태그 다중 패턴 매칭 (Aho-Corasick)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- 태그 목록 → 오토마톤 1회 컴파일 (태그 목록별 LRU 캐시)
+- 카드 텍스트 1회 스캔으로 모든 태그의 포함 여부 계산
+  (기존: 태그마다 `tag in text` → 카드 × 태그 × 텍스트 길이)
+- 카드 검색 텍스트(소문자)는 RuleCardStore.load 시 1회 생성 → CardText
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+class TagMatcher:
+    """
+    Aho-Corasick 오토마톤 (소문자 비교)
+
+    - 전이표를 완전한 DFA 로 펼쳐 스캔 시 fail 링크 추적 없음
+    - score(text) = 텍스트에 포함된 태그의 가중치 합
+      같은 태그가 여러 번 주어지면 가중치도 합산
+      → `sum(w for t, w in zip(tags, weights) if t.lower() in text)` 와 같은 값
+    """
+
+    def __init__(self, patterns: Iterable[str], weights: Optional[Iterable[float]] = None):
+        patterns = list(patterns)
+        weights = [1] * len(patterns) if weights is None else list(weights)
+        total: Dict[str, float] = {}
+        for p, w in zip(patterns, weights):
+            p = p.lower()
+            total[p] = total.get(p, 0) + w
+        # 빈 문자열은 항상 포함 ("" in text == True)
+        self.always = total.pop("", 0)
+        self.patterns: Tuple[str, ...] = tuple(total)
+        self.weights: Tuple[float, ...] = tuple(total[p] for p in self.patterns)
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for pid, p in enumerate(self.patterns):
+            node = 0
+            for ch in p:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(pid)
+
+        # BFS: fail 링크 → 전이표 완성 (없는 문자는 루트로)
+        delta: List[Dict[str, int]] = [dict(g) for g in goto]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            out[node].extend(out[fail[node]])
+            for ch, nxt in delta[fail[node]].items():
+                if ch not in goto[node]:
+                    delta[node][ch] = nxt
+            for ch, nxt in goto[node].items():
+                fail[nxt] = delta[fail[node]].get(ch, 0) if node else 0
+                queue.append(nxt)
+
+        self._delta = delta
+        self._out: List[Tuple[int, ...]] = [tuple(o) for o in out]
+
+    def scan(self, text: str) -> Set[int]:
+        """text(소문자) 에 포함된 패턴 번호"""
+        delta, out = self._delta, self._out
+        found: Set[int] = set()
+        node = 0
+        for ch in text:
+            node = delta[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+    def hits(self, text: str) -> FrozenSet[str]:
+        """text(소문자) 에 포함된 태그 (소문자)"""
+        return frozenset(self.patterns[i] for i in self.scan(text))
+
+    def score(self, text: str) -> float:
+        """포함된 태그의 가중치 합"""
+        weights = self.weights
+        return self.always + sum(weights[i] for i in self.scan(text))
+
+
+@lru_cache(maxsize=64)
+def _compile(patterns: Tuple[str, ...], weights: Optional[Tuple[float, ...]]) -> TagMatcher:
+    return TagMatcher(patterns, weights)
+
+
+def get_tag_matcher(patterns: Sequence[str], weights: Optional[Sequence[float]] = None) -> TagMatcher:
+    """태그 목록(+가중치)별 오토마톤 (같은 목록이면 재사용)"""
+    return _compile(tuple(patterns), None if weights is None else tuple(weights))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 카드 검색 텍스트
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class CardText(NamedTuple):
+    """
+    소문자 카드 텍스트 "{topic} {tags} {mechanism} {action}"
+
+    section: tags 를 뺀 "{topic} {mechanism} {action}" (섹션 분배용, 생성 시 1회 계산)
+    topic_end / body_start: full 안의 section 구간 오프셋 (스냅샷 저장용)
+    """
+    full: str
+    section: str
+    topic_end: int
+    body_start: int
+
+    @classmethod
+    def from_span(cls, full: str, topic_end: int, body_start: int) -> "CardText":
+        return cls(full, full[:topic_end] + " " + full[body_start:], topic_end, body_start)
+
+
+def build_card_text(topic: Any, tags: Iterable[str], mechanism: Any, action: Any) -> CardText:
+    topic_s = f"{topic}"
+    tags_s = " ".join(tags)
+    full = f"{topic_s} {tags_s} {mechanism} {action}".lower()
+    topic_end = len(topic_s.lower())
+    return CardText.from_span(full, topic_end, topic_end + 1 + len(tags_s.lower()) + 1)
+
+
+def card_text(card: Dict[str, Any]) -> CardText:
+    """카드 dict → CardText (로드 시 만든 "_text" 가 있으면 그대로 사용)"""
+    text = card.get("_text")
+    if text is None:
+        text = build_card_text(
+            card.get("topic", ""), card.get("tags", []),
+            card.get("mechanism", ""), card.get("action", "")
+        )
+    return text
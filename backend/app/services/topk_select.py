@@ -0,0 +1,154 @@
+"""
+Top-K 선택 (heapq)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- top_k: heapq.nlargest → 전체 정렬 없이 상위 k개 (동점은 입력 순서)
+- select_diverse: 상위 일부는 점수순, 나머지는 topic 라운드로빈
+  topic 별 힙에서 꺼내므로 비용 ~ O(n + k·log n)
+- select_mmr: Maximal Marginal Relevance
+  이미 뽑힌 카드와 태그가 겹칠수록 점수 감소
+  감소분은 선택이 진행될수록 커지기만 함 → lazy greedy (힙 재평가)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import heapq
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def top_k(items: Iterable[T], k: int, key: Callable[[T], float]) -> List[T]:
+    """점수 내림차순 상위 k개 (sorted(..., reverse=True)[:k] 와 같은 결과)"""
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, items, key=key)
+
+
+def group_by(n: int, key_of: Callable[[int], Hashable]) -> Dict[Hashable, List[int]]:
+    """카드 번호 0..n-1 → {키: [번호 오름차순]} (select_diverse 의 groups 로 재사용)"""
+    groups: Dict[Hashable, List[int]] = {}
+    for i in range(n):
+        groups.setdefault(key_of(i), []).append(i)
+    return groups
+
+
+def select_diverse(
+    scores: Sequence[float],
+    k: int,
+    topic_of: Callable[[int], Hashable],
+    head_ratio: float = 0.5,
+    groups: Optional[Dict[Hashable, List[int]]] = None,
+) -> List[int]:
+    """
+    다양성 보장 Top-K (카드 번호 목록 반환)
+
+    1. 상위 int(k * head_ratio) 개는 점수순
+    2. 나머지는 topic 라운드로빈
+       - 상위 구간에 없던 topic 먼저, 그다음 이미 나온 topic
+       - 각 그룹 안에서는 topic 최고 점수 카드 순
+    동점은 항상 카드 번호 순
+
+    groups: group_by(len(scores), topic_of) 결과 (여러 번 호출할 때 재사용)
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if groups is None:
+        groups = group_by(n, topic_of)
+
+    # topic 별 힙: (-점수, 카드 번호) → 꺼내는 순서 = 점수 내림차순, 동점은 번호 순
+    heaps: Dict[Hashable, List[Tuple[float, int]]] = {}
+    for topic, ids in groups.items():
+        h = [(-scores[i], i) for i in ids]
+        if h:
+            heapq.heapify(h)
+            heaps[topic] = h
+
+    # 1. 상위 구간: topic 힙 머리들의 힙에서 꺼냄 (전체 정렬 없음)
+    heads = [(h[0], topic) for topic, h in heaps.items()]
+    heapq.heapify(heads)
+    selected: List[int] = []
+    used_topics = set()
+    for _ in range(int(k * head_ratio)):
+        (_neg, i), topic = heads[0]
+        selected.append(i)
+        used_topics.add(topic)
+        h = heaps[topic]
+        heapq.heappop(h)
+        if h:
+            heapq.heapreplace(heads, (h[0], topic))
+        else:
+            heapq.heappop(heads)
+            del heaps[topic]
+
+    by_head = sorted(heaps, key=lambda t: heaps[t][0])
+    topic_order = [t for t in by_head if t not in used_topics] + [t for t in by_head if t in used_topics]
+
+    while len(selected) < k:
+        added_any = False
+        for topic in topic_order:
+            if len(selected) >= k:
+                break
+            h = heaps[topic]
+            if h:
+                selected.append(heapq.heappop(h)[1])
+                added_any = True
+        if not added_any:
+            break
+
+    return selected
+
+
+def tag_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """태그 집합 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter) if inter else 0.0
+
+
+def select_mmr(
+    scores: Sequence[float],
+    k: int,
+    tags_of: Callable[[int], FrozenSet[str]],
+    penalty: float = 1.0,
+    topic_of: Optional[Callable[[int], Hashable]] = None,
+) -> List[int]:
+    """
+    MMR Top-K (카드 번호 목록 반환)
+
+    조정 점수 = 점수 - penalty · max(선택된 카드와의 유사도)
+    - 유사도 = 태그 Jaccard (topic_of 가 있으면 같은 topic 0.5 + Jaccard 0.5)
+    - penalty 는 점수와 같은 단위, 0 → top_k 와 같음
+    - 조정 점수는 선택이 진행될수록 줄어들기만 함
+      → 힙 최상단만 다시 계산, 다음 후보보다 여전히 크면 확정
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if penalty <= 0:
+        return top_k(range(n), k, key=scores.__getitem__)
+
+    def similarity(i: int, j: int) -> float:
+        sim = tag_similarity(tags_of(i), tags_of(j))
+        if topic_of is None:
+            return sim
+        return 0.5 * (topic_of(i) == topic_of(j)) + 0.5 * sim
+
+    # (-조정 점수, 카드 번호, 계산 시점의 선택 개수, 그때까지의 최대 유사도)
+    heap = [(-scores[i], i, 0, 0.0) for i in range(n)]
+    heapq.heapify(heap)
+
+    selected: List[int] = []
+    while heap and len(selected) < k:
+        _neg, i, seen, sim = heapq.heappop(heap)
+        if seen == len(selected):
+            selected.append(i)
+            continue
+
+        # 마지막 계산 이후 뽑힌 카드만 추가로 비교
+        for j in selected[seen:]:
+            sim = max(sim, similarity(i, j))
+        heapq.heappush(heap, (-(scores[i] - penalty * sim), i, len(selected), sim))
+
+    return selected
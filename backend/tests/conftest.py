@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_kasi_cache(tmp_path, monkeypatch):
+    """KASI 디스크 캐시 싱글톤을 테스트별 임시 경로로 (저장소 data/ 에 쓰지 않음)"""
+    from app.services.kasi_disk_cache import kasi_disk_cache
+
+    kasi_disk_cache.close()
+    monkeypatch.setattr(kasi_disk_cache, "path", str(tmp_path / "kasi_cache.sqlite3"))
+    monkeypatch.setattr(kasi_disk_cache, "_disabled", False)
+    yield kasi_disk_cache
+    kasi_disk_cache.close()
@@ -0,0 +1,91 @@
+"""
+계산 결과 캐시 테스트 (키 / singleflight / 통계)
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import app
+from app.services.cache import CacheService, cache_service
+
+KEY = dict(year=1990, month=5, day=15, hour=14, minute=30,
+           use_solar_time=True, gender="male", timezone="Asia/Seoul")
+
+
+def test_concurrent_misses_share_one_computation():
+    cache = CacheService()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"value": len(calls)}
+
+    async def main():
+        results = await asyncio.gather(*[cache.get_or_compute_saju(compute, **KEY) for _ in range(10)])
+        again = await cache.get_or_compute_saju(compute, **KEY)
+        return results, again
+
+    results, again = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r == {"value": 1} for r in results) and again == {"value": 1}
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["coalesced"]) == (1, 1, 9)
+
+
+@pytest.mark.parametrize("field,value", [
+    ("minute", 0), ("use_solar_time", False), ("gender", "female"), ("hour", None)
+])
+def test_key_covers_every_input(field, value):
+    cache = CacheService()
+    cache.set_saju(*KEY.values(), data={"v": 1})
+    assert cache.get_saju(*{**KEY, field: value}.values()) is None
+    assert cache.get_saju(*KEY.values()) == {"v": 1}
+
+
+def test_key_rolls_over_with_kst_year(monkeypatch):
+    """current_daeun 은 올해 기준 → 해가 바뀌면 캐시 miss"""
+    cache = CacheService()
+    monkeypatch.setattr("app.services.cache._kst_year", lambda: 2026)
+    cache.set_saju(*KEY.values(), data={"calculation_method": "kasi_api"})
+    assert cache.get_saju(*KEY.values()) is not None
+    monkeypatch.setattr("app.services.cache._kst_year", lambda: 2027)
+    assert cache.get_saju(*KEY.values()) is None
+
+
+def test_fallback_result_uses_short_ttl_cache():
+    """KASI 가 아닌 결과(만세력 테이블/ephem)는 짧은 TTL 캐시에만 저장"""
+    cache = CacheService()
+    kasi = {**KEY, "minute": 0}
+
+    async def main():
+        await cache.get_or_compute_saju(lambda: asyncio.sleep(0, {"calculation_method": "kasi_api"}), **kasi)
+        await cache.get_or_compute_saju(lambda: asyncio.sleep(0, {"calculation_method": "ephem_astronomical"}), **KEY)
+
+    asyncio.run(main())
+    assert cache.saju_fallback_cache.ttl < cache.saju_cache.ttl
+    assert (len(cache.saju_cache), len(cache.saju_fallback_cache)) == (1, 1)
+    assert cache.get_saju(*KEY.values()) == {"calculation_method": "ephem_astronomical"}
+
+
+def test_calculate_route_uses_cache():
+    client = TestClient(app)
+    cache_service.clear()
+    body = {"birth_year": 1978, "birth_month": 5, "birth_day": 16, "birth_hour": 10, "birth_minute": 30}
+
+    first = client.post("/api/v1/calculate", json=body)
+    second = client.post("/api/v1/calculate", json=body)
+    toggled = client.post("/api/v1/calculate?use_solar_time=false", json=body)
+
+    assert first.status_code == 200 and first.json() == second.json()
+    assert toggled.status_code == 200
+
+    stats = client.get("/api/v1/calculate/cache-stats").json()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert "latency_ms" in stats
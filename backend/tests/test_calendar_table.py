@@ -0,0 +1,179 @@
+"""
+만세력 테이블 테스트
+"""
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.calendar_table import get_calendar_table
+from app.services.engine_v2 import SajuManager, scientific_engine
+from app.services.ganji import GanjiCalculator
+
+table = get_calendar_table()
+pytestmark = pytest.mark.skipif(table is None, reason="만세력 테이블 파일 없음")
+
+
+class TestCalendarTable:
+    """테이블 조회 vs ephem 직접 계산"""
+
+    @pytest.mark.parametrize("y,m,d,h,mi", [
+        (1900, 1, 1, 0, 0),
+        (1978, 3, 6, 5, 0),
+        (1990, 5, 15, 14, 30),
+        (2000, 1, 1, 12, 0),
+        (2024, 2, 4, 17, 30),
+        (2100, 12, 31, 23, 59),
+    ])
+    def test_matches_ephem(self, y, m, d, h, mi):
+        manager = SajuManager()
+        a = manager._table_calculate_ganji(y, m, d, h, mi)
+        b = manager._ephem_calculate_ganji(y, m, d, h, mi)
+        assert (a["year_ganji"], a["month_ganji"], a["day_ganji"]) == \
+            (b["year_ganji"], b["month_ganji"], b["day_ganji"])
+        assert abs(a["solar_longitude"] - b["solar_longitude"]) < 0.02
+
+    def test_ipchun_2025(self):
+        """2025 입춘: 2월 3일 23:10 KST (KASI)"""
+        before = table.lookup(2025, 2, 3, 23, 0)
+        after = table.lookup(2025, 2, 3, 23, 20)
+        assert before["year_idx"] != after["year_idx"]
+        assert after["month_idx"] % 12 == 2  # 인월
+
+    def test_out_of_range(self):
+        assert not table.covers(1899)
+        assert SajuManager()._table_calculate_ganji(1899, 6, 1) is None
+
+
+class TestCalendarTableConsumers:
+    """ScientificSajuEngine / GanjiCalculator 테이블 사용"""
+
+    def test_scientific_engine(self):
+        result = scientific_engine.calculate(2000, 1, 1, 12)
+        assert result["day_pillar"]["ganji"] == "무오"
+        assert result["meta"]["calculation_method"] == "calendar_table"
+
+    def test_ganji_day(self):
+        assert GanjiCalculator.calc_day_ganji(2000, 1, 1)[:2] == ("무", "오")
+
+
+class TestSolarTermIndex:
+    """절입 인덱스 (SolarTermsEngine)"""
+
+    def test_ipchun_2025(self):
+        from app.services.solar_terms import solar_terms_engine
+        assert solar_terms_engine.get_solar_term_month_index(2025, 2, 3, 23, 9)[:2] == (11, 2024)
+        assert solar_terms_engine.get_solar_term_month_index(2025, 2, 3, 23, 11) == (0, 2025, True, "near_ipchun")
+
+    def test_not_boundary(self):
+        from app.services.solar_terms import solar_terms_engine
+        assert solar_terms_engine.get_solar_term_month_index(1990, 5, 20, 12) == (3, 1990, False, None)
+
+    def test_matches_calendar_table(self):
+        from app.services.solar_terms import solar_terms_engine
+        for y, m, d, h in [(1900, 1, 1, 0), (1955, 8, 8, 6), (2100, 12, 31, 23)]:
+            month_idx, adjusted_year, _, _ = solar_terms_engine.get_solar_term_month_index(y, m, d, h)
+            row = table.lookup(y, m, d, h)
+            assert (month_idx + 2) % 12 == row["month_idx"] % 12
+            assert (adjusted_year - 4) % 12 == row["year_idx"] % 12
+
+
+class TestBatchCalculate:
+    """/calculate/batch (NumPy 벡터 연산)"""
+
+    def test_matches_single_calculation(self):
+        from app.services.saju_engine import saju_engine
+        rows = [(1978, 5, 16, 10, 30), (2025, 2, 3, None, 0), (2025, 2, 3, 23, 20), (2000, 1, 1, 0, 10)]
+        cols = saju_engine.calculate_batch(*map(list, zip(*rows)))
+        for i, (y, m, d, h, mi) in enumerate(rows):
+            single = scientific_engine.calculate(y, m, d, h, mi)
+            assert cols["year_pillar"][i] == single["year_pillar"]["ganji"]
+            assert cols["month_pillar"][i] == single["month_pillar"]["ganji"]
+            assert cols["day_pillar"][i] == single["day_pillar"]["ganji"]
+            assert cols["hour_pillar"][i] == (single["hour_pillar"]["ganji"] if h is not None else None)
+
+    def test_endpoint(self):
+        from fastapi.testclient import TestClient
+        from app.main import app
+        client = TestClient(app)
+        body = {"birth_year": [1978, 1990], "birth_month": [5, 2], "birth_day": [16, 30]}
+
+        assert client.post("/api/v1/calculate/batch", json=body).status_code == 400
+
+        body["birth_day"] = [16, 28]
+        response = client.post("/api/v1/calculate/batch", json=body)
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+
+        response = client.post("/api/v1/calculate/batch?format=ndjson", json=body)
+        assert len(response.text.strip().splitlines()) == 2
+
+        # batch 는 compute_pool 에서 실행
+        stats = client.get("/api/v1/calculate/compute-stats").json()
+        assert stats["completed"] >= 2 and stats["pending"] == 0
+
+
+class TestHourVariants:
+    """시간 모름 → 12시진 후보"""
+
+    def test_matches_single_calculation(self):
+        import asyncio
+        from app.services.saju_engine import saju_engine
+        result = asyncio.run(saju_engine.calculate_hour_variants(1978, 5, 16))
+        assert not result["month_varies"]
+        assert len(result["variants"]) == 12
+        for v in result["variants"]:
+            # 시진 시작 시각 +30분 (태양시 보정 후에도 같은 시진)
+            hour = (v["index"] * 2 - 1) % 24
+            single = scientific_engine.calculate(1978, 5, 16, hour, 30)
+            assert v["hour_pillar"]["ganji"] == single["hour_pillar"]["ganji"]
+
+    def test_ipchun_day(self):
+        import asyncio
+        from app.services.saju_engine import saju_engine
+        result = asyncio.run(saju_engine.calculate_hour_variants(1990, 2, 4))
+        assert result["month_varies"]
+        years = {v["year_pillar"]["ganji"] for v in result["variants"]}
+        assert years == {"기사", "경오"}
+
+    def test_endpoint(self):
+        from fastapi.testclient import TestClient
+        from app.main import app
+        client = TestClient(app)
+        body = {"birth_year": 1978, "birth_month": 5, "birth_day": 16}
+        data = client.post("/api/v1/calculate/hour-variants", json=body).json()
+        assert data["success"] and len(data["variants"]) == 12
+        assert all(set(v["feature_tags_delta"]) == {"added", "removed"} for v in data["variants"])
+
+
+class TestPillarRecords:
+    """60갑자 기둥 레코드 공유"""
+
+    def test_shared_and_immutable(self):
+        import pickle
+        from app.services.engine_v2 import PILLARS
+        r1 = scientific_engine.calculate(1978, 5, 16, 10, 30)
+        r2 = scientific_engine.calculate(1978, 5, 16, 10, 30)
+        assert r1["day_pillar"] is r2["day_pillar"]
+        assert r1["day_pillar"] in PILLARS
+        assert pickle.loads(pickle.dumps(r1["year_pillar"])) is r1["year_pillar"]
+        with pytest.raises(AttributeError):
+            r1["day_pillar"].gan = "갑"
+
+    def test_same_as_dict(self):
+        from app.services.engine_v2 import PILLARS
+        p = PILLARS[0]
+        assert p == {
+            "ganji": "갑자", "gan": "갑", "ji": "자", "gan_hanja": "甲", "ji_hanja": "子",
+            "gan_element": "목", "ji_element": "수", "gan_index": 0, "ji_index": 0
+        }
+        assert [q.ganji for q in PILLARS[:3]] == ["갑자", "을축", "병인"]
+
+    def test_engine_pillar_models(self):
+        from app.services.saju_engine import saju_engine
+        a = saju_engine.calculate(1978, 5, 16, 10, 30)
+        b = saju_engine.calculate(1978, 5, 16, 10, 30)
+        assert a.saju.day_pillar is b.saju.day_pillar
+        assert a.saju.day_pillar.model_dump()["ganji"] == "무인"
+        assert len(saju_engine.get_hour_options()) == 12
@@ -0,0 +1,50 @@
+"""
+대운 계산 테스트
+"""
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.daeun import calculate_daeun, daeun_direction, get_daeun_cache_info
+
+
+class TestDaeun:
+    """1978-05-16 10:30 (무오년 정사월) 기준"""
+
+    def _calc(self, gender):
+        # 정사 = 갑을병정(3) / 자축인묘진사(5)
+        return calculate_daeun(1978, 5, 16, 10, 30, gender, year_gan_idx=4, month_gan_idx=3, month_ji_idx=5)
+
+    def test_direction(self):
+        assert daeun_direction(4, "male") == "forward"     # 무(양) 남
+        assert daeun_direction(4, "female") == "backward"
+        assert daeun_direction(5, "여") == "forward"       # 기(음) 여
+
+    def test_forward(self):
+        # 다음 절입 망종(6/6) 까지 약 21일 → 7
+        daeun = self._calc("male")
+        assert daeun["start_age"] == 7
+        assert [p["ganji"] for p in daeun["pillars"][:3]] == ["무오", "기미", "경신"]
+        assert daeun["pillars"][1]["start_age"] == 17
+        assert len(daeun["pillars"]) == 10
+
+    def test_backward(self):
+        # 직전 절입 입하(5/5 23시) 부터 약 10.5일 → 3
+        daeun = self._calc("female")
+        assert daeun["start_age"] == 3
+        assert [p["ganji"] for p in daeun["pillars"][:3]] == ["병진", "을묘", "갑인"]
+
+    def test_cached(self):
+        self._calc("male")
+        hits = get_daeun_cache_info()["hits"]
+        self._calc("male")
+        assert get_daeun_cache_info()["hits"] == hits + 1
+
+    def test_engine_daeun(self):
+        from app.services.saju_engine import saju_engine
+        result = saju_engine.calculate(1978, 5, 16, 10, 30, gender="male")
+        assert result.daeun.start_age == 7
+        assert result.daeun.pillars[0].ganji == "무오"
+        assert saju_engine.calculate(1978, 5, 16, 10, 30).daeun is None
@@ -0,0 +1,115 @@
+"""
+KASI 공용 HTTP 클라이언트 테스트 (singleflight)
+"""
+import asyncio
+from pathlib import Path
+
+import httpx
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.kasi_http import KasiHttpClient
+
+
+def _run_with_mock(client: KasiHttpClient, handler, coro_factory):
+    async def main():
+        await client.startup()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await coro_factory()
+        finally:
+            await client.aclose()
+    return asyncio.run(main())
+
+
+def test_identical_requests_share_one_upstream_call():
+    client = KasiHttpClient()
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"ok": request.url.params["solDay"]})
+
+    def requests():
+        same = [client.get_json("http://kasi/lunar", {"solDay": "15"}) for _ in range(20)]
+        other = client.get_json("http://kasi/lunar", {"solDay": "16"})
+        return asyncio.gather(*same, other)
+
+    results = _run_with_mock(client, handler, requests)
+    assert len(calls) == 2
+    assert results[0] == {"ok": "15"} and results[-1] == {"ok": "16"}
+    assert client.stats["coalesced"] == 19
+
+
+def test_errors_propagate_to_all_waiters():
+    client = KasiHttpClient()
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(500)
+
+    def requests():
+        return asyncio.gather(
+            *[client.get_json("http://kasi/lunar", {"solDay": "1"}) for _ in range(3)],
+            return_exceptions=True
+        )
+
+    results = _run_with_mock(client, handler, requests)
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+def test_disk_cache_serves_repeat_lookups(tmp_path, monkeypatch):
+    import app.services.engine_v2 as engine_v2
+    from app.services.kasi_disk_cache import KasiDiskCache
+
+    cache = KasiDiskCache(str(tmp_path / "kasi.sqlite3"))
+    monkeypatch.setattr(engine_v2, "kasi_disk_cache", cache)
+    manager = engine_v2.SajuManager(kasi_api_key="test")
+    client = engine_v2.kasi_http
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        item = {"lunSecha": "경오(庚午)", "lunWolgeon": "신사(辛巳)", "lunIljin": "경진(庚辰)"}
+        return httpx.Response(200, json={"response": {"body": {"items": {"item": item}}}})
+
+    async def lookups():
+        first = await manager._fetch_kasi_lunar(1990, 5, 15)
+        second = await manager._fetch_kasi_lunar(1990, 5, 15)
+        return first, second
+
+    first, second = _run_with_mock(client, handler, lookups)
+    assert first == second and first["day_ganji"] == "경진(庚辰)"
+    assert len(calls) == 1
+
+    # 키 없이도 캐시된 날짜는 응답
+    no_key = engine_v2.SajuManager()
+    assert asyncio.run(no_key._fetch_kasi_lunar(1990, 5, 15))["year_ganji"] == "경오(庚午)"
+
+
+def test_disk_cache_does_not_block_event_loop(tmp_path):
+    """캐시 sqlite 작업이 잠금에 막혀도 이벤트 루프는 계속 돈다 (스레드에서 실행)"""
+    from app.services.kasi_disk_cache import KasiDiskCache
+
+    cache = KasiDiskCache(str(tmp_path / "kasi.sqlite3"))
+    cache.set_lunar(1990, 5, 15, {"lunIljin": "경진(庚辰)"})
+
+    async def main():
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        cache._lock.acquire()  # 다른 워커의 쓰기가 잠금을 잡고 있는 상황
+        lookup = asyncio.create_task(cache.aget_lunar(1990, 5, 15))
+        await ticker()
+        cache._lock.release()
+        return len(ticks), await lookup
+
+    ticks, item = asyncio.run(main())
+    assert ticks == 5 and item == {"lunIljin": "경진(庚辰)"}
+    cache.close()
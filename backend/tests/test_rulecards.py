@@ -0,0 +1,648 @@
+"""
+룰카드 저장소 / 선택 테스트
+- data/SajuOS_RuleCards_JSON 일부로 JSONL 을 만들어 사용
+"""
+import json
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rulecards_store import RuleCardStore, explode_tag_tokens, canon_tag
+from app.services.rulecard_selector import select_cards_for_preset, score_card
+from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
+from app.services.focus_boost import boost_preset_focus
+from app.services.feature_tags_no_time import build_feature_tags_no_time_from_pillars
+
+CARDS_DIR = Path(__file__).parent.parent / "data" / "SajuOS_RuleCards_JSON"
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    files = sorted(CARDS_DIR.glob("*/*.json"))[::4]
+    if not files:
+        pytest.skip("룰카드 원본 JSON 없음")
+    path = tmp_path_factory.mktemp("rulecards") / "master.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for p in files:
+            for card in json.loads(p.read_text(encoding="utf-8")).get("rulecards", []):
+                f.write(json.dumps(card, ensure_ascii=False) + "\n")
+    s = RuleCardStore(str(path))
+    s.load()
+    return s
+
+
+def brute_force_select(store, preset, feature_tags):
+    """전수 점수 계산 기준 구현 (선택 결과 비교용)"""
+    used = set()
+    user_tags = {x for t in feature_tags for x in explode_tag_tokens(t)}
+    out = []
+    for sec in preset["sections"]:
+        focus = {canon_tag(x) for x in sec["focusTags"]}
+        ids = []
+        for tq in sec["perTopic"]:
+            topic, k = tq["topic"], int(tq["k"])
+            pool = [c for c in store.by_topic.get(topic, []) if c.id not in used]
+            if topic == "HEALTH" and len(pool) < k:
+                pool = [c for c in store.by_topic.get("ELEMENTS", []) if c.id not in used]
+            ranked = sorted(
+                ((c, score_card(store, c, user_tags, focus)) for c in pool),
+                key=lambda x: x[1]["total"], reverse=True
+            )
+            got = 0
+            for stage in (
+                [x for x in ranked if x[1]["overlap"] >= 2],
+                [x for x in ranked if x[1]["overlap"] >= 1],
+                [x for x in ranked if x[1]["focusHit"] >= 1],
+                ranked,
+            ):
+                for c, _ in stage:
+                    if got >= k:
+                        break
+                    if c.id in used:
+                        continue
+                    used.add(c.id)
+                    ids.append(c.id)
+                    got += 1
+        out.append(ids)
+    return out
+
+
+class TestPostings:
+    def test_sorted_and_complete(self, store):
+        for token, ids in list(store.postings.items())[:200]:
+            assert list(ids) == sorted(set(ids))
+            for i in ids:
+                assert token in {x for t in store.cards[i].tags for x in explode_tag_tokens(t)}
+
+    def test_topic_rank(self, store):
+        for i, c in enumerate(store.cards[:300]):
+            assert store.by_topic[c.topic][store.topic_rank[i]] is c
+
+
+class TestSelection:
+    @pytest.mark.parametrize("backend", ["index", "matrix"])
+    @pytest.mark.parametrize("pillars", [
+        ("무오", "정사", "무인"),
+        ("갑자", "병인", "경오"),
+        ("을해", "기묘", "계유"),
+    ])
+    def test_matches_brute_force(self, store, pillars, backend):
+        tags = build_feature_tags_no_time_from_pillars(*pillars)["tags"]
+        preset = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags)
+        result = select_cards_for_preset(store, preset, tags, backend=backend)
+        assert [[c["id"] for c in sec["cards"]] for sec in result["sections"]] == \
+            brute_force_select(store, preset, tags)
+
+    def test_worker_uses_postings(self, store):
+        from app.services.report_worker import ReportWorker
+        tags = build_feature_tags_no_time_from_pillars("무오", "정사", "무인")["tags"]
+        selected = ReportWorker()._select_rulecards(store, tags)
+        tag_set = set(tags)
+        assert selected and all(tag_set & set(c["tags"]) for c in selected)
+
+    def test_worker_prefilter_ignores_case(self, tmp_path):
+        from app.services.report_worker import ReportWorker
+        path = tmp_path / "cards.jsonl"
+        rows = [
+            {"id": "RC-a", "topic": "CAREER", "tags": ["CEO", "리더십"], "priority": 5},
+            {"id": "RC-b", "topic": "CAREER", "tags": ["Startup"], "priority": 9},
+            {"id": "RC-c", "topic": "MONEY", "tags": ["현금"], "priority": 1},
+        ]
+        path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
+        s = RuleCardStore(str(path))
+        s.load()
+        # 대소문자만 다른 태그도 (기존 소문자 비교와 같이) 선택
+        selected = ReportWorker()._pick_rulecards(s, s.cards, ["ceo", "STARTUP"])
+        assert [c.id for c in selected] == ["RC-b", "RC-a"]
+
+
+class TestCompiledCards:
+    def test_tokens_precomputed(self, store):
+        card = store.cards[0]
+        assert not hasattr(card, "__dict__")
+        expected = sorted({x for t in card.tags for x in explode_tag_tokens(t)})
+        assert list(card.tokens) == expected
+        assert [store.vocab[t] for t in card.tokens] == list(card.token_ids)
+        assert list(card.token_idf) == [store.idf[t] for t in card.tokens]
+        assert set(card.to_dict()) == {
+            "id", "topic", "tags", "priority", "trigger",
+            "mechanism", "interpretation", "action", "cautions", "_text"
+        }
+
+    def test_frozen_card_and_readonly_view(self, store):
+        import dataclasses
+        from app.services.rulecards_store import CardView
+        card = store.cards[0]
+        assert isinstance(card.tags, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            card.priority = 0.0
+        # 같은 토픽/태그 문자열은 카드끼리 같은 객체 (intern)
+        same_topic = store.by_topic[card.topic]
+        assert len(same_topic) > 1 and all(c.topic is card.topic for c in same_topic)
+        tag = card.tags[0]
+        other = next(c for c in store.cards[1:] if tag in c.tags)
+        assert other.tags[other.tags.index(tag)] is tag
+
+        views = store.card_dicts(store.cards[:50])
+        for card, view in zip(store.cards[:50], views):
+            assert isinstance(view, CardView)
+            assert dict(view) == card.to_dict()
+            assert view["tags"] is card.tags and view.get("subtopic", "") == ""
+            with pytest.raises(TypeError):
+                view["action"] = "x"
+
+    def test_index_scores_equal_score_card(self, store):
+        from app.services.rulecard_selector import _accumulate, _score_from_index
+        tags = build_feature_tags_no_time_from_pillars("무오", "정사", "무인")["tags"]
+        user_tags = {x for t in tags for x in explode_tag_tokens(t)}
+        focus = {"재성", "관리", "사업"}
+        user_acc = _accumulate(store, user_tags, weighted=True)
+        focus_acc = _accumulate(store, focus, weighted=False)
+        for cid in list(user_acc)[:300]:
+            card = store.cards[cid]
+            assert _score_from_index(card, user_acc, focus_acc, cid) == score_card(store, card, user_tags, focus)
+
+
+class TestMatrixBackend:
+    def test_scores_equal_score_card(self, store):
+        from app.services.rulecard_matrix import get_rulecard_matrix, NUMPY_AVAILABLE
+        if not NUMPY_AVAILABLE:
+            pytest.skip("numpy 미설치")
+        tags = build_feature_tags_no_time_from_pillars("갑자", "병인", "경오")["tags"]
+        user_tags = {x for t in tags for x in explode_tag_tokens(t)}
+        focus = {"재성", "관리", "사업", "없는태그"}
+        matrix = get_rulecard_matrix(store)
+        scores = matrix.score(matrix.score_user(user_tags), focus)
+        for cid, card in enumerate(store.cards):
+            expected = score_card(store, card, user_tags, focus)
+            assert scores["overlap"][cid] == expected["overlap"]
+            assert scores["focusHit"][cid] == expected["focusHit"]
+            assert scores["total"][cid] == expected["total"]
+
+
+class TestRuleCardScorer:
+    """사업가 핵심태그 스코어러 (섹션 공통 부분 1회 계산)"""
+
+    CARDS = [
+        {"id": "a", "topic": "재물운", "tags": ["財星", "정재", "投資"]},
+        {"id": "b", "topic": "사업 진로", "tags": ["創業", "事業", "관리"]},
+        {"id": "c", "topic": "건강", "tags": "健康"},
+        {"id": "d", "topic": "", "tags": ["정재", "財星", "財星"]},
+        {"id": "e", "topic": "사업 진로", "tags": ["大運"]},
+    ]
+
+    def reference_score(self, card, section_id, feature_tags):
+        from app.services.rulecard_scorer import BUSINESS_CORE_TAGS_50, SECTION_TAG_WEIGHTS, rulecard_scorer
+        tags = card["tags"] if isinstance(card["tags"], list) else [card["tags"]]
+        weights = SECTION_TAG_WEIGHTS.get(section_id, {})
+        base = 0.0
+        for t in tags:
+            if t in BUSINESS_CORE_TAGS_50:
+                base += BUSINESS_CORE_TAGS_50[t] * weights.get(t, 1)
+        bonus = sum(1 for f in feature_tags if f in tags) * 5
+        return base + bonus + rulecard_scorer._get_topic_relevance(card["topic"], section_id)
+
+    def test_scores_match_formula(self):
+        from app.services.rulecard_scorer import RuleCardScorer
+        feature_tags = ["정재", "관리"]
+        results = RuleCardScorer(cards_per_section=5).score_all_sections(self.CARDS, feature_tags, ["money", "business"])
+        by_id = {c["id"]: c for c in self.CARDS}
+        for section_id, section in results.items():
+            assert section.total_cards == 5
+            for sc in section.cards:
+                assert sc.score == pytest.approx(self.reference_score(by_id[sc.card_id], section_id, feature_tags))
+        money = {c.card_id: c for c in results["money"].cards}
+        assert money["d"].matched_tags == ["財星", "財星"]
+        # 두 번째 섹션: 첫 섹션에서 쓴 topic 은 다양성 보너스 없음
+        assert all(c.diversity_bonus == 0.0 for c in results["business"].cards)
+
+    def test_single_section_same_as_all(self):
+        from app.services.rulecard_scorer import RuleCardScorer
+        scorer = RuleCardScorer(cards_per_section=3)
+        single = scorer.score_cards_for_section(self.CARDS, "money", ["정재"])
+        assert single == scorer.score_all_sections(self.CARDS, ["정재"], ["money"])["money"]
+
+
+class TestTopK:
+    """heapq Top-K / 다양성 / MMR 선택"""
+
+    @staticmethod
+    def make(n=400, seed=0):
+        import random
+        rnd = random.Random(seed)
+        scores = [rnd.choice([0.0, 1.0, 2.5, 5.0, 7.0]) for _ in range(n)]
+        topics = [rnd.choice("ABCDEF") for _ in range(n)]
+        tags = [frozenset(rnd.sample("abcdefghij", 3)) for _ in range(n)]
+        return scores, topics, tags
+
+    def test_diverse_matches_sorted_round_robin(self):
+        from app.services.topk_select import select_diverse
+        scores, topics, _ = self.make()
+        for k in (1, 7, 40, 1000):
+            order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+            k2 = min(k, len(order))
+            expected = order[:k2 // 2]
+            used = {topics[i] for i in expected}
+            queues = {}
+            for i in order[k2 // 2:]:
+                queues.setdefault(topics[i], []).append(i)
+            topic_order = [t for t in queues if t not in used] + [t for t in queues if t in used]
+            while len(expected) < k2:
+                for t in topic_order:
+                    if queues[t] and len(expected) < k2:
+                        expected.append(queues[t].pop(0))
+            assert select_diverse(scores, k, topic_of=topics.__getitem__) == expected
+
+    def test_mmr_matches_greedy(self):
+        from app.services.topk_select import select_mmr, tag_similarity, top_k
+        scores, topics, tags = self.make(150, seed=3)
+        assert select_mmr(scores, 20, tags.__getitem__, penalty=0) == top_k(range(150), 20, key=scores.__getitem__)
+
+        def sim(i, j):
+            return 0.5 * (topics[i] == topics[j]) + 0.5 * tag_similarity(tags[i], tags[j])
+
+        picked = []
+        while len(picked) < 20:
+            rest = [i for i in range(150) if i not in picked]
+            adjusted = {i: scores[i] - 3.0 * max([sim(i, j) for j in picked], default=0.0) for i in rest}
+            picked.append(max(rest, key=lambda i: (adjusted[i], -i)))
+        got = select_mmr(scores, 20, tags.__getitem__, penalty=3.0, topic_of=topics.__getitem__)
+        assert got == picked
+        assert len({topics[i] for i in got}) >= len({topics[i] for i in top_k(range(150), 20, key=scores.__getitem__)})
+
+    def test_scorer_mmr_mode(self):
+        from app.services.rulecard_scorer import RuleCardScorer
+        cards = TestRuleCardScorer.CARDS
+        plain = RuleCardScorer(cards_per_section=3).score_cards_for_section(cards, "money", ["정재"])
+        mmr = RuleCardScorer(cards_per_section=3, mmr_penalty=100).score_cards_for_section(cards, "money", ["정재"])
+        assert plain.cards[0].card_id == mmr.cards[0].card_id
+        assert len(mmr.topic_distribution) == 3
+
+
+class TestTagMatcher:
+    """Aho-Corasick 태그 매칭 = 태그별 `in` 검사"""
+
+    def test_matches_substring_checks(self):
+        import random
+        from app.services.tag_matcher import TagMatcher
+        rnd = random.Random(7)
+        patterns = ["재성", "재", "성재", "재성재", "KPI", "kpi", "", "관성", "성"]
+        weights = [3.0, 1.0, 2.0, 5.0, 1.0, 1.0, 1.0, 2.0, 0.5]
+        m = TagMatcher(patterns, weights)
+        for _ in range(300):
+            text = "".join(rnd.choice("재성관kpi ") for _ in range(rnd.randint(0, 12)))
+            expected = sum(w for p, w in zip(patterns, weights) if p.lower() in text)
+            assert m.score(text) == expected
+            assert m.hits(text) == {p.lower() for p in patterns if p and p.lower() in text}
+
+    def test_report_scoring_matches_text_search(self, store):
+        from app.services.report_builder import (
+            BUSINESS_OWNER_CORE_TAGS, SECTION_WEIGHT_TAGS, score_rulecard_global,
+        )
+        from app.services.tag_matcher import card_text, get_tag_matcher
+        tags = build_feature_tags_no_time_from_pillars("무오", "정사", "무인")["tags"]
+        for card in store.cards[:500]:
+            d = card.to_dict()
+            plain = {k: v for k, v in d.items() if k != "_text"}
+            text = f"{d['topic']} {' '.join(d['tags'])} {d['mechanism']} {d['action']}".lower()
+            expected = sum(3.0 for t in tags if t.lower() in text) + \
+                sum(1.0 for t in BUSINESS_OWNER_CORE_TAGS if t.lower() in text)
+            assert score_rulecard_global(d, tags) == score_rulecard_global(plain, tags) == expected
+            section_text = f"{d['topic']} {d['mechanism']} {d['action']}".lower()
+            assert card_text(d).section == section_text
+            money = SECTION_WEIGHT_TAGS["money"]
+            assert get_tag_matcher(money).score(section_text) == sum(1 for t in money if t.lower() in section_text)
+
+
+class TestSnapshot:
+    """바이너리 스냅샷 = JSONL 로드 결과"""
+
+    def test_roundtrip_and_stale(self, store, tmp_path):
+        import shutil
+        from app.services.rulecards_snapshot import snapshot_path_for, source_hash, write_snapshot
+
+        jsonl = tmp_path / "cards.jsonl"
+        shutil.copy(store.path, jsonl)
+        write_snapshot(store, snapshot_path_for(str(jsonl)), source_hash(str(jsonl)))
+
+        snap = RuleCardStore(str(jsonl))
+        snap.load()
+        assert snap.loaded_from == "snapshot"
+        assert snap.content_hash == store.content_hash
+        assert snap.cards == store.cards
+        for a, b in zip(snap.cards, store.cards):
+            assert (a.tokens, a.token_ids, a.token_idf, a.text) == (b.tokens, b.token_ids, b.token_idf, b.text)
+        assert snap.idf == store.idf and snap.vocab == store.vocab
+        assert list(snap.topic_rank) == list(store.topic_rank)
+        assert {k: list(v) for k, v in snap.postings.items()} == {k: list(v) for k, v in store.postings.items()}
+        assert {t: [c.id for c in pool] for t, pool in snap.by_topic.items()} == \
+            {t: [c.id for c in pool] for t, pool in store.by_topic.items()}
+
+        # 원본이 바뀌면 stale → JSONL 로드
+        with open(jsonl, "a", encoding="utf-8") as f:
+            f.write("\n")
+        stale = RuleCardStore(str(jsonl))
+        stale.load()
+        assert stale.loaded_from == "jsonl"
+        assert stale.cards == store.cards
+
+
+class TestHotReload:
+    """핫 리로드: 내용이 바뀔 때만 교체, 기존 스토어 참조는 그대로"""
+
+    def test_reload_swaps_only_on_change(self, store, tmp_path):
+        import asyncio
+        import shutil
+        from app.services.rulestore_manager import RuleStoreManager
+
+        jsonl = tmp_path / "cards.jsonl"
+        shutil.copy(store.path, jsonl)
+        manager = RuleStoreManager()
+        seen = []
+        first = manager.load(str(jsonl))
+        manager.subscribe(seen.append)
+        v1 = manager.version
+        assert v1 == store.content_hash[:12] and seen == [first]
+
+        result = asyncio.run(manager.reload())
+        assert result["swapped"] is False and manager.store is first
+
+        lines = jsonl.read_text(encoding="utf-8").splitlines(keepends=True)
+        jsonl.write_text("".join(lines[:-1]), encoding="utf-8")
+        result = asyncio.run(manager.reload())
+        assert result["swapped"] is True and result["previous_version"] == v1
+        assert manager.version != v1 and seen[-1] is manager.store
+        assert len(manager.store.cards) == len(first.cards) - 1
+        # 이전 버전을 들고 있던 잡은 그대로
+        assert len(first.cards) == len(store.cards)
+
+
+class TestSelectionCache:
+    """선택 캐시 결과 = 매번 새로 선택한 결과 (메모리 / 디스크)"""
+
+    def test_cached_selection_matches(self, store, tmp_path):
+        from app.services.selection_cache import SelectionCache
+
+        tags = build_feature_tags_no_time_from_pillars("갑자", "병인", "무진", overlay_year=2026)["tags"]
+        preset = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags)
+        expected = [c for sec in select_cards_for_preset(store, preset, tags)["sections"] for c in sec["cards"]]
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            sel = select_cards_for_preset(store, preset, tags, as_cards=True)
+            return [c for sec in sel["sections"] for c in sec["cards"]], tags
+
+        path = str(tmp_path / "selection.sqlite3")
+        key = ("갑자", "병인", "무진", 2026, BUSINESS_OWNER_PRESET_V2["name"])
+        cache = SelectionCache(maxsize=8, path=path)
+        for _ in range(2):
+            cards, ft = cache.get_or_compute("preset", key, store, compute)
+            assert [c.to_dict() for c in cards] == expected and ft == tags
+        assert len(calls) == 1 and cache.stats["hits"] == 1
+
+        # 새 프로세스 가정: 디스크에서 복원
+        cold = SelectionCache(maxsize=8, path=path)
+        cards, _ = cold.get_or_compute("preset", key, store, compute)
+        assert [c.to_dict() for c in cards] == expected
+        assert len(calls) == 1 and cold.stats["disk_hits"] == 1
+        cache.close()
+        cold.close()
+
+    def test_logic_version_in_key(self, store, tmp_path, monkeypatch):
+        from app.services import selection_cache as sc
+
+        path = str(tmp_path / "selection.sqlite3")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return store.cards[:3], ["갑목"]
+
+        key = ("갑자", "병인", "무진", 2026, sc.preset_digest(BUSINESS_OWNER_PRESET_V2))
+        sc.SelectionCache(maxsize=8, path=path).get_or_compute("preset", key, store, compute)
+        # 로직 버전이 바뀐 배포: 디스크에 남은 이전 결과를 쓰지 않음
+        monkeypatch.setattr(sc, "SELECTION_VERSION", sc.SELECTION_VERSION + 1)
+        sc.SelectionCache(maxsize=8, path=path).get_or_compute("preset", key, store, compute)
+        assert len(calls) == 2
+
+        changed = {**BUSINESS_OWNER_PRESET_V2, "sections": BUSINESS_OWNER_PRESET_V2["sections"][:-1]}
+        assert sc.preset_digest(changed) != key[-1]
+
+
+class TestFeatureTagTable:
+    """FeatureTags 테이블 조회 = 원본 계산"""
+
+    def test_mask_codec_and_pillar_index(self):
+        from app.services.feature_tag_table import decode_mask, encode_mask, pillar_index, pillar_of
+
+        assert [pillar_index(pillar_of(i)) for i in range(60)] == list(range(60))
+        assert pillar_index("갑자") == pillar_index("甲子") == 0
+        assert pillar_index("갑축") is None and pillar_index("") is None
+        tags = build_feature_tags_no_time_from_pillars("무오", "정사", "무인")["tags"]
+        vocab = sorted(set(tags) | {"가", "힣"})
+        assert decode_mask(encode_mask(tags, {t: i for i, t in enumerate(vocab)}), vocab) == tags
+
+    def test_table_matches_function(self):
+        import random
+        from app.services.feature_tag_table import DEFAULT_TABLE_PATH, FeatureTagTable, pillar_of, source_digest
+
+        # 테이블은 저장소에 포함 → 없거나 stale 이면 실패 (tools/build_feature_tag_table.py 로 다시 생성)
+        assert DEFAULT_TABLE_PATH.exists(), "FeatureTags 테이블 없음"
+        table = FeatureTagTable(DEFAULT_TABLE_PATH)
+        assert table.digest == source_digest(), "FeatureTags 테이블 stale (feature_tags_no_time.py 변경)"
+        rng = random.Random(7)
+        for _ in range(300):
+            y, m, d = (pillar_of(rng.randrange(60)) for _ in range(3))
+            year = rng.choice([2026, 2025])
+            assert table.lookup(y, m, d, year) == build_feature_tags_no_time_from_pillars(y, m, d, year)["tags"]
+        table.close()
+
+
+@pytest.fixture(scope="module")
+def sqlite_db(store, tmp_path_factory):
+    """tools/build_sajuos_sqlite.py 로 만든 DB (rule_cards 는 id PRIMARY KEY → 비교용 JSONL 도 id 중복 제거)"""
+    import importlib.util
+
+    tmp = tmp_path_factory.mktemp("rulecards_sqlite")
+    jsonl = tmp / "cards.jsonl"
+    seen = set()
+    with open(store.path, encoding="utf-8") as src, open(jsonl, "w", encoding="utf-8") as out:
+        for line in src:
+            obj = json.loads(line)
+            if obj.get("id") and obj["id"] not in seen:
+                seen.add(obj["id"])
+                out.write(line)
+
+    spec = importlib.util.spec_from_file_location(
+        "build_sajuos_sqlite", Path(__file__).parent.parent / "tools" / "build_sajuos_sqlite.py")
+    tool = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tool)
+    db = tmp / "cards.db"
+    con = tool.connect(db)
+    tool.create_tables(con)
+    tool.load_jsonl_to_sqlite(con, jsonl)
+    tool.create_tag_tables(con)
+    tool.rebuild_card_tags(con)
+    con.close()
+    return jsonl, db
+
+
+class TestSqliteStore:
+    """SQLite 본문 지연 조회 저장소: 랭킹/본문 = JSONL 저장소"""
+
+    def test_selection_and_bodies_match(self, sqlite_db):
+        from app.services.rulecards_sqlite import SqliteRuleCardStore, open_rulestore
+
+        jsonl, db = sqlite_db
+        mem = open_rulestore(str(jsonl))
+        lazy = open_rulestore(str(db))
+        assert isinstance(lazy, SqliteRuleCardStore) and lazy.loaded_from == "sqlite"
+        assert [c.id for c in lazy.cards] == [c.id for c in mem.cards]
+        assert all(c.mechanism is None for c in lazy.cards)
+        assert lazy.trigger_postings == mem.trigger_postings
+
+        tags = build_feature_tags_no_time_from_pillars("무오", "정사", "무인")["tags"]
+        preset = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags)
+        a = [c for sec in select_cards_for_preset(mem, preset, tags)["sections"] for c in sec["cards"]]
+        b = [c for sec in select_cards_for_preset(lazy, preset, tags)["sections"] for c in sec["cards"]]
+        assert a and [c["id"] for c in a] == [c["id"] for c in b]
+        for x, y in zip(a, b):
+            assert set(x) == set(y)
+            assert (x["mechanism"] or "", x["action"] or "") == (y["mechanism"], y["action"])
+        lazy.close()
+
+    def test_quota_selector_uses_tag_index(self, sqlite_db):
+        import sqlite3
+        sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+        from quota_selector import quota_selector
+
+        _jsonl, db = sqlite_db
+        query = ["무토", "병화", "오화", "정제", "x' OR 1=1 --"]
+        cards = quota_selector({}, query, k=30, db_path=str(db))
+        assert len(cards) == 30
+        wanted = {canon_tag(t) for t in query}
+        matched = [c for c in cards if c["tag_hits"]]
+        assert matched
+        for c in matched:
+            assert c["tag_hits"] == len(wanted & {canon_tag(t) for t in c["tags"]})
+        keys = [(-c["tag_hits"], -c["priority"]) for c in matched]
+        assert keys == sorted(keys)
+        assert len({c["id"] for c in cards}) == len(cards)
+
+        con = sqlite3.connect(str(db))
+        plan = " ".join(r[-1] for r in con.execute(
+            "EXPLAIN QUERY PLAN SELECT ct.card_id, COUNT(*) FROM tags t "
+            "JOIN card_tags ct ON ct.tag_id = t.tag_id WHERE t.tag IN (?, ?) GROUP BY ct.card_id",
+            ("무토", "병화")))
+        con.close()
+        assert "SCAN" not in plan
+
+    def test_swapped_store_releases_pool(self, sqlite_db):
+        import asyncio
+        import gc
+        from app.services.rulestore_manager import RuleStoreManager
+
+        _jsonl, db = sqlite_db
+        manager = RuleStoreManager()
+        old = manager.load(str(db))
+        old.card_dicts(old.cards[:5])
+        pool = old.pool
+        assert pool._created == 1
+
+        asyncio.run(manager.reload(force=True))
+        assert manager.store is not old and pool._created == 1  # 사용 중인 요청은 이전 스토어 그대로
+        del old
+        gc.collect()
+        assert pool._created == 0 and pool._idle.empty()
+
+        current = manager.store.pool
+        manager.store.card_dicts(manager.store.cards[:1])
+        manager.close()
+        assert current._created == 0
+
+
+class TestTriggerIndex:
+    """trigger 하드 조건 역색인: 전수 대조와 같은 카드, 선택에서는 태그 겹침보다 먼저"""
+
+    def test_matches_equal_linear_scan(self, store):
+        import random
+        from app.services.rulecard_triggers import chart_trigger_features, hard_conditions
+        assert hard_conditions({"day_master": "병화", "month": "인월"}) == {("day_master", "丙"), ("month_branch", "寅")}
+        assert hard_conditions({"day_pillar": "기묘일주", "note": "x"}) == {("day_pillar", "己卯")}
+        assert hard_conditions({"month": "4월"}) is None and hard_conditions({"element": "비견"}) is None
+
+        conds = [hard_conditions(c.trigger) for c in store.cards]
+        assert any(conds)
+        rng = random.Random(0)
+        stems, branches = "갑을병정무기경신임계", "자축인묘진사오미신유술해"
+        for _ in range(100):
+            i, j = rng.randrange(60), rng.randrange(60)
+            month_p, day_p = stems[i % 10] + branches[i % 12], stems[j % 10] + branches[j % 12]
+            features = chart_trigger_features(month_p, day_p)
+            expected = [cid for cid, cs in enumerate(conds) if cs and cs <= set(features.items())]
+            assert store.trigger_matches(features) == expected
+
+    def test_trigger_stage_first(self, store):
+        from app.services.rulecard_triggers import chart_trigger_features
+        month_p, day_p = next(
+            (m, d) for m in ("정사", "병인", "갑자") for d in ("무인", "병자", "신축", "임신", "을묘")
+            if store.trigger_matches(chart_trigger_features(m, d))
+        )
+        features = chart_trigger_features(month_p, day_p)
+        hits = {id(store.cards[cid]) for cid in store.trigger_matches(features)}
+        tags = build_feature_tags_no_time_from_pillars("무오", month_p, day_p)["tags"]
+        preset = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags)
+        sel = select_cards_for_preset(store, preset, tags, as_cards=True, trigger_features=features)
+        assert sum(sec["meta"]["byStage"]["s0"] for sec in sel["sections"]) > 0
+        for sec in sel["sections"]:
+            assert sum(id(c) in hits for c in sec["cards"]) == sec["meta"]["byStage"]["s0"]
+
+        # trigger 특징이 없으면 기존 선택 그대로
+        plain = select_cards_for_preset(store, preset, tags)
+        assert [[c["id"] for c in sec["cards"]] for sec in plain["sections"]] == brute_force_select(store, preset, tags)
+
+
+class TestBuildPipeline:
+    """tools/build_rulecards.py: 바뀐 원본 파일만 다시 정규화, 결과 같으면 산출물 유지"""
+
+    def test_incremental_rebuild(self, tmp_path):
+        import shutil
+        sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+        from build_rulecards import build
+        from app.services.rulecards_sqlite import open_rulestore
+
+        src = tmp_path / "SajuOS_RuleCards_JSON"
+        for folder in sorted(CARDS_DIR.iterdir())[:2]:
+            (src / folder.name).mkdir(parents=True)
+            for p in sorted(folder.glob("*.json"))[:3]:
+                shutil.copy(p, src / folder.name / p.name)
+        out = tmp_path / "out"
+
+        first = build(str(src), str(out), workers=2, force=False, sqlite=True, snapshot=True)
+        assert first["normalized"] == first["files"] == 6
+        assert first["jsonl_changed"] and first["sqlite_built"] and first["snapshot_built"]
+
+        again = build(str(src), str(out), workers=2, force=False, sqlite=True, snapshot=True)
+        assert (again["reused"], again["normalized"]) == (6, 0)
+        assert not (again["jsonl_changed"] or again["sqlite_built"] or again["snapshot_built"])
+        assert again["jsonl_sha256"] == first["jsonl_sha256"]
+
+        edited = sorted(src.rglob("*.json"))[0]
+        data = json.loads(edited.read_text(encoding="utf-8"))
+        data["rulecards"][0]["action"] = "수정된 행동 지침"
+        edited.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        third = build(str(src), str(out), workers=2, force=False, sqlite=True, snapshot=True)
+        assert (third["reused"], third["normalized"]) == (5, 1)
+        assert third["jsonl_changed"] and third["sqlite_built"] and third["snapshot_built"]
+
+        mem = open_rulestore(str(out / "sajuos_master_db.jsonl"))
+        lazy = open_rulestore(str(out / "sajuos_master.db"))
+        assert mem.loaded_from == "snapshot"
+        assert [c.id for c in lazy.cards] == [c.id for c in mem.cards]
+        assert len(mem.cards) == third["cards"]
+        assert "수정된 행동 지침" in [d["action"] for d in lazy.card_dicts(lazy.cards)]
+        lazy.close()
@@ -0,0 +1,91 @@
+# build_calendar_table.py
+# 만세력 테이블 생성 (1900~2100): 일자별 00:00 KST 태양 황경 + 년/월/일주 60갑자 인덱스
+# 절입 인덱스 생성 (1899 입춘~2101 입춘): 12입절 시각 epoch minutes (UTC)
+# 사용: python tools/build_calendar_table.py [--out data/calendar_1900_2100.bin]
+#                                           [--terms-out data/solar_terms_1899_2101.bin]
+import argparse
+import os
+import sys
+from array import array
+from datetime import date, datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.calendar_table import (  # noqa: E402
+    TABLE_MAGIC, HEADER, RECORD, FIRST_YEAR, LAST_YEAR,
+    DEFAULT_TABLE_PATH, pillars_from_longitude,
+)
+from app.services.solar_terms import (  # noqa: E402
+    TERMS_MAGIC, TERMS_HEADER, TERMS_FIRST_YEAR, TERMS_LAST_YEAR,
+    DEFAULT_TERMS_PATH, EPOCH,
+)
+from app.services.engine_v2 import ephem_solar_longitude  # noqa: E402
+
+TROPICAL_YEAR_DAYS = 365.2422
+
+
+def _write_atomic(out_path: str, buf: bytes):
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+    os.replace(tmp_path, out_path)
+
+
+def build_table(out_path: str, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR):
+    start = date(first_year, 1, 1)
+    days = (date(last_year + 1, 1, 1) - start).days
+
+    buf = bytearray(HEADER.pack(TABLE_MAGIC, first_year, last_year, days))
+
+    # 마지막 날 보간용으로 days + 1개 레코드
+    for i in range(days + 1):
+        d = start + timedelta(days=i)
+        dt_utc = datetime(d.year, d.month, d.day) - timedelta(hours=9)
+        lon = ephem_solar_longitude(dt_utc)
+        year_idx, month_idx, day_idx = pillars_from_longitude(d.year, d.month, d.day, lon)
+        buf += RECORD.pack(lon, year_idx, month_idx, day_idx)
+
+    _write_atomic(out_path, buf)
+
+    print(f"✅ 만세력 테이블 생성: {out_path} ({first_year}~{last_year}, {days}일, {len(buf):,} bytes)")
+
+
+def find_term_utc(target_lon: float, guess_utc: datetime) -> datetime:
+    """태양 황경이 target_lon 이 되는 UTC 시각 (Newton 반복)"""
+    t = guess_utc
+    for _ in range(10):
+        diff = (target_lon - ephem_solar_longitude(t) + 180) % 360 - 180
+        t += timedelta(days=diff * TROPICAL_YEAR_DAYS / 360)
+        if abs(diff) < 1e-7:
+            break
+    return t
+
+
+def build_solar_terms(out_path: str, first_year: int = TERMS_FIRST_YEAR, last_year: int = TERMS_LAST_YEAR):
+    # first_year 입춘 ~ last_year 입춘 (마지막 입춘은 직전 구간 경계 판정용)
+    minutes = array("i")
+    for n in range((last_year - first_year) * 12 + 1):
+        year, k = first_year + n // 12, n % 12
+        target = (315 + 30 * k) % 360
+        guess = datetime(year, 2, 4) + timedelta(days=k * TROPICAL_YEAR_DAYS / 12)
+        t = find_term_utc(target, guess)
+        minutes.append(round((t - EPOCH).total_seconds() / 60))
+
+    assert all(a < b for a, b in zip(minutes, minutes[1:])), "절입 시각 정렬 오류"
+
+    buf = TERMS_HEADER.pack(TERMS_MAGIC, first_year, len(minutes)) + minutes.tobytes()
+    _write_atomic(out_path, buf)
+
+    print(f"✅ 절입 인덱스 생성: {out_path} ({first_year}~{last_year} 입춘, {len(minutes)}개)")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(DEFAULT_TABLE_PATH))
+    ap.add_argument("--first-year", type=int, default=FIRST_YEAR)
+    ap.add_argument("--last-year", type=int, default=LAST_YEAR)
+    ap.add_argument("--terms-out", default=str(DEFAULT_TERMS_PATH))
+    args = ap.parse_args()
+    build_table(args.out, args.first_year, args.last_year)
+    build_solar_terms(args.terms_out)
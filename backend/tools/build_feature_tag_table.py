@@ -0,0 +1,98 @@
+# build_feature_tag_table.py
+# FeatureTags 사전 계산 테이블 생성: 년/월/일주 60³ × (오버레이 연도 + 기타 연도) → 태그 비트마스크
+# 원본 계산(build_feature_tags_no_time_from_pillars)을 전부 돌려 저장, --verify 로 무작위 대조
+# 사용: python tools/build_feature_tag_table.py [--out data/feature_tags_no_time.bin]
+#                                              [--overlay-years 2026] [--workers 4] [--verify 2000]
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.feature_tags_no_time import build_feature_tags_no_time_from_pillars  # noqa: E402
+from app.services.feature_tag_table import (  # noqa: E402
+    DEFAULT_OVERLAY_YEARS, DEFAULT_TABLE_PATH, N_PILLARS, NO_OVERLAY_YEAR,
+    FeatureTagTable, decode_mask, encode_mask, pillar_of, source_digest, write_table,
+)
+
+
+def _tags_for_year_pillar(args: Tuple[int, Sequence[int]]) -> List[Tuple[str, ...]]:
+    """년주 1개 → 월주 × 일주 × 슬롯 순서의 태그 목록 (워커 프로세스)"""
+    y, years = args
+    yp = pillar_of(y)
+    out = []
+    for m in range(N_PILLARS):
+        mp = pillar_of(m)
+        for d in range(N_PILLARS):
+            dp = pillar_of(d)
+            for overlay_year in years:
+                out.append(tuple(build_feature_tags_no_time_from_pillars(yp, mp, dp, overlay_year)["tags"]))
+    return out
+
+
+def build_table(out_path: str, overlay_years: Sequence[int], workers: int) -> None:
+    assert NO_OVERLAY_YEAR not in overlay_years, "기타 연도 슬롯과 겹치는 오버레이 연도"
+    t0 = time.perf_counter()
+    slot_years = list(overlay_years) + [NO_OVERLAY_YEAR]
+
+    # 어휘는 처음 나온 순서로 비트 배정 → 마지막에 정렬 순서로 재배치
+    seen: Dict[str, int] = {}
+    masks: List[int] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rows in pool.map(_tags_for_year_pillar, [(y, slot_years) for y in range(N_PILLARS)]):
+            for tags in rows:
+                for t in tags:
+                    seen.setdefault(t, len(seen))
+                masks.append(encode_mask(tags, seen))
+
+    vocab = sorted(seen)
+    order = [vocab.index(t) for t in sorted(seen, key=seen.__getitem__)]
+    remapped = []
+    for mask in masks:
+        out = 0
+        while mask:
+            low = mask & -mask
+            out |= 1 << order[low.bit_length() - 1]
+            mask ^= low
+        remapped.append(out)
+
+    size = write_table(out_path, vocab, overlay_years, remapped, source_digest())
+    print(
+        f"✅ FeatureTags 테이블 생성: {out_path} "
+        f"(60³ × {len(slot_years)}슬롯, 태그 {len(vocab)}개, 서로 다른 집합 {len(set(remapped)):,}, {size:,} bytes)\n"
+        f"   {time.perf_counter() - t0:.1f}s"
+    )
+
+
+def verify_table(path: str, samples: int, seed: int = 0) -> None:
+    """무작위 기둥 조합 × 연도: 테이블 조회 = 원본 계산"""
+    table = FeatureTagTable(path)
+    assert table.digest == source_digest(), "원본 계산 모듈과 테이블 불일치 (stale)"
+    rng = random.Random(seed)
+    years = list(table.overlay_years) + [NO_OVERLAY_YEAR, 2025, 2030]
+    for _ in range(samples):
+        y, m, d = (rng.randrange(N_PILLARS) for _ in range(3))
+        overlay_year = rng.choice(years)
+        yp, mp, dp = pillar_of(y), pillar_of(m), pillar_of(d)
+        expected = build_feature_tags_no_time_from_pillars(yp, mp, dp, overlay_year)["tags"]
+        got = decode_mask(table.mask_at(y, m, d, overlay_year), table.vocab)
+        assert got == expected, f"불일치: {yp} {mp} {dp} {overlay_year}: {got} != {expected}"
+    table.close()
+    print(f"✅ 검증 {samples}건 일치")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(DEFAULT_TABLE_PATH))
+    ap.add_argument("--overlay-years", type=int, nargs="*", default=list(DEFAULT_OVERLAY_YEARS))
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--verify", type=int, default=2000, help="무작위 대조 건수 (0 = 생략)")
+    args = ap.parse_args()
+    build_table(args.out, args.overlay_years, args.workers)
+    if args.verify:
+        verify_table(args.out, args.verify)
@@ -0,0 +1,252 @@
+# build_rulecards.py
+# 룰카드 빌드 파이프라인: data/SajuOS_RuleCards_JSON → JSONL + SQLite DB + 바이너리 스냅샷 (한 번에)
+# - 원본 파일 sha256 매니페스트 → 바뀐 파일만 다시 정규화 (프로세스 풀)
+# - 정규화는 generate_jsonl.normalize_card / stable_id 그대로, id 중복은 파일 순서상 먼저 나온 카드만
+# - 결과 JSONL 이 이전과 같으면 SQLite / 스냅샷도 그대로 둠 (--force 로 전부 다시)
+# 사용: python tools/build_rulecards.py [--src data/SajuOS_RuleCards_JSON] [--out-dir data]
+#                                      [--workers 4] [--force] [--no-sqlite] [--no-snapshot]
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.rulecards_store import RuleCardStore  # noqa: E402
+from app.services.rulecards_snapshot import (  # noqa: E402
+    open_snapshot, snapshot_path_for, source_hash, write_snapshot,
+)
+from generate_jsonl import iter_rulecards, normalize_card  # noqa: E402
+import build_sajuos_sqlite  # noqa: E402
+
+DEFAULT_SRC_DIR = os.path.join(BACKEND_DIR, "data", "SajuOS_RuleCards_JSON")
+DEFAULT_OUT_DIR = os.path.join(BACKEND_DIR, "data")
+JSONL_NAME = "sajuos_master_db.jsonl"
+SQLITE_NAME = "sajuos_master.db"
+MANIFEST_NAME = "rulecards_manifest.json"
+
+# 정규화 규칙(generate_jsonl) 또는 매니페스트 구조가 바뀌면 올림 → 전체 재정규화
+MANIFEST_VERSION = 1
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def normalize_file(args: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    원본 JSON 파일 1개 → 정규화 카드 목록 (워커 프로세스)
+
+    Returns:
+        {"sha256", "cards", "bad"} (파싱 실패면 cards=[], bad=1)
+    """
+    path, rel_path = args
+    p = Path(path)
+    raw = p.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except Exception:
+        return {"sha256": digest, "cards": [], "bad": 1}
+
+    source_title = ""
+    if isinstance(data, dict):
+        source_title = str(data.get("title") or data.get("name") or "").strip()
+    if not source_title:
+        source_title = p.stem
+
+    cards, bad = [], 0
+    for card in iter_rulecards(data):
+        if not isinstance(card, dict):
+            bad += 1
+            continue
+        cards.append(normalize_card(card=card, source_file=p.name, source_path=rel_path, source_title=source_title))
+    return {"sha256": digest, "cards": cards, "bad": bad}
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def collect_cards(src_dir: Path, manifest: Dict[str, Any], workers: int, force: bool) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    원본 디렉터리 → 파일별 정규화 결과 (바뀐 파일만 프로세스 풀로)
+
+    파일 판정: 크기·mtime 같으면 이전 결과, 다르면 sha256 비교 후 내용이 바뀐 파일만 정규화
+    """
+    old_files: Dict[str, Any] = {} if force else manifest.get("files", {})
+    files: Dict[str, Any] = {}
+    todo: List[Tuple[str, str]] = []
+    stats = {"files": 0, "reused": 0, "normalized": 0}
+
+    for p in sorted(src_dir.rglob("*.json")):
+        rel = p.relative_to(src_dir.parent).as_posix()
+        st = p.stat()
+        stats["files"] += 1
+        prev = old_files.get(rel)
+        if prev and (prev["size"], prev["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+            files[rel] = prev
+        elif prev and prev["sha256"] == _sha256(p):
+            files[rel] = {**prev, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        else:
+            files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            todo.append((str(p), rel))
+            continue
+        stats["reused"] += 1
+
+    if todo:
+        if workers > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(normalize_file, todo, chunksize=8))
+        else:
+            results = [normalize_file(t) for t in todo]
+        for (_path, rel), result in zip(todo, results):
+            files[rel].update(result)
+        stats["normalized"] = len(todo)
+
+    return files, stats
+
+
+def merge_cards(files: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """파일 순서(경로 정렬)대로 합치고 id 중복은 먼저 나온 카드만"""
+    seen_ids = set()
+    cards: List[Dict[str, Any]] = []
+    stats = {"found": 0, "dup": 0, "bad": 0}
+    for rel in sorted(files):
+        entry = files[rel]
+        stats["bad"] += entry.get("bad", 0)
+        for card in entry["cards"]:
+            stats["found"] += 1
+            if card["id"] in seen_ids:
+                stats["dup"] += 1
+                continue
+            seen_ids.add(card["id"])
+            cards.append(card)
+    return cards, stats
+
+
+def build_sqlite(jsonl_path: Path, db_path: Path, jsonl_sha: str) -> None:
+    """
+    JSONL → SQLite (임시 파일에 만든 뒤 교체, 열려 있는 읽기 커넥션은 이전 파일 유지)
+    build_meta.jsonl_sha256 = 원본 JSONL sha256 (다음 빌드의 변경 판정용)
+    """
+    tmp = db_path.with_name(db_path.name + ".tmp")
+    for suffix in ("", "-wal", "-shm"):
+        Path(str(tmp) + suffix).unlink(missing_ok=True)
+    con = build_sajuos_sqlite.connect(tmp)
+    build_sajuos_sqlite.create_tables(con)
+    build_sajuos_sqlite.load_jsonl_to_sqlite(con, jsonl_path)
+    build_sajuos_sqlite.create_tag_tables(con)
+    build_sajuos_sqlite.rebuild_card_tags(con)
+    if build_sajuos_sqlite.try_create_fts(con):
+        build_sajuos_sqlite.upsert_fts(con)
+    con.execute("CREATE TABLE IF NOT EXISTS build_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    con.execute("INSERT OR REPLACE INTO build_meta (key, value) VALUES ('jsonl_sha256', ?)", (jsonl_sha,))
+    con.commit()
+    # WAL 정리 후 단일 파일로 교체
+    con.execute("PRAGMA journal_mode=DELETE;")
+    con.close()
+    os.replace(tmp, db_path)
+
+
+def sqlite_source(db_path: Path) -> Optional[str]:
+    """DB 를 만든 JSONL sha256 (build_meta), 없으면 None"""
+    if not db_path.exists():
+        return None
+    try:
+        con = sqlite3.connect(f"file:{quote(str(db_path.resolve()))}?mode=ro", uri=True)
+        try:
+            row = con.execute("SELECT value FROM build_meta WHERE key = 'jsonl_sha256'").fetchone()
+        finally:
+            con.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def build(src_dir: str, out_dir: str, workers: int, force: bool, sqlite: bool, snapshot: bool) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    src, out = Path(src_dir), Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    jsonl_path, db_path, manifest_path = out / JSONL_NAME, out / SQLITE_NAME, out / MANIFEST_NAME
+
+    manifest = load_manifest(manifest_path)
+    files, file_stats = collect_cards(src, manifest, workers, force)
+    cards, card_stats = merge_cards(files)
+    t1 = time.perf_counter()
+
+    # 1) JSONL (내용이 같으면 파일 유지 → mtime/sha 그대로, 핫 리로드도 일어나지 않음)
+    data = "".join(json.dumps(c, ensure_ascii=False) + "\n" for c in cards).encode("utf-8")
+    jsonl_sha = hashlib.sha256(data).hexdigest()
+    jsonl_changed = force or not jsonl_path.exists() or _sha256(jsonl_path) != jsonl_sha
+    if jsonl_changed:
+        _write_atomic(jsonl_path, data)
+
+    # 2) SQLite
+    sqlite_built = False
+    if sqlite and (jsonl_changed or sqlite_source(db_path) != jsonl_sha):
+        build_sqlite(jsonl_path, db_path, jsonl_sha)
+        sqlite_built = True
+
+    # 3) 스냅샷
+    snapshot_built = False
+    snap_path = snapshot_path_for(str(jsonl_path))
+    digest = bytes.fromhex(jsonl_sha)
+    if snapshot:
+        snap = None if force else open_snapshot(snap_path, digest)
+        if snap is None:
+            store = RuleCardStore(str(jsonl_path))
+            store.load(use_snapshot=False)
+            write_snapshot(store, snap_path, source_hash(str(jsonl_path)))
+            snapshot_built = True
+        else:
+            snap.close()
+
+    _write_atomic(manifest_path, json.dumps(
+        {"version": MANIFEST_VERSION, "jsonl_sha256": jsonl_sha, "files": files},
+        ensure_ascii=False,
+    ).encode("utf-8"))
+
+    print(
+        f"✅ 룰카드 빌드: 파일 {file_stats['files']}개 (재사용 {file_stats['reused']}, 정규화 {file_stats['normalized']})\n"
+        f"   카드 {card_stats['found']}개 → {len(cards)}개 (중복 {card_stats['dup']}, 파손 {card_stats['bad']}) "
+        f"| 수집 {t1 - t0:.2f}s\n"
+        f"   JSONL {'갱신' if jsonl_changed else '변경 없음'}: {jsonl_path}\n"
+        f"   SQLite {'갱신' if sqlite_built else ('변경 없음' if sqlite else '생략')}: {db_path}\n"
+        f"   스냅샷 {'갱신' if snapshot_built else ('변경 없음' if snapshot else '생략')}: {snap_path}\n"
+        f"   총 {time.perf_counter() - t0:.2f}s"
+    )
+    return {
+        **file_stats, **card_stats, "cards": len(cards), "jsonl_sha256": jsonl_sha,
+        "jsonl_changed": jsonl_changed, "sqlite_built": sqlite_built, "snapshot_built": snapshot_built,
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--src", default=DEFAULT_SRC_DIR)
+    ap.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--force", action="store_true", help="매니페스트 무시, 전부 다시 생성")
+    ap.add_argument("--no-sqlite", action="store_true")
+    ap.add_argument("--no-snapshot", action="store_true")
+    args = ap.parse_args()
+    build(args.src, args.out_dir, args.workers, args.force, not args.no_sqlite, not args.no_snapshot)
@@ -0,0 +1,51 @@
+# build_rulecards_snapshot.py
+# 룰카드 바이너리 스냅샷 생성: JSONL → .rcsnap (문자열 테이블 + 컬럼 배열 + 토큰/idf/역색인)
+# RuleCardStore.load 가 원본 JSONL sha256 이 같을 때만 사용 (다르면 JSONL 로드)
+# 사용: python tools/build_rulecards_snapshot.py [--jsonl data/sajuos_master_db.jsonl] [--out ...]
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.rulecards_store import RuleCardStore  # noqa: E402
+from app.services.rulecards_snapshot import (  # noqa: E402
+    open_snapshot, snapshot_path_for, source_hash, write_snapshot,
+)
+
+DEFAULT_JSONL_PATH = os.path.join(BACKEND_DIR, "data", "sajuos_master_db.jsonl")
+
+
+def build_snapshot(jsonl_path: str, out_path: str) -> None:
+    t0 = time.perf_counter()
+    store = RuleCardStore(jsonl_path)
+    store.load(use_snapshot=False)
+    digest = source_hash(jsonl_path)
+    size = write_snapshot(store, out_path, digest)
+    t1 = time.perf_counter()
+
+    # 검증: 방금 쓴 파일(out_path)을 다시 로드 (--out 이 기본 위치가 아니어도)
+    snap = open_snapshot(out_path, digest)
+    assert snap is not None, "스냅샷 열기 실패"
+    check = RuleCardStore(jsonl_path)
+    try:
+        check._load_snapshot(snap)
+    finally:
+        snap.close()
+    t2 = time.perf_counter()
+    assert len(check.cards) == len(store.cards), "카드 수 불일치"
+
+    print(
+        f"✅ 룰카드 스냅샷 생성: {out_path} ({len(store.cards)}장, {len(store.vocab)}토큰, {size:,} bytes)\n"
+        f"   빌드 {t1 - t0:.2f}s | 스냅샷 로드 {(t2 - t1) * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jsonl", default=DEFAULT_JSONL_PATH)
+    ap.add_argument("--out", default=None, help="기본: JSONL 과 같은 위치의 .rcsnap")
+    args = ap.parse_args()
+    build_snapshot(args.jsonl, args.out or snapshot_path_for(args.jsonl))
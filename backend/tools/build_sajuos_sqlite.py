@@ -1,9 +1,14 @@
 import os
+import sys
 import json
 import sqlite3
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.rulecards_store import canon_tag  # noqa: E402
 
 
 # =============================
@@ -65,6 +70,48 @@ def create_tables(con: sqlite3.Connection):
     con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_priority ON rule_cards(priority DESC);")
     con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_topic_priority ON rule_cards(topic, priority DESC);")
 
+def create_tag_tables(con: sqlite3.Connection):
+    """
+    태그 정규화 테이블
+    - tags: 태그 사전 (canon_tag 기준, 런타임 RuleCardStore 와 같은 표기)
+    - card_tags: (tag_id, card_id) 연결 → 태그 → 카드 / 카드 → 태그 모두 커버링 인덱스로 조회
+    """
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS tags (
+        tag_id INTEGER PRIMARY KEY,
+        tag TEXT NOT NULL UNIQUE
+    );
+    """)
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS card_tags (
+        tag_id INTEGER NOT NULL REFERENCES tags(tag_id),
+        card_id TEXT NOT NULL REFERENCES rule_cards(id),
+        PRIMARY KEY (tag_id, card_id)
+    ) WITHOUT ROWID;
+    """)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_card_tags_card ON card_tags(card_id, tag_id);")
+
+def rebuild_card_tags(con: sqlite3.Connection) -> Tuple[int, int]:
+    """rule_cards.tags_json → tags / card_tags 재생성 (태그 수, 연결 수)"""
+    con.execute("DELETE FROM card_tags;")
+    con.execute("DELETE FROM tags;")
+
+    tag_ids: Dict[str, int] = {}
+    links: List[Tuple[int, str]] = []
+    for card_id, tags_json in con.execute("SELECT id, tags_json FROM rule_cards;").fetchall():
+        try:
+            tags = json.loads(tags_json) if tags_json else []
+        except ValueError:
+            continue
+        for t in {canon_tag(x) for x in tags if str(x).strip()}:
+            links.append((tag_ids.setdefault(t, len(tag_ids) + 1), card_id))
+
+    con.executemany("INSERT INTO tags (tag_id, tag) VALUES (?, ?);", [(i, t) for t, i in tag_ids.items()])
+    con.executemany("INSERT INTO card_tags (tag_id, card_id) VALUES (?, ?);", links)
+    con.execute("ANALYZE;")
+    con.commit()
+    return len(tag_ids), len(links)
+
 def try_create_fts(con: sqlite3.Connection) -> bool:
     try:
         con.execute("""
@@ -401,6 +448,10 @@ def main():
     print("🚀 JSONL → SQLite 적재 시작")
     load_jsonl_to_sqlite(con, jsonl)
 
+    create_tag_tables(con)
+    n_tags, n_links = rebuild_card_tags(con)
+    print(f"✅ 태그 테이블: tags={n_tags}, card_tags={n_links}")
+
     fts_ok = try_create_fts(con)
     if fts_ok:
         print("✅ FTS5 생성 성공 → 전문검색 활성화")
@@ -0,0 +1,88 @@
+# prefetch_kasi.py
+# KASI 음양력/24절기 응답을 디스크 캐시(settings.kasi_cache_path)에 미리 채움
+# 이미 저장된 날짜는 건너뜀 → 중단 후 다시 실행해도 이어서 진행
+# 사용: python tools/prefetch_kasi.py --start-year 1940 --end-year 2010 [--concurrency 8] [--max-requests 9000]
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.config import get_settings  # noqa: E402
+from app.services.engine_v2 import SajuManager  # noqa: E402
+from app.services.kasi_http import kasi_http  # noqa: E402
+from app.services.kasi_disk_cache import kasi_disk_cache  # noqa: E402
+
+
+def pending_jobs(start_year: int, end_year: int, with_terms: bool):
+    """캐시에 없는 (종류, 년, 월, 일) 목록"""
+    cached_days = kasi_disk_cache.cached_lunar_dates(start_year, end_year)
+    jobs = []
+    d = date(start_year, 1, 1)
+    while d.year <= end_year:
+        if d.isoformat() not in cached_days:
+            jobs.append(("lunar", d.year, d.month, d.day))
+        d += timedelta(days=1)
+
+    if with_terms:
+        cached_months = kasi_disk_cache.cached_solar_term_months(start_year, end_year)
+        for y in range(start_year, end_year + 1):
+            for m in range(1, 13):
+                if (y, m) not in cached_months:
+                    jobs.append(("terms", y, m, None))
+    return jobs
+
+
+async def prefetch(start_year: int, end_year: int, concurrency: int, max_requests: int, with_terms: bool):
+    api_key = get_settings().kasi_api_key
+    if not api_key:
+        print("❌ KASI_API_KEY 미설정")
+        return
+
+    jobs = pending_jobs(start_year, end_year, with_terms)
+    if max_requests:
+        jobs = jobs[:max_requests]
+    print(f"📦 대상 {len(jobs)}건 ({start_year}~{end_year}, 동시 {concurrency})")
+    if not jobs:
+        return
+
+    await kasi_http.startup()
+    manager = SajuManager(kasi_api_key=api_key)
+    sem = asyncio.Semaphore(concurrency)
+    done = {"ok": 0, "fail": 0}
+    t0 = time.time()
+
+    async def run(job):
+        kind, y, m, d = job
+        async with sem:
+            if kind == "lunar":
+                result = await manager._fetch_kasi_lunar(y, m, d)
+            else:
+                result = await manager._fetch_kasi_solar_terms(y, m)
+        done["ok" if result else "fail"] += 1
+        n = done["ok"] + done["fail"]
+        if n % 500 == 0:
+            print(f"  ... {n}/{len(jobs)} (실패 {done['fail']}, {time.time() - t0:.0f}s)")
+
+    try:
+        await asyncio.gather(*(run(j) for j in jobs))
+    finally:
+        await kasi_http.aclose()
+
+    print(f"✅ 완료: 성공 {done['ok']} / 실패 {done['fail']} ({time.time() - t0:.1f}s)")
+    print(f"   캐시: {kasi_disk_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--start-year", type=int, required=True)
+    ap.add_argument("--end-year", type=int, required=True)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--max-requests", type=int, default=0, help="1회 실행 최대 호출 수 (일일 쿼터 대비, 0=무제한)")
+    ap.add_argument("--no-terms", action="store_true", help="24절기 조회 생략")
+    args = ap.parse_args()
+    asyncio.run(prefetch(args.start_year, args.end_year, args.concurrency, args.max_requests, not args.no_terms))
@@ -1,35 +1,75 @@
+import os
+import sys
 import sqlite3
 import json
 
-def quota_selector(features, tags, k=25, db_path="sajuos_master.db"):
-    """태그 기반 정밀 RuleCard 셀렉터"""
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.rulecards_store import canon_tag  # noqa: E402
+
+# 태그 매칭이 모자랄 때 채우는 기본 토픽
+FALLBACK_TOPICS = ('TIMING', 'RELATION', 'ELEMENTS', 'STRUCTURE')
+
+CARD_COLUMNS = "r.id, r.topic, r.priority, r.mechanism, r.interpretation, r.action, r.tags_json"
+
+
+def _placeholders(n):
+    return ",".join(["?"] * n)
+
+
+def quota_selector(features, tags, k=25, db_path="sajuos_master.db", fallback_topics=FALLBACK_TOPICS):
+    """
+    태그 기반 정밀 RuleCard 셀렉터
+
+    1. 태그 매칭 (80% 우선순위): tags 사전 → card_tags 인덱스 조회, 카드별 매칭 수 GROUP BY
+       정렬: 매칭 수 ↓, priority ↓, 태그 문자열 길이 ↑
+    2. 모자라면 fallback_topics 카드로 채움 (topic, priority 인덱스)
+    모든 값은 바인딩 파라미터 (문자열 조립 없음)
+    build_sajuos_sqlite.py 의 tags / card_tags 테이블 필요
+    """
+    query_tags = sorted({canon_tag(t) for t in tags if str(t).strip()})
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
-    
-    # 태그 매칭 쿼리 (80% 우선순위)
-    tag_conditions = " OR ".join([f"tags LIKE '%{t}%'" for t in tags])
-    
-    query = f"""
-    SELECT id, topic, priority, mechanism, interpretation, action, tags
-    FROM rule_cards 
-    WHERE ({tag_conditions})
-       OR topic IN ('TIMING', 'RELATION', 'ELEMENTS', 'STRUCTURE')
-    ORDER BY 
-        CASE WHEN ({tag_conditions}) THEN 1 ELSE 2 END,  -- 태그 완전 일치 우선
-        priority DESC,
-        LENGTH(tags) ASC  -- 태그 많은 카드 우선
-    LIMIT {k}
-    """
-    
-    cursor.execute(query)
+
+    rows = []
+    if query_tags:
+        cursor.execute(f"""
+        SELECT {CARD_COLUMNS}, m.hits
+        FROM (
+            SELECT ct.card_id, COUNT(*) AS hits
+            FROM tags t
+            JOIN card_tags ct ON ct.tag_id = t.tag_id
+            WHERE t.tag IN ({_placeholders(len(query_tags))})
+            GROUP BY ct.card_id
+        ) m
+        JOIN rule_cards r ON r.id = m.card_id
+        ORDER BY m.hits DESC, r.priority DESC, LENGTH(r.tags_json) ASC, r.id
+        LIMIT ?
+        """, [*query_tags, k])
+        rows = cursor.fetchall()
+
+    if len(rows) < k and fallback_topics:
+        picked = [row[0] for row in rows]
+        cursor.execute(f"""
+        SELECT {CARD_COLUMNS}, 0
+        FROM rule_cards r
+        WHERE r.topic IN ({_placeholders(len(fallback_topics))})
+          AND r.id NOT IN ({_placeholders(len(picked))})
+        ORDER BY r.priority DESC, LENGTH(r.tags_json) ASC, r.id
+        LIMIT ?
+        """, [*fallback_topics, *picked, k - len(rows)])
+        rows += cursor.fetchall()
+
     cards = []
-    for row in cursor.fetchall():
+    for row in rows:
         cards.append({
             "id": row[0], "topic": row[1], "priority": row[2],
             "mechanism": row[3], "interpretation": row[4],
-            "action": row[5], "tags": json.loads(row[6] or "[]")
+            "action": row[5], "tags": json.loads(row[6] or "[]"),
+            "tag_hits": row[7],
         })
-    
+
     conn.close()
     return cards
 
@@ -37,7 +77,7 @@ def quota_selector(features, tags, k=25, db_path="sajuos_master.db"):
 if __name__ == "__main__":
     features = {"day_master": "무토", "elements": {"화":5}}
     tags = ["무토", "병오", "화강", "2026"]
-    
+
     matched = quota_selector(features, tags, k=10)
     print(f"✅ {len(matched)}개 카드 매칭 완료")
     for card in matched[:3]: